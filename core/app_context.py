@@ -8,6 +8,7 @@
 
 import os
 import time
+import asyncio
 import logging
 import threading
 import json
@@ -271,6 +272,18 @@ class AppContext:
             log_exception(self.logger, "Ошибка запроса проверки всех сайтов")
             return False
     
+    async def acheck_all_sites(self):
+        """
+        Асинхронный запрос на немедленную проверку всех сайтов.
+        Постановка сайтов в очередь выполняется в пуле потоков, чтобы
+        не блокировать цикл событий.
+        
+        Returns:
+            bool: Результат выполнения запроса
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.check_all_sites_now)
+    
     def get_status(self):
         """
         Получение текущего статуса приложения
@@ -17,6 +17,13 @@ from typing import Dict, List, Any, Optional, Union, Tuple
 from utils.logger import get_module_logger, log_exception
 
 
+# Поля пользователя, отображаемые в профиле (хеш пароля в интерфейс не передается)
+_PROFILE_USER_FIELDS = ('id', 'username', 'email', 'full_name', 'last_login')
+
+# Поля роли (таблица roles)
+_ROLE_FIELDS = ('id', 'name', 'description', 'created_at')
+
+
 class Hasher:
     """Класс для хеширования и проверки паролей"""
     
@@ -114,6 +121,10 @@ class AuthManager:
             # Текущий пользователь
             self.current_user = None
             
+            # Номер сеанса: увеличивается при каждом входе и выходе,
+            # по нему виджеты определяют устаревание своих кэшей
+            self.session_version = 0
+            
             # Кэш разрешений пользователей
             self._user_permissions_cache = {}
             
@@ -158,6 +169,7 @@ class AuthManager:
             
             # Устанавливаем текущего пользователя
             self.current_user = user
+            self.session_version += 1
             
             # Очищаем кэш разрешений для текущего пользователя
             if user['id'] in self._user_permissions_cache:
@@ -176,6 +188,7 @@ class AuthManager:
         if self.current_user:
             self.logger.info(f"Выход пользователя: {self.current_user['username']}")
             self.current_user = None
+            self.session_version += 1
     
     def get_current_user(self) -> Optional[Dict[str, Any]]:
         """
@@ -231,6 +244,58 @@ class AuthManager:
             log_exception(self.logger, f"Ошибка получения роли пользователя")
             return None
     
+    def get_current_user_with_role(
+        self, 
+        app_context
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        Получение текущего пользователя вместе с его ролью одним запросом
+        
+        Args:
+            app_context: Контекст приложения
+            
+        Returns:
+            Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+                (Информация о пользователе, Информация о роли) или (None, None)
+        """
+        if not self.current_user:
+            return None, None
+        
+        # Запасной результат: из сохраненного пользователя берутся только поля профиля
+        fallback = {key: self.current_user.get(key) for key in _PROFILE_USER_FIELDS}
+        
+        user_id = self.current_user['id']
+        try:
+            # Поля роли получают префикс role__, чтобы не пересекаться с полями пользователя
+            columns = ", ".join(
+                [f"u.{key}" for key in _PROFILE_USER_FIELDS]
+                + [f"r.{key} AS role__{key}" for key in _ROLE_FIELDS]
+            )
+            query = f"""
+            SELECT {columns}
+            FROM users u
+            LEFT JOIN roles r ON r.id = u.role_id
+            WHERE u.id = ?
+            """
+            user_data = app_context.db_manager.execute_query(query, (user_id,))
+            
+            if not user_data:
+                return fallback, None
+            
+            row = user_data[0]
+            user = {key: row[key] for key in _PROFILE_USER_FIELDS}
+            role = None
+            if row['role__id'] is not None:
+                # Та же структура, что и у get_user_role (все поля таблицы roles)
+                role = {key: row[f"role__{key}"] for key in _ROLE_FIELDS}
+            
+            return user, role
+        
+        except Exception as e:
+            self.logger.error(f"Ошибка при получении пользователя ID={user_id} с ролью: {e}")
+            log_exception(self.logger, "Ошибка получения пользователя с ролью")
+            return fallback, None
+    
     def get_user_permissions(self, app_context, user_id: int = None) -> List[str]:
         """
         Получение списка разрешений пользователя
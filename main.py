@@ -9,8 +9,10 @@ WDM_V12 - Web Data Monitor, версия 12.
 
 import sys
 import os
+import asyncio
 import logging
 from PyQt6.QtWidgets import QApplication
+import qasync
 
 # Настраиваем пути для импортов
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -68,9 +70,14 @@ def main():
         main_window = MainWindow(app_context)
         main_window.show()
         
-        # Запускаем цикл событий приложения
+        # Запускаем цикл событий приложения. Цикл asyncio встроен в цикл Qt,
+        # чтобы асинхронные обработчики интерфейса не блокировали GUI
         logger.info("Запуск главного цикла приложения")
-        return app.exec()
+        loop = qasync.QEventLoop(app)
+        asyncio.set_event_loop(loop)
+        with loop:
+            loop.run_forever()
+        return 0
     
     except Exception as e:
         logger.critical(f"Критическая ошибка при запуске приложения: {e}")
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Модуль быстрых агрегаций для отчетов WDM_V12.
+Функции работают с непрерывными массивами NumPy и компилируются Numba,
+если она установлена; иначе используются векторные операции NumPy.
+"""
+
+import numpy as np
+
+# Numba - необязательная зависимость для ускорения агрегаций
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def total(arr):
+        """Сумма элементов массива"""
+        result = 0.0
+        for i in range(arr.shape[0]):
+            result += arr[i]
+        return result
+
+    @njit(cache=True)
+    def count_sites_with_changes(arr):
+        """Количество элементов с ненулевым значением"""
+        count = 0
+        for i in range(arr.shape[0]):
+            if arr[i] > 0:
+                count += 1
+        return count
+
+    @njit(cache=True)
+    def avg_diff(arr):
+        """Среднее значение (0 для пустого массива)"""
+        n = arr.shape[0]
+        if n == 0:
+            return 0.0
+        result = 0.0
+        for i in range(n):
+            result += arr[i]
+        return result / n
+
+    @njit(cache=True)
+    def max_diff(arr):
+        """Максимальное значение (0 для пустого массива)"""
+        n = arr.shape[0]
+        if n == 0:
+            return 0.0
+        result = arr[0]
+        for i in range(1, n):
+            if arr[i] > result:
+                result = arr[i]
+        return result
+else:
+    def total(arr):
+        """Сумма элементов массива"""
+        return float(arr.sum())
+
+    def count_sites_with_changes(arr):
+        """Количество элементов с ненулевым значением"""
+        return int(np.count_nonzero(arr > 0))
+
+    def avg_diff(arr):
+        """Среднее значение (0 для пустого массива)"""
+        return float(arr.mean()) if arr.shape[0] else 0.0
+
+    def max_diff(arr):
+        """Максимальное значение (0 для пустого массива)"""
+        return float(arr.max()) if arr.shape[0] else 0.0
+
+
+def to_array(rows, key):
+    """
+    Формирование непрерывного массива float64 из поля списка записей
+    
+    Args:
+        rows: Список записей (словарей)
+        key: Имя поля
+        
+    Returns:
+        np.ndarray: Массив значений (None заменяется на 0)
+    """
+    return np.fromiter((row[key] or 0.0 for row in rows), dtype=np.float64, count=len(rows))
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Модуль разбиения HTML-отчетов на фрагменты для WDM_V12.
+Крупный HTML-предпросмотр вставляется в документ по частям; фрагменты
+режутся по границам строк таблиц и абзацев, а перенесенные таблицы
+открываются заново вместе со строкой заголовков.
+"""
+
+import re
+
+# Размер фрагмента HTML по умолчанию (символов)
+HTML_CHUNK_SIZE = 100 * 1024
+
+# Теги, после которых допускается граница фрагмента
+_CHUNK_BOUNDARIES = ("</tr>", "</p>")
+
+# Открывающий тег таблицы
+_TABLE_OPEN_RE = re.compile(r"<table[^>]*>", re.I)
+
+
+def _chunk_boundary(html, start, end):
+    """
+    Поиск границы фрагмента HTML
+    
+    Args:
+        html: HTML-контент
+        start: Начало фрагмента
+        end: Желаемый конец фрагмента
+        
+    Returns:
+        int: Позиция сразу после последнего </p> или </tr> в окне,
+             а если их нет - после первого за его пределами
+    """
+    cut = -1
+    for tag in _CHUNK_BOUNDARIES:
+        pos = html.rfind(tag, start, end)
+        if pos != -1:
+            cut = max(cut, pos + len(tag))
+    
+    if cut > start:
+        return cut
+    
+    cut = len(html)
+    for tag in _CHUNK_BOUNDARIES:
+        pos = html.find(tag, end)
+        if pos != -1:
+            cut = min(cut, pos + len(tag))
+    
+    return cut
+
+
+def _table_reopen_html(html, pos):
+    """
+    HTML для повторного открытия таблицы в следующем фрагменте
+    
+    Args:
+        html: HTML-контент
+        pos: Позиция открывающего тега таблицы
+        
+    Returns:
+        str: Открывающий тег таблицы и строка заголовков (если она есть)
+    """
+    tag = _TABLE_OPEN_RE.match(html, pos)
+    table_end = html.find("</table>", tag.end())
+    if table_end == -1:
+        table_end = len(html)
+    
+    # Строка заголовков - первая строка таблицы, если она содержит <th>
+    row_start = html.find("<tr", tag.end(), table_end)
+    if row_start != -1:
+        row_end = html.find("</tr>", row_start, table_end)
+        if row_end != -1 and "<th" in html[row_start:row_end]:
+            return tag.group(0) + html[row_start:row_end + len("</tr>")]
+    
+    return tag.group(0)
+
+
+def split_html_chunks(html, chunk_size=HTML_CHUNK_SIZE):
+    """
+    Разбиение HTML на фрагменты по границам </p> и </tr>
+    
+    Таблица, не закрытая в конце фрагмента, закрывается в нем
+    и открывается заново в начале следующего вместе со строкой
+    заголовков. Если в следующем фрагменте от таблицы не осталось
+    строк, она не открывается повторно.
+    
+    Args:
+        html: HTML-контент
+        chunk_size: Желаемый размер фрагмента в символах
+        
+    Returns:
+        list: Список фрагментов HTML
+    """
+    chunks = []
+    reopen = None
+    start = 0
+    length = len(html)
+    
+    while start < length:
+        end = start + chunk_size
+        end = _chunk_boundary(html, start, end) if end < length else length
+        
+        piece = html[start:end]
+        
+        # Состояние таблицы в конце фрагмента
+        last_open = piece.rfind("<table")
+        last_close = piece.rfind("</table>")
+        opens_table = last_open > last_close
+        if opens_table:
+            next_reopen = _table_reopen_html(html, start + last_open)
+        elif last_close != -1:
+            next_reopen = None
+        else:
+            next_reopen = reopen
+        
+        # Продолжение таблицы из предыдущего фрагмента
+        prefix = ""
+        if reopen:
+            close = piece.find("</table>")
+            if piece.find("<tr", 0, close if close != -1 else len(piece)) != -1:
+                prefix = reopen
+            elif close != -1:
+                # Строк не осталось: таблица уже закрыта в предыдущем фрагменте
+                piece = piece[:close] + piece[close + len("</table>"):]
+        
+        suffix = "</table>" if next_reopen and (prefix or opens_table) else ""
+        if prefix or piece.strip():
+            chunks.append(prefix + piece + suffix)
+        
+        reopen = next_reopen
+        start = end
+    
+    return chunks
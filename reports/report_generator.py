@@ -7,6 +7,7 @@
 """
 
 import os
+import sys
 import json
 import logging
 from datetime import datetime, timedelta
@@ -15,6 +16,133 @@ from pathlib import Path
 
 from utils.logger import get_module_logger, log_exception
 from core.settings import Settings
+from reports import fast_agg
+
+# Таблица замены спецсимволов HTML (str.translate выполняется на C за один проход)
+_HTML_TRANS = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;'
+})
+
+
+def _esc(value):
+    """
+    Экранирование значения для вставки в HTML
+    
+    Args:
+        value: Значение
+        
+    Returns:
+        str: Экранированная строка
+    """
+    return str(value).translate(_HTML_TRANS)
+
+
+def _intern_columns(rows, keys):
+    """
+    Интернирование повторяющихся строковых значений в записях
+    
+    Статусы, группы и названия сайтов повторяются в тысячах строк, а
+    фабрика строк БД создает для каждой записи отдельный объект str.
+    После интернирования записи ссылаются на один объект, а сравнение
+    строк сводится к сравнению указателей.
+    
+    Args:
+        rows: Список записей (словарей), изменяется на месте
+        keys: Имена полей для интернирования
+    """
+    intern = sys.intern
+    for row in rows:
+        for key in keys:
+            value = row.get(key)
+            if isinstance(value, str):
+                row[key] = intern(value)
+
+
+# Стили HTML-отчетов (общие для всех типов отчетов)
+_REPORT_CSS = """
+    body { font-family: Arial, sans-serif; margin: 20px; color: #333; line-height: 1.6; }
+    h1, h2, h3, h4 { color: #444; margin-top: 20px; }
+    h1 { border-bottom: 2px solid #5d87a1; padding-bottom: 10px; }
+    h2 { border-bottom: 1px solid #ddd; padding-bottom: 5px; }
+    
+    /* Основные блоки */
+    .container { max-width: 1200px; margin: 0 auto; }
+    .section { margin: 30px 0; }
+    
+    /* Таблицы */
+    table { border-collapse: collapse; width: 100%; margin: 20px 0; box-shadow: 0 1px 3px rgba(0,0,0,0.12); }
+    th, td { border: 1px solid #ddd; padding: 12px; text-align: left; }
+    th { background-color: #f5f5f5; font-weight: bold; position: sticky; top: 0; }
+    tr:nth-child(even) { background-color: #f9f9f9; }
+    tr:hover { background-color: #f1f1f1; }
+    
+    /* Карточки статистики */
+    .stats { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 20px; margin: 20px 0; }
+    .stat-card { background: #fff; padding: 20px; border-radius: 8px; box-shadow: 0 2px 6px rgba(0,0,0,0.1); 
+                 transition: transform 0.3s, box-shadow 0.3s; text-align: center; }
+    .stat-card:hover { transform: translateY(-5px); box-shadow: 0 5px 15px rgba(0,0,0,0.1); }
+    .stat-card h3 { margin-top: 0; color: #666; font-size: 16px; }
+    .stat-card p { font-size: 28px; font-weight: bold; margin: 10px 0 0; color: #333; }
+    
+    /* Категории изменений */
+    .changes-categories { display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 20px; margin: 20px 0; }
+    .category { padding: 15px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+    .category.critical { background-color: rgba(255, 82, 82, 0.1); border-left: 4px solid #ff5252; }
+    .category.normal { background-color: rgba(255, 193, 7, 0.1); border-left: 4px solid #ffc107; }
+    .category.minor { background-color: rgba(76, 175, 80, 0.1); border-left: 4px solid #4caf50; }
+    .category h3 { margin-top: 0; }
+    
+    /* Индикатор прогресса */
+    .progress-bar { width: 100%; height: 10px; background-color: #f0f0f0; border-radius: 5px; overflow: hidden; margin: 10px 0; }
+    .progress { height: 100%; border-radius: 5px; }
+    .critical .progress { background-color: #ff5252; }
+    .normal .progress { background-color: #ffc107; }
+    .minor .progress { background-color: #4caf50; }
+    
+    /* Детальный анализ изменений */
+    .detailed-changes { margin: 20px 0; }
+    .change-analysis { padding: 15px; margin-bottom: 20px; border-radius: 8px; box-shadow: 0 1px 3px rgba(0,0,0,0.12); }
+    .change-analysis.critical { background-color: rgba(255, 82, 82, 0.05); border-left: 4px solid #ff5252; }
+    .change-analysis.normal { background-color: rgba(255, 193, 7, 0.05); border-left: 4px solid #ffc107; }
+    .change-analysis.minor { background-color: rgba(76, 175, 80, 0.05); border-left: 4px solid #4caf50; }
+    .change-analysis h3 { margin-top: 0; }
+    .analysis-details { display: grid; grid-template-columns: 1fr 1fr; gap: 20px; }
+    .changed { color: #ff5252; font-weight: bold; }
+    span.critical { color: #ff5252; font-weight: bold; }
+    span.normal { color: #ff9800; font-weight: bold; }
+    span.minor { color: #4caf50; font-weight: bold; }
+    
+    /* Таблицы по категориям */
+    .changes-table.critical th { background-color: rgba(255, 82, 82, 0.2); }
+    .changes-table.normal th { background-color: rgba(255, 193, 7, 0.2); }
+    .changes-table.minor th { background-color: rgba(76, 175, 80, 0.2); }
+    
+    /* Круговая диаграмма для ошибок */
+    .pie-chart-container { display: flex; justify-content: center; align-items: center; margin: 30px 0; flex-wrap: wrap; }
+    .pie-chart { position: relative; width: 250px; height: 250px; border-radius: 50%; background-color: #f0f0f0; margin: 20px; }
+    .pie-segment { position: absolute; width: 100%; height: 100%; border-radius: 50%; clip-path: polygon(50% 50%, 50% 0%, 100% 0%, 100% 100%, 0% 100%, 0% 0%, 50% 0%); 
+                  transform-origin: 50% 50%; transform: rotate(var(--start)); background-color: var(--color);
+                  clip-path: polygon(50% 50%, 100% 0%, 100% 100%, 0% 100%, 0% 0%, 100% 0%); }
+    .pie-legend { display: flex; flex-direction: column; justify-content: center; }
+    .legend-item { display: flex; align-items: center; margin-bottom: 8px; }
+    .color-box { width: 15px; height: 15px; margin-right: 8px; }
+    
+    /* Предупреждения */
+    .warning { background-color: rgba(255, 193, 7, 0.1); border-left: 4px solid #ffc107; padding: 15px; border-radius: 4px; margin: 20px 0; }
+    .warning p { margin: 0; color: #856404; }
+    
+    /* Адаптивная верстка */
+    @media (max-width: 768px) {
+        .stats, .changes-categories { grid-template-columns: 1fr; }
+        .analysis-details { grid-template-columns: 1fr; }
+        .pie-chart-container { flex-direction: column; }
+    }
+"""
+
 
 class ReportGenerator:
     """
@@ -207,6 +335,7 @@ class ReportGenerator:
                 query, 
                 (date_from, date_to, date_from, date_to, date_to, max_sites)
             )
+            _intern_columns(sites, ('status', 'group_name'))
             
             # Если сайтов очень много, выводим предупреждение в лог
             if total_count > max_sites:
@@ -215,8 +344,11 @@ class ReportGenerator:
             # Формируем статистику
             total_sites = len(sites)
             active_sites = sum(1 for site in sites if site['status'] == 'active')
-            total_changes = sum(site['changes_count'] for site in sites)
-            total_errors = sum(site['errors_count'] for site in sites)
+            changes_counts = fast_agg.to_array(sites, 'changes_count')
+            errors_counts = fast_agg.to_array(sites, 'errors_count')
+            total_changes = int(fast_agg.total(changes_counts))
+            total_errors = int(fast_agg.total(errors_counts))
+            sites_with_changes = fast_agg.count_sites_with_changes(changes_counts)
             
             # Группируем сайты по группам
             sites_by_group = {}
@@ -238,7 +370,10 @@ class ReportGenerator:
                 'active_sites': active_sites,
                 'total_changes': total_changes,
                 'total_errors': total_errors,
+                'sites_with_changes': sites_with_changes,
                 'sites': sites,
+                'changes_counts': changes_counts,
+                'errors_counts': errors_counts,
                 'sites_by_group': sites_by_group,
                 'limited_results': total_count > max_sites,
                 'total_available': total_count
@@ -298,6 +433,7 @@ class ReportGenerator:
                 query, 
                 (date_from, date_to, max_changes)
             )
+            _intern_columns(changes, ('status', 'site_name'))
             
             # Если изменений очень много, выводим предупреждение в лог
             if total_count > max_changes:
@@ -353,7 +489,9 @@ class ReportGenerator:
             
             # Считаем статистику
             total_changes = len(changes)
-            avg_diff = sum(change['diff_percent'] for change in changes) / total_changes if total_changes > 0 else 0
+            diff_percents = fast_agg.to_array(changes, 'diff_percent')
+            avg_diff = fast_agg.avg_diff(diff_percents)
+            max_diff = fast_agg.max_diff(diff_percents)
             sites_with_changes = len(changes_by_site)
             
             # Проверяем, есть ли данные для отчета
@@ -366,8 +504,10 @@ class ReportGenerator:
                 'date_to': date_to,
                 'total_changes': total_changes,
                 'avg_diff_percent': avg_diff,
+                'max_diff_percent': max_diff,
                 'sites_with_changes': sites_with_changes,
                 'changes': changes,
+                'diff_percents': diff_percents,
                 'changes_by_site': changes_by_site,
                 'categorized_changes': categorized_changes,
                 'detailed_analysis': detailed_analysis,
@@ -429,6 +569,7 @@ class ReportGenerator:
                 query, 
                 (date_from, date_to, max_errors)
             )
+            _intern_columns(errors, ('status', 'group_name', 'name'))
             
             # Если ошибок очень много, выводим предупреждение в лог
             if total_count > max_errors:
@@ -603,85 +744,7 @@ class ReportGenerator:
             <head>
                 <meta charset="utf-8">
                 <title>Отчет WDM - {report_data['type']}</title>
-                <style>
-                    body {{ font-family: Arial, sans-serif; margin: 20px; color: #333; line-height: 1.6; }}
-                    h1, h2, h3, h4 {{ color: #444; margin-top: 20px; }}
-                    h1 {{ border-bottom: 2px solid #5d87a1; padding-bottom: 10px; }}
-                    h2 {{ border-bottom: 1px solid #ddd; padding-bottom: 5px; }}
-                    
-                    /* Основные блоки */
-                    .container {{ max-width: 1200px; margin: 0 auto; }}
-                    .section {{ margin: 30px 0; }}
-                    
-                    /* Таблицы */
-                    table {{ border-collapse: collapse; width: 100%; margin: 20px 0; box-shadow: 0 1px 3px rgba(0,0,0,0.12); }}
-                    th, td {{ border: 1px solid #ddd; padding: 12px; text-align: left; }}
-                    th {{ background-color: #f5f5f5; font-weight: bold; position: sticky; top: 0; }}
-                    tr:nth-child(even) {{ background-color: #f9f9f9; }}
-                    tr:hover {{ background-color: #f1f1f1; }}
-                    
-                    /* Карточки статистики */
-                    .stats {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 20px; margin: 20px 0; }}
-                    .stat-card {{ background: #fff; padding: 20px; border-radius: 8px; box-shadow: 0 2px 6px rgba(0,0,0,0.1); 
-                                 transition: transform 0.3s, box-shadow 0.3s; text-align: center; }}
-                    .stat-card:hover {{ transform: translateY(-5px); box-shadow: 0 5px 15px rgba(0,0,0,0.1); }}
-                    .stat-card h3 {{ margin-top: 0; color: #666; font-size: 16px; }}
-                    .stat-card p {{ font-size: 28px; font-weight: bold; margin: 10px 0 0; color: #333; }}
-                    
-                    /* Категории изменений */
-                    .changes-categories {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 20px; margin: 20px 0; }}
-                    .category {{ padding: 15px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-                    .category.critical {{ background-color: rgba(255, 82, 82, 0.1); border-left: 4px solid #ff5252; }}
-                    .category.normal {{ background-color: rgba(255, 193, 7, 0.1); border-left: 4px solid #ffc107; }}
-                    .category.minor {{ background-color: rgba(76, 175, 80, 0.1); border-left: 4px solid #4caf50; }}
-                    .category h3 {{ margin-top: 0; }}
-                    
-                    /* Индикатор прогресса */
-                    .progress-bar {{ width: 100%; height: 10px; background-color: #f0f0f0; border-radius: 5px; overflow: hidden; margin: 10px 0; }}
-                    .progress {{ height: 100%; border-radius: 5px; }}
-                    .critical .progress {{ background-color: #ff5252; }}
-                    .normal .progress {{ background-color: #ffc107; }}
-                    .minor .progress {{ background-color: #4caf50; }}
-                    
-                    /* Детальный анализ изменений */
-                    .detailed-changes {{ margin: 20px 0; }}
-                    .change-analysis {{ padding: 15px; margin-bottom: 20px; border-radius: 8px; box-shadow: 0 1px 3px rgba(0,0,0,0.12); }}
-                    .change-analysis.critical {{ background-color: rgba(255, 82, 82, 0.05); border-left: 4px solid #ff5252; }}
-                    .change-analysis.normal {{ background-color: rgba(255, 193, 7, 0.05); border-left: 4px solid #ffc107; }}
-                    .change-analysis.minor {{ background-color: rgba(76, 175, 80, 0.05); border-left: 4px solid #4caf50; }}
-                    .change-analysis h3 {{ margin-top: 0; }}
-                    .analysis-details {{ display: grid; grid-template-columns: 1fr 1fr; gap: 20px; }}
-                    .changed {{ color: #ff5252; font-weight: bold; }}
-                    span.critical {{ color: #ff5252; font-weight: bold; }}
-                    span.normal {{ color: #ff9800; font-weight: bold; }}
-                    span.minor {{ color: #4caf50; font-weight: bold; }}
-                    
-                    /* Таблицы по категориям */
-                    .changes-table.critical th {{ background-color: rgba(255, 82, 82, 0.2); }}
-                    .changes-table.normal th {{ background-color: rgba(255, 193, 7, 0.2); }}
-                    .changes-table.minor th {{ background-color: rgba(76, 175, 80, 0.2); }}
-                    
-                    /* Круговая диаграмма для ошибок */
-                    .pie-chart-container {{ display: flex; justify-content: center; align-items: center; margin: 30px 0; flex-wrap: wrap; }}
-                    .pie-chart {{ position: relative; width: 250px; height: 250px; border-radius: 50%; background-color: #f0f0f0; margin: 20px; }}
-                    .pie-segment {{ position: absolute; width: 100%; height: 100%; border-radius: 50%; clip-path: polygon(50% 50%, 50% 0%, 100% 0%, 100% 100%, 0% 100%, 0% 0%, 50% 0%); 
-                                  transform-origin: 50% 50%; transform: rotate(var(--start)); background-color: var(--color);
-                                  clip-path: polygon(50% 50%, 100% 0%, 100% 100%, 0% 100%, 0% 0%, 100% 0%); }}
-                    .pie-legend {{ display: flex; flex-direction: column; justify-content: center; }}
-                    .legend-item {{ display: flex; align-items: center; margin-bottom: 8px; }}
-                    .color-box {{ width: 15px; height: 15px; margin-right: 8px; }}
-                    
-                    /* Предупреждения */
-                    .warning {{ background-color: rgba(255, 193, 7, 0.1); border-left: 4px solid #ffc107; padding: 15px; border-radius: 4px; margin: 20px 0; }}
-                    .warning p {{ margin: 0; color: #856404; }}
-                    
-                    /* Адаптивная верстка */
-                    @media (max-width: 768px) {{
-                        .stats, .changes-categories {{ grid-template-columns: 1fr; }}
-                        .analysis-details {{ grid-template-columns: 1fr; }}
-                        .pie-chart-container {{ flex-direction: column; }}
-                    }}
-                </style>
+                <style>{_REPORT_CSS}</style>
             </head>
             <body>
                 <div class="container">
@@ -742,7 +805,7 @@ class ReportGenerator:
         # Добавляем таблицу сайтов по группам
         for group, sites in report_data['sites_by_group'].items():
             html += f"""
-            <h2>Группа: {group}</h2>
+            <h2>Группа: {_esc(group)}</h2>
             <table>
                 <tr>
                     <th>Название</th>
@@ -758,9 +821,9 @@ class ReportGenerator:
             for site in sites:
                 html += f"""
                 <tr>
-                    <td>{site['name']}</td>
-                    <td>{site['url']}</td>
-                    <td>{site['status']}</td>
+                    <td>{_esc(site['name'])}</td>
+                    <td>{_esc(site['url'])}</td>
+                    <td>{_esc(site['status'])}</td>
                     <td>{site['last_check'].strftime('%d.%m.%Y %H:%M') if site['last_check'] else '-'}</td>
                     <td>{site['last_change'].strftime('%d.%m.%Y %H:%M') if site['last_change'] else '-'}</td>
                     <td>{site['changes_count']}</td>
@@ -831,7 +894,7 @@ class ReportGenerator:
                     
                     html += f"""
                     <div class="change-analysis {change_type_class}">
-                        <h3>Изменение для сайта: {analysis_item['site_name']}</h3>
+                        <h3>Изменение для сайта: {_esc(analysis_item['site_name'])}</h3>
                         <p>Дата: {analysis_item['timestamp'].strftime('%d.%m.%Y %H:%M')}</p>
                         <div class="analysis-details">
                             <div class="metadata-changes">
@@ -884,12 +947,12 @@ class ReportGenerator:
                 for change in changes_list:
                     html += f"""
                     <tr>
-                        <td>{change['site_name']}</td>
+                        <td>{_esc(change['site_name'])}</td>
                         <td>{change['timestamp'].strftime('%d.%m.%Y %H:%M')}</td>
                         <td><span class="{category_id}">{change['diff_percent']:.2f}%</span></td>
-                        <td>{change['status']}</td>
-                        <td>{change['reviewed_by'] if change['reviewed_by'] else '-'}</td>
-                        <td>{change['notes'] if change['notes'] else '-'}</td>
+                        <td>{_esc(change['status'])}</td>
+                        <td>{_esc(change['reviewed_by']) if change['reviewed_by'] else '-'}</td>
+                        <td>{_esc(change['notes']) if change['notes'] else '-'}</td>
                     </tr>
                     """
                 
@@ -1006,11 +1069,11 @@ class ReportGenerator:
                 for error in errors:
                     html += f"""
                     <tr>
-                        <td>{error['name']}</td>
-                        <td>{error['url']}</td>
+                        <td>{_esc(error['name'])}</td>
+                        <td>{_esc(error['url'])}</td>
                         <td>{error['error_time'].strftime('%d.%m.%Y %H:%M')}</td>
-                        <td>{error['error_message']}</td>
-                        <td>{error['group_name'] if error['group_name'] else '-'}</td>
+                        <td>{_esc(error['error_message'])}</td>
+                        <td>{_esc(error['group_name']) if error['group_name'] else '-'}</td>
                     </tr>
                     """
                 
@@ -1092,7 +1155,7 @@ class ReportGenerator:
         for group in report_data['groups_stats']:
             html += f"""
             <tr>
-                <td>{group['name'] if group['name'] else 'Без группы'}</td>
+                <td>{_esc(group['name']) if group['name'] else 'Без группы'}</td>
                 <td>{group['sites_count']}</td>
             </tr>
             """
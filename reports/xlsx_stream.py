@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Модуль потоковой записи XLSX для WDM_V12.
+Формирует минимальную книгу Excel напрямую в zip-архив без объектной
+модели ячеек, что позволяет выгружать очень большие отчеты при
+постоянном расходе памяти.
+"""
+
+import re
+import zipfile
+from xml.sax.saxutils import escape
+
+# Символы, недопустимые в XML 1.0
+_ILLEGAL_XML_RE = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+_CONTENT_TYPES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '<Override PartName="/xl/sharedStrings.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>'
+    '</Types>'
+)
+
+_ROOT_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+
+_WORKBOOK_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="{title}" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+
+_WORKBOOK_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    '<Relationship Id="rId2" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+    'Target="styles.xml"/>'
+    '<Relationship Id="rId3" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/sharedStrings" '
+    'Target="sharedStrings.xml"/>'
+    '</Relationships>'
+)
+
+# Стиль 1 - полужирный шрифт и серая заливка для заголовков
+_STYLES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font>'
+    '<font><b/><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="3"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill>'
+    '<fill><patternFill patternType="solid"><fgColor rgb="FFF0F0F0"/></patternFill></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="2"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="1" fillId="2" borderId="0" xfId="0" applyFont="1" applyFill="1"/></cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+
+_SHEET_HEAD_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+)
+
+
+def _xml_text(value):
+    """
+    Подготовка строки для записи в XML
+    
+    Args:
+        value: Строковое значение
+        
+    Returns:
+        str: Экранированная строка без недопустимых символов
+    """
+    return escape(_ILLEGAL_XML_RE.sub('', value))
+
+
+def write_xlsx_stream(file_path, title, headers, rows, widths=None):
+    """
+    Потоковая запись таблицы в XLSX-файл
+    
+    Строки записываются в лист по мере чтения итератора. Повторяющиеся
+    строковые значения (сайты, группы, статусы) сохраняются в таблице
+    общих строк один раз.
+    
+    Args:
+        file_path: Путь для сохранения файла
+        title: Название листа
+        headers: Заголовки столбцов
+        rows: Итерируемая последовательность кортежей значений
+        widths: Ширина столбцов в символах (опционально)
+    """
+    shared = {}
+    
+    def cell(value, style=''):
+        """XML ячейки: числа записываются как есть, остальное - через общие строки"""
+        if value is None:
+            return '<c/>'
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return f'<c{style}><v>{value}</v></c>'
+        index = shared.get(value)
+        if index is None:
+            index = shared[value] = len(shared)
+        return f'<c t="s"{style}><v>{index}</v></c>'
+    
+    with zipfile.ZipFile(file_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr('[Content_Types].xml', _CONTENT_TYPES_XML)
+        zf.writestr('_rels/.rels', _ROOT_RELS_XML)
+        zf.writestr('xl/workbook.xml', _WORKBOOK_XML.format(title=_xml_text(title[:31])))
+        zf.writestr('xl/_rels/workbook.xml.rels', _WORKBOOK_RELS_XML)
+        zf.writestr('xl/styles.xml', _STYLES_XML)
+        
+        with zf.open('xl/worksheets/sheet1.xml', 'w', force_zip64=True) as raw:
+            write = raw.write
+            write(_SHEET_HEAD_XML.encode('utf-8'))
+            
+            if widths:
+                cols = ''.join(
+                    f'<col min="{col}" max="{col}" width="{width}" customWidth="1"/>'
+                    for col, width in enumerate(widths, 1)
+                )
+                write(f'<cols>{cols}</cols>'.encode('utf-8'))
+            
+            write(b'<sheetData>')
+            header_cells = ''.join(cell(str(header), ' s="1"') for header in headers)
+            write(f'<row r="1">{header_cells}</row>'.encode('utf-8'))
+            
+            for row_index, row in enumerate(rows, 2):
+                cells = ''.join(map(cell, row))
+                write(f'<row r="{row_index}">{cells}</row>'.encode('utf-8'))
+            
+            write(b'</sheetData></worksheet>')
+        
+        # Таблица общих строк записывается после листа, когда она полностью собрана
+        with zf.open('xl/sharedStrings.xml', 'w', force_zip64=True) as raw:
+            raw.write(
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                f'<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+                f'uniqueCount="{len(shared)}">'.encode('utf-8')
+            )
+            for value in shared:
+                raw.write(f'<si><t xml:space="preserve">{_xml_text(str(value))}</t></si>'.encode('utf-8'))
+            raw.write(b'</sst>')
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Модульные тесты для быстрых агрегаций отчетов.
+Сравнивает результаты активной реализации (Numba или NumPy) и запасной
+реализации на NumPy с вычислениями на чистом Python.
+"""
+
+import os
+import sys
+import importlib.util
+import unittest
+from unittest.mock import patch
+
+# Добавляем корневую директорию проекта в путь импорта
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from reports import fast_agg
+
+
+def _load_numpy_fallback():
+    """Загрузка отдельной копии модуля fast_agg без Numba."""
+    spec = importlib.util.spec_from_file_location('fast_agg_numpy', fast_agg.__file__)
+    module = importlib.util.module_from_spec(spec)
+    with patch.dict(sys.modules, {'numba': None}):
+        spec.loader.exec_module(module)
+    return module
+
+
+ROWS = [
+    {'value': 3},
+    {'value': None},
+    {'value': 0},
+    {'value': 12.5},
+    {'value': 1}
+]
+
+
+class FastAggTest(unittest.TestCase):
+    """Тесты для функций модуля fast_agg."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Подготовка реализаций для проверки."""
+        fallback = _load_numpy_fallback()
+        cls.implementations = [('active', fast_agg), ('numpy', fallback)]
+    
+    def _check(self, rows):
+        """Сравнение всех агрегаций с вычислениями на чистом Python."""
+        values = [row['value'] or 0.0 for row in rows]
+        expected = {
+            'total': float(sum(values)),
+            'count_sites_with_changes': sum(1 for value in values if value > 0),
+            'avg_diff': sum(values) / len(values) if values else 0.0,
+            'max_diff': max(values) if values else 0.0
+        }
+        
+        for name, module in self.implementations:
+            arr = module.to_array(rows, 'value')
+            self.assertEqual(arr.dtype, module.np.float64)
+            self.assertEqual(arr.tolist(), values)
+            
+            for func_name, value in expected.items():
+                with self.subTest(implementation=name, function=func_name, size=len(rows)):
+                    self.assertAlmostEqual(getattr(module, func_name)(arr), value)
+    
+    def test_values(self):
+        """Тест агрегаций по записям со значениями None."""
+        self._check(ROWS)
+    
+    def test_empty(self):
+        """Тест агрегаций по пустому списку записей."""
+        self._check([])
+    
+    def test_single_value(self):
+        """Тест агрегаций по одной записи."""
+        self._check([{'value': 7}])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Модульные тесты для разбиения HTML-предпросмотра отчетов на фрагменты.
+Проверяет перенос таблиц между фрагментами и отсутствие пустых таблиц.
+"""
+
+import os
+import sys
+import unittest
+
+# Добавляем корневую директорию проекта в путь импорта
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from reports.html_chunks import split_html_chunks
+
+
+HEADER = "<tr><th>Сайт</th><th>Статус</th></tr>"
+
+
+def _report_html(rows):
+    """Формирование HTML отчета с таблицей из заданного числа строк."""
+    body = "".join(f"<tr><td>Сайт {i}</td><td>active</td></tr>\n" for i in range(rows))
+    return (
+        "<h1>Отчет</h1><p>Период</p>\n"
+        f'<table class="sites">{HEADER}\n{body}</table>\n'
+        f"<p>Всего сайтов: {rows}</p>"
+    )
+
+
+class SplitHtmlChunksTest(unittest.TestCase):
+    """Тесты для функции split_html_chunks."""
+    
+    def _split(self, html, size=200):
+        """Разбиение HTML с уменьшенным размером фрагмента."""
+        return split_html_chunks(html, size)
+    
+    def test_small_html_single_chunk(self):
+        """Тест: HTML меньше размера фрагмента не разбивается."""
+        html = _report_html(2)
+        self.assertEqual(self._split(html, size=len(html) + 1), [html])
+    
+    def test_tables_balanced(self):
+        """Тест: каждый фрагмент содержит закрытые таблицы."""
+        chunks = self._split(_report_html(40))
+        
+        self.assertGreater(len(chunks), 2)
+        for chunk in chunks:
+            self.assertEqual(chunk.count("<table"), chunk.count("</table>"))
+    
+    def test_header_repeated(self):
+        """Тест: продолжение таблицы начинается с тегов таблицы и строки заголовков."""
+        chunks = self._split(_report_html(40))
+        
+        for chunk in chunks[1:]:
+            if "<td>" in chunk:
+                self.assertTrue(chunk.startswith('<table class="sites">' + HEADER))
+    
+    def test_rows_preserved(self):
+        """Тест: все строки данных попадают во фрагменты ровно один раз."""
+        chunks = self._split(_report_html(40))
+        joined = "".join(chunks)
+        
+        for i in range(40):
+            self.assertEqual(joined.count(f"<td>Сайт {i}</td>"), 1)
+        self.assertIn("Всего сайтов", chunks[-1])
+    
+    def test_no_empty_tables(self):
+        """Тест: во фрагментах нет таблиц без строк."""
+        for size in range(60, 400, 7):
+            for chunk in self._split(_report_html(25), size=size):
+                pos = chunk.find("<table")
+                while pos != -1:
+                    close = chunk.find("</table>", pos)
+                    self.assertIn("<tr", chunk[pos:close], msg=f"size={size}")
+                    pos = chunk.find("<table", close)
+    
+    def test_no_blank_chunks(self):
+        """Тест: пустые фрагменты не создаются."""
+        for size in range(60, 400, 7):
+            for chunk in self._split(_report_html(25), size=size):
+                self.assertTrue(chunk.strip())
+
+
+if __name__ == '__main__':
+    unittest.main()
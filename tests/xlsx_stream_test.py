@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Модульные тесты для потоковой записи XLSX.
+Проверяет, что файл, записанный write_xlsx_stream, читается openpyxl.
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+import zipfile
+
+# Добавляем корневую директорию проекта в путь импорта
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from reports.xlsx_stream import write_xlsx_stream
+
+try:
+    import openpyxl
+    OPENPYXL_AVAILABLE = True
+except ImportError:
+    OPENPYXL_AVAILABLE = False
+
+
+@unittest.skipUnless(OPENPYXL_AVAILABLE, "openpyxl не установлен")
+class WriteXlsxStreamTest(unittest.TestCase):
+    """Тесты для функции write_xlsx_stream."""
+    
+    def setUp(self):
+        """Подготовка к тестам."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.temp_dir, 'report.xlsx')
+        self.headers = ['Название', 'Статус', 'Изменений', 'Процент']
+        self.rows = [
+            ('Сайт <1> & "A"', 'active', 3, 12.5),
+            ('Сайт 2', 'active', 0, 0.0),
+            ('Сайт 3', 'inactive', None, 1.25)
+        ]
+    
+    def tearDown(self):
+        """Очистка после тестов."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def _load_sheet(self):
+        """Запись тестовых данных и загрузка листа."""
+        write_xlsx_stream(self.file_path, 'Сайты', self.headers, iter(self.rows), [20, 10, 12, 10])
+        workbook = openpyxl.load_workbook(self.file_path)
+        return workbook['Сайты']
+    
+    def test_values_round_trip(self):
+        """Тест чтения заголовков и значений."""
+        sheet = self._load_sheet()
+        values = list(sheet.iter_rows(values_only=True))
+        
+        self.assertEqual(list(values[0]), self.headers)
+        self.assertEqual(values[1:], self.rows)
+    
+    def test_shared_strings(self):
+        """Тест записи повторяющихся строк в таблицу общих строк один раз."""
+        self._load_sheet()
+        
+        with zipfile.ZipFile(self.file_path) as zf:
+            shared = zf.read('xl/sharedStrings.xml').decode('utf-8')
+        
+        # 4 заголовка + 3 названия + 2 различных статуса
+        self.assertIn('uniqueCount="9"', shared)
+        self.assertEqual(shared.count('<t xml:space="preserve">active</t>'), 1)
+    
+    def test_header_style(self):
+        """Тест оформления заголовков и ширины столбцов."""
+        sheet = self._load_sheet()
+        
+        header = sheet['A1']
+        self.assertTrue(header.font.b)
+        self.assertEqual(header.fill.fill_type, 'solid')
+        self.assertEqual(header.fill.fgColor.rgb, 'FFF0F0F0')
+        self.assertFalse(sheet['A2'].font.b)
+        self.assertEqual(sheet.column_dimensions['A'].width, 20)
+    
+    def test_empty_rows(self):
+        """Тест записи отчета без строк данных."""
+        write_xlsx_stream(self.file_path, 'Пусто', self.headers, iter(()))
+        sheet = openpyxl.load_workbook(self.file_path)['Пусто']
+        
+        self.assertEqual(list(sheet.iter_rows(values_only=True)), [tuple(self.headers)])
+
+
+if __name__ == '__main__':
+    unittest.main()
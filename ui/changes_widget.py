@@ -24,6 +24,7 @@ from PyQt6.QtGui import QIcon, QPixmap, QFont, QColor, QPalette, QAction
 
 from utils.logger import get_module_logger, log_exception
 from utils.common import format_timestamp, get_diff_color, get_status_color, handle_errors
+from ui.updatable import Updatable
 
 
 class ChangeDetailsDialog(QDialog):
@@ -556,7 +557,7 @@ class ChangeDetailsDialog(QDialog):
         return html_result
 
 
-class ChangesWidget(QWidget):
+class ChangesWidget(QWidget, Updatable):
     """Виджет для отображения изменений сайтов"""
     
     def __init__(self, app_context, parent=None):
@@ -10,23 +10,51 @@ import os
 import time
 import csv
 import datetime
+from operator import itemgetter
 from typing import Dict, List, Any, Optional, Union
 
+import numpy as np
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
     QFrame, QScrollArea, QSizePolicy, QGridLayout, QTableWidget, 
     QTableWidgetItem, QHeaderView, QProgressBar, QTabWidget,
     QSpacerItem, QMessageBox, QMenu, QFileDialog
 )
-from PyQt6.QtCore import Qt, QSize, QTimer, pyqtSignal, QRect, QPointF, QPoint, QPropertyAnimation
+from PyQt6.QtCore import Qt, QSize, QTimer, pyqtSignal, QRect, QPointF, QPoint, QPropertyAnimation, QEvent
 from PyQt6.QtGui import (
     QIcon, QPixmap, QFont, QColor, QPalette, QAction, QPainter, 
-    QPen, QBrush, QPainterPath, QPaintEvent
+    QPen, QBrush, QPainterPath, QPaintEvent, QPolygonF
 )
 from PyQt6.QtWidgets import QApplication
 
 from utils.logger import get_module_logger, log_exception
 from utils.common import format_timestamp, get_diff_color, get_status_color, handle_errors
+from ui.updatable import Updatable
+
+# Маркер отсутствующего значения (позволяет обойтись одним поиском в словаре)
+_MISS = object()
+
+
+def _nearest_idx(ts, target):
+    """
+    Индекс ближайшей к target временной метки
+    
+    Args:
+        ts: Непустой массив временных меток, отсортированный по возрастанию
+        target: Искомая временная метка
+        
+    Returns:
+        int: Индекс ближайшей метки (при равенстве расстояний - меньший)
+    """
+    idx = int(np.searchsorted(ts, target))
+    if idx == 0:
+        return 0
+    if idx < ts.shape[0] and ts[idx] - target < target - ts[idx - 1]:
+        return idx
+    
+    # Левый сосед: при повторяющихся метках берем первую из них
+    return int(np.searchsorted(ts, ts[idx - 1]))
 
 
 class StatusCard(QFrame):
@@ -355,6 +383,11 @@ class ActivityChartWidget(QWidget):
             # Данные для графика
             self.data = []
             
+            # Версия данных (увеличивается при каждом изменении self.data)
+            # и версия, по которой собраны массивы
+            self._data_version = 0
+            self._arrays_version = 0
+            
             # Ограничение количества точек
             self.max_points = 100
             
@@ -363,6 +396,19 @@ class ActivityChartWidget(QWidget):
                 'last_cleanup': datetime.datetime.now()
             }
             
+            # Массивы данных (SoA) для векторизованной отрисовки.
+            # FP64 хранится для точных min/max, FP32 - для экранной арифметики.
+            self._ts_seconds = np.empty(0, dtype=np.float64)
+            self._values = np.empty(0, dtype=np.float64)
+            self._ts_rel_f32 = np.empty(0, dtype=np.float32)
+            self._values_f32 = np.empty(0, dtype=np.float32)
+            
+            # Коэффициенты преобразования в экранные координаты
+            self._t0 = 0.0
+            self._t_span_inv = 1.0
+            self._v0 = 0.0
+            self._v_span_inv = 1.0
+            
             # Настройка размеров
             self.setMinimumSize(400, 200)
             self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
@@ -556,8 +602,11 @@ class ActivityChartWidget(QWidget):
             # Сохраняем старые данные
             old_data = self.data.copy()
             
-            # Добавляем новую точку
+            # Добавляем новую точку, сохраняя упорядоченность по времени
             self.data.append((timestamp, checks))
+            if len(self.data) > 1 and self.data[-2][0] > timestamp:
+                self.data.sort(key=itemgetter(0))
+            self._data_version += 1
             
             # Очищаем кэш
             self._cleanup_cache()
@@ -593,8 +642,9 @@ class ActivityChartWidget(QWidget):
             # Сохраняем старые данные
             old_data = self.data.copy()
             
-            # Обновляем данные
-            self.data = data
+            # Обновляем данные (график рассчитывает на сортировку по времени)
+            self.data = sorted(data, key=itemgetter(0))
+            self._data_version += 1
             
             # Ограничиваем количество точек
             self._limit_data_points()
@@ -644,12 +694,14 @@ class ActivityChartWidget(QWidget):
             self._data_cache['rect'] = rect
             self._data_cache['data'] = self.data.copy()
             
+            # Обновляем массивы данных
+            self._update_arrays()
+            
             # Вычисляем масштаб
             if self.data:
-                # Находим диапазон времени
-                timestamps = [d[0] for d in self.data]
-                min_time = min(timestamps)
-                max_time = max(timestamps)
+                # Находим диапазон времени (данные отсортированы по времени)
+                min_time = self.data[0][0]
+                max_time = self.data[-1][0]
                 time_range = (max_time - min_time).total_seconds()
                 
                 # Находим диапазон значений
@@ -677,11 +729,41 @@ class ActivityChartWidget(QWidget):
             log_exception(self.logger, "Ошибка обновления кэша")
             return False
     
-    @handle_errors(error_msg="Ошибка при отрисовке графика")
+    def _update_arrays(self):
+        """Пересобирает массивы временных меток и значений из self.data"""
+        self._arrays_version = self._data_version
+        count = len(self.data)
+        self._ts_seconds = np.fromiter(
+            (d[0].timestamp() for d in self.data), dtype=np.float64, count=count
+        )
+        self._values = np.fromiter(
+            (d[1] for d in self.data), dtype=np.float64, count=count
+        )
+        
+        # В FP32 переводим только относительное время: абсолютные
+        # UNIX-метки в FP32 теряют точность до минут
+        if count:
+            self._t0 = float(self._ts_seconds.min())
+            self._t_span_inv = 1.0 / max(1.0, float(self._ts_seconds.max()) - self._t0)
+            self._v0 = float(self._values.min())
+            self._v_span_inv = 1.0 / max(1.0, float(self._values.max()) - self._v0)
+            self._ts_rel_f32 = (self._ts_seconds - self._t0).astype(np.float32)
+        else:
+            self._t0 = 0.0
+            self._t_span_inv = 1.0
+            self._v0 = 0.0
+            self._v_span_inv = 1.0
+            self._ts_rel_f32 = np.empty(0, dtype=np.float32)
+        self._values_f32 = self._values.astype(np.float32)
+    
     def paintEvent(self, event: QPaintEvent):
         """
         Обработчик события отрисовки
         
+        Единственная точка перехвата ошибок для всей цепочки отрисовки:
+        вспомогательные методы _draw_grid/_draw_data/_get_time_range
+        исключения не перехватывают.
+        
         Args:
             event: Событие отрисовки
         """
@@ -690,15 +772,16 @@ class ActivityChartWidget(QWidget):
             
             # Создаем объект для рисования
             painter = QPainter(self)
-            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
             
             # Обновляем кэш если нужно
             self._update_cache(rect)
             
-            # Рисуем сетку
+            # Рисуем сетку (целочисленные линии, сглаживание не нужно)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
             self._draw_grid(painter, rect)
             
-            # Рисуем данные
+            # Рисуем данные со сглаживанием
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
             self._draw_data(painter, rect)
             
             # Рисуем курсор и подсказку
@@ -848,16 +931,21 @@ class ActivityChartWidget(QWidget):
             if not time_range:
                 return None
                 
+            # Массивы могли устареть, если после изменения данных отрисовки еще не было
+            if self._arrays_version != self._data_version:
+                self._update_arrays()
+            ts = self._ts_seconds
+                
             # Находим ближайшую точку по времени
-            target_time = time_range[0] + (time_range[1] - time_range[0]) * (x / rect.width())
-            closest_time = min(self.data, key=lambda p: abs((p[0] - target_time).total_seconds()))
+            time_span = (time_range[1] - time_range[0]).total_seconds()
+            target = time_range[0].timestamp() + time_span * (x / rect.width())
+            idx = _nearest_idx(ts, target)
             
             # Проверяем, достаточно ли близко точка
-            time_diff = abs((closest_time[0] - target_time).total_seconds())
-            if time_diff > (time_range[1] - time_range[0]).total_seconds() / len(self.data):
+            if abs(ts[idx] - target) > time_span / len(self.data):
                 return None
                 
-            return closest_time[1]
+            return self.data[idx][1]
             
         except Exception as e:
             self.logger.error(f"Ошибка при получении значения в позиции ({x}, {y}): {e}")
@@ -872,33 +960,28 @@ class ActivityChartWidget(QWidget):
             painter: Объект QPainter
             rect: Прямоугольник для отрисовки
         """
-        try:
-            # Настройки для сетки
-            painter.setPen(QPen(QColor(0, 0, 0, 30), 1, Qt.PenStyle.DotLine))
-            
-            # Горизонтальные линии (5 линий)
-            for i in range(1, 5):
-                y = rect.top() + i * rect.height() / 5
-                painter.drawLine(
-                    rect.left(),
-                    int(y),
-                    rect.right(),
-                    int(y)
-                )
-                
-            # Вертикальные линии (5 линий)
-            for i in range(1, 5):
-                x = rect.left() + i * rect.width() / 5
-                painter.drawLine(
-                    int(x),
-                    rect.top(),
-                    int(x),
-                    rect.bottom()
-                )
-                
-        except Exception as e:
-            self.logger.error(f"Ошибка при отрисовке сетки: {e}")
-            log_exception(self.logger, "Ошибка отрисовки сетки")
+        # Настройки для сетки
+        painter.setPen(QPen(QColor(0, 0, 0, 30), 1, Qt.PenStyle.DotLine))
+        
+        # Горизонтальные линии (5 линий)
+        for i in range(1, 5):
+            y = rect.top() + i * rect.height() / 5
+            painter.drawLine(
+                rect.left(),
+                int(y),
+                rect.right(),
+                int(y)
+            )
+            
+        # Вертикальные линии (5 линий)
+        for i in range(1, 5):
+            x = rect.left() + i * rect.width() / 5
+            painter.drawLine(
+                int(x),
+                rect.top(),
+                int(x),
+                rect.bottom()
+            )
     
     def _draw_data(self, painter: QPainter, rect: QRect):
         """
@@ -908,73 +991,115 @@ class ActivityChartWidget(QWidget):
             painter: Объект QPainter
             rect: Прямоугольник для отрисовки
         """
-        try:
-            if not self.data or len(self.data) < 2:
-                return
-                
-            if 'min_time' not in self._data_cache or 'max_time' not in self._data_cache:
-                return
-                
-            if 'min_value' not in self._data_cache or 'max_value' not in self._data_cache:
-                return
-                
-            min_time = self._data_cache['min_time']
-            max_time = self._data_cache['max_time']
-            min_value = self._data_cache['min_value']
-            max_value = self._data_cache['max_value']
-            
-            # Настройки для линии
-            painter.setPen(QPen(QColor("#3182CE"), 2))
-            
-            # Путь для графика
-            path = QPainterPath()
-            first_point = True
-            
-            # Строим путь
-            for timestamp, value in self.data:
-                # Вычисляем координаты
-                x = rect.left() + rect.width() * (timestamp - min_time).total_seconds() / max(1, (max_time - min_time).total_seconds())
-                y = rect.bottom() - rect.height() * (value - min_value) / max(1, max_value - min_value)
-                
-                # Добавляем точку в путь
-                if first_point:
-                    path.moveTo(x, y)
-                    first_point = False
-                else:
-                    path.lineTo(x, y)
-                    
-            # Рисуем путь
-            painter.drawPath(path)
+        data = self.data
+        if not data or len(data) < 2:
+            return
+            
+        # Снимок кэша: один поиск на ключ вместо пары "in" + "[]"
+        cache = self._data_cache
+        bounds = (
+            cache.get('min_time'), cache.get('max_time'),
+            cache.get('min_value'), cache.get('max_value')
+        )
+        if None in bounds:
+            return
+            
+        ts_rel = self._ts_rel_f32
+        values = self._values_f32
+        if len(ts_rel) != len(data):
+            return
+        
+        left = rect.left()
+        bottom = rect.bottom()
+        width = rect.width()
+        height = rect.height()
+        
+        # Экранные координаты считаем в FP32: точности хватает для пикселей,
+        # а объем памяти вдвое меньше. В QPointF значения попадают уже как qreal.
+        # Коэффициенты считаются один раз за отрисовку, на точку - умножение и сложение.
+        kx = np.float32(width * self._t_span_inv)
+        ky = np.float32(height * self._v_span_inv)
+        x0 = np.float32(left)
+        y0 = np.float32(bottom + self._v0 * ky)
+        xs = x0 + ts_rel * kx
+        ys = y0 - values * ky
+        
+        # Для плотных рядов оставляем не больше двух точек на пиксель
+        if len(xs) >= 2 * width:
+            xs, ys = self._decimate(xs, ys)
+        
+        # Настройки для линии
+        painter.setPen(QPen(QColor("#3182CE"), 2))
+        
+        # Строим ломаную
+        polygon = QPolygonF([QPointF(x, y) for x, y in zip(xs.tolist(), ys.tolist())])
+        
+        # Рисуем ломаную
+        painter.drawPolyline(polygon)
+    
+    @staticmethod
+    def _decimate(xs: np.ndarray, ys: np.ndarray):
+        """
+        Прореживает точки, попадающие в один столбец пикселей
+        
+        Для каждой серии точек с одинаковой целой X-координатой остаются
+        две точки - минимум и максимум по Y, так что вертикальный размах
+        графика сохраняется.
+        
+        Args:
+            xs: Экранные X-координаты (по возрастанию)
+            ys: Экранные Y-координаты
             
-        except Exception as e:
-            self.logger.error(f"Ошибка при отрисовке данных: {e}")
-            log_exception(self.logger, "Ошибка отрисовки данных")
+        Returns:
+            tuple: Прореженные массивы (xs, ys)
+        """
+        px = xs.astype(np.int32)
+        
+        # Начала серий с одинаковым пикселем
+        mask = np.empty(len(px), dtype=bool)
+        mask[0] = True
+        mask[1:] = px[1:] != px[:-1]
+        starts = np.flatnonzero(mask)
+        
+        y_min = np.minimum.reduceat(ys, starts)
+        y_max = np.maximum.reduceat(ys, starts)
+        
+        out_xs = np.repeat(xs[starts], 2)
+        out_ys = np.empty(2 * len(starts), dtype=ys.dtype)
+        out_ys[0::2] = y_min
+        out_ys[1::2] = y_max
+        
+        return out_xs, out_ys
     
     def _get_time_range(self):
         """
         Получает диапазон времени для графика
         
+        self.data всегда отсортирован по времени (см. add_data_point и
+        _update_activity_chart), поэтому диапазон - это первая и последняя точки.
+        
         Returns:
             tuple: Кортеж (min_time, max_time) или None если данных нет
         """
-        try:
-            if not self.data:
-                return None
-                
-            timestamps = [d[0] for d in self.data]
-            min_time = min(timestamps)
-            max_time = max(timestamps)
-            
-            return (min_time, max_time)
-            
-        except Exception as e:
-            self.logger.error(f"Ошибка при получении диапазона времени: {e}")
-            log_exception(self.logger, "Ошибка получения диапазона времени")
+        if not self.data:
             return None
+            
+        return (self.data[0][0], self.data[-1][0])
 
-class DashboardWidget(QWidget):
+class DashboardWidget(QWidget, Updatable):
     """Виджет панели мониторинга"""
     
+    # Панель обновляется собственным таймером (см. showEvent/hideEvent)
+    self_refreshing = True
+    
+    # Соответствие ключей данных API и карточек статуса
+    _STATUS_KEYS = (
+        ('total_sites', 'status_sites'),
+        ('active_sites', 'status_active'),
+        ('sites_with_changes', 'status_changes'),
+        ('sites_with_errors', 'status_errors'),
+    )
+    
     def __init__(self, app_context, parent=None):
         """
         Инициализация виджета панели мониторинга
@@ -991,18 +1116,22 @@ class DashboardWidget(QWidget):
         try:
             self.app_context = app_context
             
+            # Последние отображенные значения карточек статуса
+            self._last_dashboard = {}
+            
             # Основной макет
             layout = QVBoxLayout(self)
             layout.setContentsMargins(10, 10, 10, 10)
             layout.setSpacing(10)
             
-            # Контроллер обновления данных
+            # Контроллер обновления данных. Таймер работает только пока
+            # панель видна: запуск и первая загрузка данных - в showEvent
             self.update_timer = QTimer(self)
+            self.update_timer.setInterval(60000)  # Обновление каждую минуту
             self.update_timer.timeout.connect(self.update_data)
-            self.update_timer.start(60000)  # Обновление каждую минуту
             
-            # Загружаем данные при инициализации
-            self.update_data()
+            # Окно верхнего уровня, за сворачиванием которого следим
+            self._watched_window = None
             
             self.logger.debug("Виджет панели мониторинга успешно инициализирован")
             
@@ -1011,6 +1140,60 @@ class DashboardWidget(QWidget):
             log_exception(self.logger, "Ошибка инициализации виджета панели мониторинга")
             raise
     
+    def showEvent(self, event):
+        """
+        Обработчик показа виджета: обновляет данные и запускает таймер
+        
+        Args:
+            event: Событие показа
+        """
+        super().showEvent(event)
+        try:
+            # Отслеживаем сворачивание окна, в котором находится панель
+            window = self.window()
+            if window is not self and window is not self._watched_window:
+                if self._watched_window is not None:
+                    self._watched_window.removeEventFilter(self)
+                window.installEventFilter(self)
+                self._watched_window = window
+                
+            self._resume_updates()
+        except Exception as e:
+            self.logger.error(f"Ошибка при показе панели мониторинга: {e}")
+            log_exception(self.logger, "Ошибка показа панели мониторинга")
+    
+    def hideEvent(self, event):
+        """
+        Обработчик скрытия виджета: останавливает таймер обновления
+        
+        Args:
+            event: Событие скрытия
+        """
+        super().hideEvent(event)
+        self.update_timer.stop()
+    
+    def eventFilter(self, obj, event):
+        """
+        Останавливает обновления, пока окно приложения свернуто
+        
+        Args:
+            obj: Объект-источник события
+            event: Событие
+        """
+        if obj is self._watched_window and event.type() == QEvent.Type.WindowStateChange:
+            if obj.windowState() & Qt.WindowState.WindowMinimized:
+                self.update_timer.stop()
+            elif self.isVisible():
+                self._resume_updates()
+        return super().eventFilter(obj, event)
+    
+    def _resume_updates(self):
+        """Сразу обновляет данные и запускает таймер, если он остановлен"""
+        if self.update_timer.isActive():
+            return
+        self.update_data()
+        self.update_timer.start()
+    
     def update_data(self):
         """Обновляет данные на панели мониторинга"""
         try:
@@ -1155,18 +1338,14 @@ class DashboardWidget(QWidget):
                 self.logger.error(f"Некорректный формат данных: {type(data)}")
                 return
                 
-            # Обновляем карточки статуса
-            if 'total_sites' in data:
-                self.status_sites.update_value(data['total_sites'])
-                
-            if 'active_sites' in data:
-                self.status_active.update_value(data['active_sites'])
-                
-            if 'sites_with_changes' in data:
-                self.status_changes.update_value(data['sites_with_changes'])
-                
-            if 'sites_with_errors' in data:
-                self.status_errors.update_value(data['sites_with_errors'])
+            # Обновляем карточки статуса только при изменении значений
+            last = self._last_dashboard
+            get = data.get
+            for key, attr in self._STATUS_KEYS:
+                value = get(key, _MISS)
+                if value is not _MISS and last.get(key, _MISS) != value:
+                    getattr(self, attr).update_value(value)
+                    last[key] = value
                 
             # Обновляем таблицы и графики
             # ... (тут можно добавить обновление других виджетов)
@@ -1191,7 +1370,8 @@ class DashboardWidget(QWidget):
                 
             self.update_timer.stop()
             self.update_timer.setInterval(interval * 1000)
-            self.update_timer.start()
+            if self.isVisible():
+                self.update_timer.start()
             
             self.logger.debug(f"Установлен интервал обновления: {interval} сек.")
             
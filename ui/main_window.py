@@ -9,7 +9,11 @@
 import os
 import sys
 import time
+import asyncio
 import logging
+import threading
+import concurrent.futures
+from functools import lru_cache
 import webbrowser
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union
@@ -17,11 +21,16 @@ from typing import Dict, List, Any, Optional, Union
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QTabWidget, QPushButton, QLabel, QStatusBar, QMessageBox, 
-    QFrame, QSplitter, QToolBar, QDialog, QMenu, QFileDialog,
+    QSplitter, QToolBar, QDialog, QMenu, QFileDialog,
     QCheckBox, QComboBox, QLineEdit, QFormLayout, QListWidget
 )
-from PyQt6.QtCore import Qt, QSize, QTimer, QThread, pyqtSignal, QSettings
-from PyQt6.QtGui import QIcon, QAction, QPixmap, QFont, QColor, QPalette
+from PyQt6.QtCore import (
+    Qt, QSize, QTimer, QThread, QObject, QEvent, QMetaObject,
+    pyqtSignal, pyqtSlot, QSettings
+)
+from PyQt6.QtGui import QIcon, QAction, QPixmap, QPixmapCache, QFont, QColor, QPalette
+import qasync
+from qasync import asyncSlot
 
 from utils.logger import get_module_logger, log_exception
 from core.app_context import AppContext
@@ -30,12 +39,146 @@ from ui.sites_widget import SitesWidget
 from ui.changes_widget import ChangesWidget
 from ui.settings_widget import SettingsWidget
 from ui.about_dialog import AboutDialog
+from ui.updatable import Updatable
 from utils.common import format_timestamp, get_diff_color, get_status_color, handle_errors
 
 
+@lru_cache(maxsize=64)
+def _format_check_time(timestamp) -> str:
+    """
+    Форматирование времени проверки с кэшированием: значения меняются
+    не чаще одного раза за период проверки, а строка состояния
+    собирается при каждом изменении статуса
+    
+    Args:
+        timestamp: Временная метка
+        
+    Returns:
+        str: Отформатированная строка
+    """
+    return format_timestamp(timestamp)
+
+
+class _Icons:
+    """
+    Кэш иконок приложения: каждый файл декодируется один раз, пиксмапы
+    хранятся в QPixmapCache, а готовые QIcon - в словаре класса
+    """
+    
+    # Иконки главного окна, загружаемые заранее
+    NAMES = ("play", "stop", "refresh", "add", "backup", "info", "exit", "app_icon")
+    
+    _cache: Dict[str, QIcon] = {}
+    
+    @staticmethod
+    def _pixmap(name: str) -> QPixmap:
+        """
+        Получение пиксмапа иконки из QPixmapCache (с загрузкой при отсутствии)
+        
+        Args:
+            name: Имя иконки в resources/icons
+            
+        Returns:
+            QPixmap: Пиксмап иконки
+        """
+        key = f"wdm_icon_{name}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            pixmap = QPixmap(f"resources/icons/{name}.png")
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
+    
+    @classmethod
+    def preload(cls):
+        """Предварительная загрузка иконок главного окна"""
+        for name in cls.NAMES:
+            cls._pixmap(name)
+    
+    @classmethod
+    def get(cls, name: str) -> QIcon:
+        """
+        Получение иконки по имени файла (без расширения)
+        
+        Args:
+            name: Имя иконки в resources/icons
+            
+        Returns:
+            QIcon: Иконка
+        """
+        icon = cls._cache.get(name)
+        if icon is None:
+            icon = cls._cache[name] = QIcon(cls._pixmap(name))
+        return icon
+
+
+class StatusWorker(QObject):
+    """Получение статуса приложения в отдельном потоке"""
+    
+    # Сигнал с полученным статусом (обрабатывается в GUI-потоке)
+    status_ready = pyqtSignal(dict)
+    
+    def __init__(self, app_context):
+        """
+        Инициализация обработчика статуса
+        
+        Args:
+            app_context: Контекст приложения
+        """
+        super().__init__()
+        self.app_context = app_context
+        self.logger = get_module_logger('ui.main_window.status_worker')
+    
+    @pyqtSlot()
+    def poll(self):
+        """Запрашивает статус приложения и передает его в GUI-поток"""
+        try:
+            status = self.app_context.get_status()
+            if status:
+                self.status_ready.emit(status)
+        except Exception as e:
+            self.logger.error(f"Ошибка при получении статуса приложения: {e}")
+            log_exception(self.logger, "Ошибка получения статуса приложения")
+
+
 class MainWindow(QMainWindow):
     """Главное окно приложения"""
     
+    # Запрос внеочередного опроса статуса (выполняется в потоке StatusWorker)
+    _poll_requested = pyqtSignal()
+    
+    # Вкладки: (атрибут окна, заголовок, класс виджета)
+    _TABS = (
+        ("dashboard_widget", "Панель управления", DashboardWidget),
+        ("sites_widget", "Сайты", SitesWidget),
+        ("changes_widget", "Изменения", ChangesWidget),
+        ("settings_widget", "Настройки", SettingsWidget),
+    )
+    
+    # Интервалы опроса статуса (мс): частый при активном мониторинге,
+    # редкий в простое, когда динамические поля статуса не меняются
+    _STATUS_INTERVAL_ACTIVE = 250
+    _STATUS_INTERVAL_IDLE = 5000
+    
+    # Отображение состояния мониторинга:
+    # (активен, статус) -> (текст строки состояния, текст действия, иконка действия)
+    _MONITORING_STATES = {
+        (True, 'running'): (
+            '<span style="color: green;">Мониторинг: Активен</span>',
+            "Остановить мониторинг",
+            "stop",
+        ),
+        (True, 'paused'): (
+            '<span style="color: orange;">Мониторинг: Приостановлен</span>',
+            "Возобновить мониторинг",
+            "play",
+        ),
+        (False, None): (
+            '<span style="color: red;">Мониторинг: Остановлен</span>',
+            "Запустить мониторинг",
+            "play",
+        ),
+    }
+    
     def __init__(self, app_context=None):
         """
         Инициализация главного окна
@@ -51,29 +194,58 @@ class MainWindow(QMainWindow):
         # Получение контекста приложения
         self.app_context = app_context if app_context else AppContext()
         
-        # Сохранение настроек
-        self.settings = QSettings("WDM", "WebDiffer")
+        # Признак того, что окно закрыто и идет завершение работы
+        self._shutting_down = False
+        
+        # Пул потоков для долгих операций ввода-вывода (резервное копирование)
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="wdm-io"
+        )
+        
+        # Хранилище настроек окна (единое для сохранения и восстановления)
+        self.settings = QSettings("WDM", "WDM_V12")
         
         # Настройка основного окна
         self.setWindowTitle("WDM v12 - Система мониторинга веб-сайтов")
-        self.resize(1200, 800)
         
-        # Центрирование окна на экране
-        self.center_window()
-        
-        # Установка иконки
-        self.setWindowIcon(QIcon("resources/icons/app_icon.png"))
+        # Загрузка иконок и установка иконки окна
+        _Icons.preload()
+        self.setWindowIcon(_Icons.get("app_icon"))
         
         # Инициализация UI
         self._init_ui()
         
-        # Таймер для обновления статуса
+        # Последний отображенный статус (для пропуска неизменных обновлений)
+        self._last_status = None
+        
+        # Текст последней ошибки обновления статуса (ошибка выводится один раз)
+        self._status_error = None
+        
+        # Статус запрашивается в отдельном потоке, а в GUI-потоке
+        # выполняется только обновление меток (_apply_status)
+        self.status_thread = QThread(self)
+        self.status_worker = StatusWorker(self.app_context)
+        self.status_worker.moveToThread(self.status_thread)
+        self.status_worker.status_ready.connect(self._apply_status)
+        self._poll_requested.connect(self.status_worker.poll)
+        self.status_thread.start()
+        
+        # Таймер для обновления статуса. Опрос частый, но дешевый:
+        # если статус не изменился, строка состояния не трогается.
+        # Таймеры запускаются в showEvent и останавливаются, пока окно
+        # скрыто или свернуто
         self.status_timer = QTimer(self)
-        self.status_timer.timeout.connect(self.update_status_bar)
-        self.status_timer.start(1000)  # Обновление каждую секунду
+        self.status_timer.setInterval(self._STATUS_INTERVAL_IDLE)
+        self.status_timer.timeout.connect(self.status_worker.poll)
+        
+        # Отдельный, более редкий таймер для обновления активной вкладки,
+        # чтобы обновление строки состояния не вызывало перерисовку вкладок
+        self.tab_update_timer = QTimer(self)
+        self.tab_update_timer.setInterval(5000)
+        self.tab_update_timer.timeout.connect(self._update_current_tab)
         
-        # Восстановление геометрии и состояния
-        self.restore_window_state()
+        # Геометрия окна применяется один раз после показа окна
+        QTimer.singleShot(0, self._apply_geometry)
         
         self.logger.debug("Главное окно инициализировано")
     
@@ -94,16 +266,28 @@ class MainWindow(QMainWindow):
         self.tab_widget = QTabWidget(self)
         main_layout.addWidget(self.tab_widget)
         
-        # Создание и добавление виджетов вкладок
-        self.dashboard_widget = DashboardWidget(self.app_context, self)
-        self.sites_widget = SitesWidget(self.app_context, self)
-        self.changes_widget = ChangesWidget(self.app_context, self)
-        self.settings_widget = SettingsWidget(self.app_context, self)
+        # Вкладки, поддерживающие обновление данных (индекс -> виджет).
+        # Заполняется по мере создания вкладок
+        self._updatable_tabs = {}
         
-        self.tab_widget.addTab(self.dashboard_widget, "Панель управления")
-        self.tab_widget.addTab(self.sites_widget, "Сайты")
-        self.tab_widget.addTab(self.changes_widget, "Изменения")
-        self.tab_widget.addTab(self.settings_widget, "Настройки")
+        # Добавление вкладок. Вместо виджетов добавляются заглушки с фабрикой,
+        # настоящий виджет создается при первом выборе вкладки.
+        # Перерисовка и сигналы на время построения отключены
+        self.tab_widget.setUpdatesEnabled(False)
+        self.tab_widget.blockSignals(True)
+        try:
+            for attr_name, title, widget_class in self._TABS:
+                setattr(self, attr_name, None)
+                placeholder = QWidget()
+                placeholder.attr_name = attr_name
+                placeholder.factory = lambda cls=widget_class: cls(self.app_context, self)
+                self.tab_widget.addTab(placeholder, title)
+            
+            # Текущая вкладка нужна сразу
+            self._build_tab(self.tab_widget.currentIndex())
+        finally:
+            self.tab_widget.blockSignals(False)
+            self.tab_widget.setUpdatesEnabled(True)
         
         # Создание строки состояния
         self._create_status_bar()
@@ -117,10 +301,11 @@ class MainWindow(QMainWindow):
         toolbar.setIconSize(QSize(24, 24))
         toolbar.setMovable(False)
         self.addToolBar(toolbar)
+        self.toolbar = toolbar
         
         # Кнопка запуска/остановки мониторинга
         self.action_toggle_monitoring = QAction(
-            QIcon("resources/icons/play.png"), 
+            _Icons.get("play"), 
             "Запустить мониторинг", 
             self
         )
@@ -129,7 +314,7 @@ class MainWindow(QMainWindow):
         
         # Кнопка проверки всех сайтов
         self.action_check_all = QAction(
-            QIcon("resources/icons/refresh.png"), 
+            _Icons.get("refresh"), 
             "Проверить все сайты", 
             self
         )
@@ -140,7 +325,7 @@ class MainWindow(QMainWindow):
         
         # Кнопка добавления сайта
         self.action_add_site = QAction(
-            QIcon("resources/icons/add.png"), 
+            _Icons.get("add"), 
             "Добавить сайт", 
             self
         )
@@ -149,7 +334,7 @@ class MainWindow(QMainWindow):
         
         # Кнопка резервного копирования
         self.action_backup = QAction(
-            QIcon("resources/icons/backup.png"), 
+            _Icons.get("backup"), 
             "Создать резервную копию", 
             self
         )
@@ -160,7 +345,7 @@ class MainWindow(QMainWindow):
         
         # Кнопка "О программе"
         self.action_about = QAction(
-            QIcon("resources/icons/info.png"), 
+            _Icons.get("info"), 
             "О программе", 
             self
         )
@@ -169,7 +354,7 @@ class MainWindow(QMainWindow):
         
         # Кнопка выхода
         self.action_exit = QAction(
-            QIcon("resources/icons/exit.png"), 
+            _Icons.get("exit"), 
             "Выход", 
             self
         )
@@ -181,129 +366,169 @@ class MainWindow(QMainWindow):
         self.statusbar = QStatusBar(self)
         self.setStatusBar(self.statusbar)
         
-        # Информация о мониторинге
-        self.status_monitoring = QLabel("Мониторинг: остановлен")
-        self.statusbar.addWidget(self.status_monitoring)
-        
-        # Разделитель
-        separator1 = QFrame()
-        separator1.setFrameShape(QFrame.Shape.VLine)
-        separator1.setFrameShadow(QFrame.Shadow.Sunken)
-        self.statusbar.addWidget(separator1)
-        
-        # Информация о количестве сайтов
-        self.status_sites = QLabel("Сайтов: 0")
-        self.statusbar.addWidget(self.status_sites)
-        
-        # Разделитель
-        separator2 = QFrame()
-        separator2.setFrameShape(QFrame.Shape.VLine)
-        separator2.setFrameShadow(QFrame.Shadow.Sunken)
-        self.statusbar.addWidget(separator2)
-        
-        # Информация о количестве активных задач
-        self.status_workers = QLabel("Активных задач: 0")
-        self.statusbar.addWidget(self.status_workers)
-        
-        # Разделитель
-        separator3 = QFrame()
-        separator3.setFrameShape(QFrame.Shape.VLine)
-        separator3.setFrameShadow(QFrame.Shadow.Sunken)
-        self.statusbar.addWidget(separator3)
-        
-        # Информация о количестве изменений
-        self.status_changes = QLabel("Изменений: 0")
-        self.statusbar.addWidget(self.status_changes)
-        
-        # Растягивающийся элемент
-        self.statusbar.addPermanentWidget(QWidget(), 1)
+        # Вся динамическая информация выводится одной меткой, чтобы
+        # обновление строки состояния обходилось одним вызовом setText
+        self._monitoring_text = self._MONITORING_STATES[(False, None)][0]
+        self.status_label = QLabel(self._monitoring_text)
+        self.status_label.setTextFormat(Qt.TextFormat.RichText)
+        self.statusbar.addWidget(self.status_label, 1)
         
         # Версия приложения
         self.status_version = QLabel("WDM v12.0")
         self.statusbar.addPermanentWidget(self.status_version)
     
-    @handle_errors(error_msg="Ошибка при обновлении статусной строки")
     def update_status_bar(self):
-        """Обновление статусной строки"""
+        """Немедленное обновление статусной строки (вне очереди опроса)"""
         try:
-            status = self.app_context.get_status()
-            if not status:
+            self._apply_status(self.app_context.get_status())
+        except Exception as e:
+            self.logger.error(f"Ошибка при получении статуса приложения: {e}")
+            log_exception(self.logger, "Ошибка получения статуса приложения")
+    
+    def _apply_status(self, status: dict):
+        """
+        Отображение статуса приложения в строке состояния
+        
+        Args:
+            status: Статус приложения
+        """
+        try:
+            if not status or not self.isVisible():
                 return
             
-            # Статус мониторинга
-            monitoring_active = status.get('monitoring_active', False)
-            monitoring_status = status.get('monitoring_status', 'stopped')
-            
-            if monitoring_active:
-                if monitoring_status == 'running':
-                    self.status_monitoring.setText("Мониторинг: Активен")
-                    self.status_monitoring.setStyleSheet("color: green;")
-                    self.action_toggle_monitoring.setText("Остановить мониторинг")
-                    self.action_toggle_monitoring.setIcon(QIcon("resources/icons/stop.png"))
-                elif monitoring_status == 'paused':
-                    self.status_monitoring.setText("Мониторинг: Приостановлен")
-                    self.status_monitoring.setStyleSheet("color: orange;")
-                    self.action_toggle_monitoring.setText("Возобновить мониторинг")
-                    self.action_toggle_monitoring.setIcon(QIcon("resources/icons/play.png"))
-            else:
-                self.status_monitoring.setText("Мониторинг: Остановлен")
-                self.status_monitoring.setStyleSheet("color: red;")
-                self.action_toggle_monitoring.setText("Запустить мониторинг")
-                self.action_toggle_monitoring.setIcon(QIcon("resources/icons/play.png"))
+            # Время запроса статуса меняется при каждом вызове и не отображается
+            status.pop('last_update', None)
             
-            # Количество сайтов
-            sites_count = status.get('sites_count', 0)
-            active_sites = status.get('active_sites_count', 0)
-            self.status_sites.setText(f"Сайтов: {sites_count} (активных: {active_sites})")
+            # Подстраиваем частоту опроса под состояние мониторинга
+            interval = (
+                self._STATUS_INTERVAL_ACTIVE if status.get('monitoring_active')
+                else self._STATUS_INTERVAL_IDLE
+            )
+            if self.status_timer.interval() != interval:
+                self.status_timer.setInterval(interval)
             
-            # Активные задачи
-            active_tasks = status.get('active_tasks', 0)
-            queued_tasks = status.get('queued_tasks', 0)
-            self.status_workers.setText(f"Задач: {active_tasks} активных, {queued_tasks} в очереди")
+            # Статус не изменился - обновлять нечего
+            last = self._last_status
+            if status == last:
+                return
+            self._last_status = status
             
-            # Последняя и следующая проверки
-            last_check = status.get('last_check')
-            next_check = status.get('next_check')
+            def changed(*keys):
+                return last is None or any(status.get(key) != last.get(key) for key in keys)
             
-            if last_check and next_check:
-                self.status_changes.setText(
-                    f"Последняя проверка: {format_timestamp(last_check)} | "
-                    f"Следующая проверка: {format_timestamp(next_check)}"
+            # Все изменения строки состояния и панели инструментов
+            # применяются одной перерисовкой
+            self.statusbar.setUpdatesEnabled(False)
+            self.toolbar.setUpdatesEnabled(False)
+            try:
+                # Статус мониторинга
+                if changed('monitoring_active', 'monitoring_status'):
+                    if status.get('monitoring_active', False):
+                        state = self._MONITORING_STATES.get(
+                            (True, status.get('monitoring_status', 'stopped'))
+                        )
+                    else:
+                        state = self._MONITORING_STATES[(False, None)]
+                    
+                    # Для неизвестного статуса активного мониторинга оставляем прежнее отображение
+                    if state is not None:
+                        self._monitoring_text, action_text, icon_name = state
+                        self.action_toggle_monitoring.setText(action_text)
+                        self.action_toggle_monitoring.setIcon(_Icons.get(icon_name))
+                
+                # Последняя и следующая проверки
+                last_check = status.get('last_check')
+                next_check = status.get('next_check')
+                
+                if last_check and next_check:
+                    checks_text = (
+                        f"Последняя проверка: {_format_check_time(last_check)} | "
+                        f"Следующая проверка: {_format_check_time(next_check)}"
+                    )
+                elif last_check:
+                    checks_text = f"Последняя проверка: {_format_check_time(last_check)}"
+                elif next_check:
+                    checks_text = f"Следующая проверка: {_format_check_time(next_check)}"
+                else:
+                    checks_text = "Нет данных о проверках"
+                
+                # Собираем всю строку и выводим ее одним вызовом
+                self._set_label(
+                    self.status_label,
+                    f"{self._monitoring_text} | "
+                    f"Сайтов: {status.get('sites_count', 0)} (активных: {status.get('active_sites_count', 0)}) | "
+                    f"Задач: {status.get('active_tasks', 0)} активных, {status.get('queued_tasks', 0)} в очереди | "
+                    f"{checks_text}"
                 )
-            elif last_check:
-                self.status_changes.setText(f"Последняя проверка: {format_timestamp(last_check)}")
-            elif next_check:
-                self.status_changes.setText(f"Следующая проверка: {format_timestamp(next_check)}")
-            else:
-                self.status_changes.setText("Нет данных о проверках")
+            finally:
+                self.toolbar.setUpdatesEnabled(True)
+                self.statusbar.setUpdatesEnabled(True)
+                self.statusbar.update()
             
-            # Обновляем активную вкладку
-            current_widget = self.tab_widget.currentWidget()
-            if hasattr(current_widget, "update_data"):
-                current_widget.update_data()
+            self._status_error = None
+        
+        except Exception as e:
+            # Опрос статуса частый: при повторяющейся ошибке не засоряем журнал
+            # и не открываем диалог, а показываем ошибку в строке состояния
+            self._last_status = None
+            if str(e) != self._status_error:
+                self._status_error = str(e)
+                self.logger.error(f"Ошибка при обновлении статусной строки: {e}")
+                log_exception(self.logger, "Ошибка обновления статусной строки")
+                self._set_label(self.status_label, "Ошибка обновления статусной строки (подробности в журнале)")
+    
+    @staticmethod
+    def _set_label(label: QLabel, text: str, style: Optional[str] = None):
+        """
+        Установка текста и стиля метки только при их изменении
         
+        Args:
+            label: Метка
+            text: Новый текст
+            style: Новый стиль (None - не менять)
+        """
+        if getattr(label, '_cached_text', None) != text:
+            label.setText(text)
+            label._cached_text = text
+        if style is not None and getattr(label, '_cached_style', None) != style:
+            label.setStyleSheet(style)
+            label._cached_style = style
+    
+    def _update_current_tab(self):
+        """Обновление данных активной вкладки"""
+        try:
+            # Неактивное окно не обновляем - данные подтянутся при переключении
+            if not self.isActiveWindow():
+                return
+            
+            # Вкладки с собственным таймером обновляются сами
+            widget = self._updatable_tabs.get(self.tab_widget.currentIndex())
+            if widget is not None and not widget.self_refreshing:
+                widget.update_data()
         except Exception as e:
-            self.logger.error(f"Ошибка при обновлении статусной строки: {e}")
-            log_exception(self.logger, "Ошибка обновления статусной строки")
-            self.show_message("Ошибка", f"Не удалось обновить статусную строку: {e}", QMessageBox.Icon.Critical)
+            self.logger.error(f"Ошибка при обновлении активной вкладки: {e}")
+            log_exception(self.logger, "Ошибка обновления активной вкладки")
     
-    def _toggle_monitoring(self):
+    @asyncSlot()
+    async def _toggle_monitoring(self):
         """Переключение состояния мониторинга"""
         try:
+            loop = asyncio.get_running_loop()
+            
             # Получаем текущий статус
             status = self.app_context.get_status()
             
             if status['monitoring_active']:
-                # Останавливаем мониторинг
-                if self.app_context.stop_monitoring():
+                # Останавливаем мониторинг (вне GUI-потока)
+                if await loop.run_in_executor(None, self.app_context.stop_monitoring):
                     self.logger.info("Мониторинг остановлен")
                     self.show_message("Информация", "Мониторинг остановлен")
                 else:
                     self.logger.error("Не удалось остановить мониторинг")
                     self.show_message("Ошибка", "Не удалось остановить мониторинг", QMessageBox.Icon.Critical)
             else:
-                # Запускаем мониторинг
-                if self.app_context.start_monitoring():
+                # Запускаем мониторинг (вне GUI-потока)
+                if await loop.run_in_executor(None, self.app_context.start_monitoring):
                     self.logger.info("Мониторинг запущен")
                     self.show_message("Информация", "Мониторинг запущен")
                 else:
@@ -318,21 +543,19 @@ class MainWindow(QMainWindow):
             log_exception(self.logger, "Ошибка переключения состояния мониторинга")
             self.show_message("Ошибка", f"Не удалось переключить состояние мониторинга: {e}", QMessageBox.Icon.Critical)
     
-    def _check_all_sites(self):
+    @asyncSlot()
+    async def _check_all_sites(self):
         """Проверка всех сайтов"""
         try:
-            # Запрашиваем подтверждение
-            reply = QMessageBox.question(
-                self,
+            # Запрашиваем подтверждение (без вложенного цикла событий)
+            reply = await self._ask_question(
                 "Подтверждение",
-                "Вы уверены, что хотите проверить все сайты сейчас?",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                QMessageBox.StandardButton.No
+                "Вы уверены, что хотите проверить все сайты сейчас?"
             )
             
             if reply == QMessageBox.StandardButton.Yes:
-                # Проверяем все сайты
-                if self.app_context.check_all_sites_now():
+                # Проверяем все сайты, не блокируя GUI
+                if await self.app_context.acheck_all_sites():
                     self.logger.info("Запущена проверка всех сайтов")
                     self.show_message("Информация", "Запущена проверка всех сайтов")
                 else:
@@ -346,17 +569,19 @@ class MainWindow(QMainWindow):
     
     def _add_site(self):
         """Добавление нового сайта"""
-        # Переключаемся на вкладку "Сайты"
-        for i in range(self.tab_widget.count()):
-            if isinstance(self.tab_widget.widget(i), SitesWidget):
+        # Переключаемся на вкладку "Сайты" (при необходимости она будет создана)
+        for i, (attr_name, _, _) in enumerate(self._TABS):
+            if attr_name == "sites_widget":
                 self.tab_widget.setCurrentIndex(i)
+                self._build_tab(i)
                 break
         
         # Вызываем метод добавления сайта
         if hasattr(self.sites_widget, "show_add_site_dialog"):
             self.sites_widget.show_add_site_dialog()
     
-    def _create_backup(self):
+    @asyncSlot()
+    async def _create_backup(self):
         """Создание резервной копии базы данных"""
         try:
             # Выбор директории для сохранения
@@ -372,8 +597,11 @@ class MainWindow(QMainWindow):
                 timestamp = time.strftime("%Y%m%d_%H%M%S")
                 backup_file = os.path.join(backup_dir, f"wdm_backup_{timestamp}.db")
                 
-                # Создаем резервную копию
-                backup_path = self.app_context.db_manager.backup_database(backup_file)
+                # Создаем резервную копию в пуле ввода-вывода
+                loop = asyncio.get_running_loop()
+                backup_path = await loop.run_in_executor(
+                    self._io_pool, self.app_context.db_manager.backup_database, backup_file
+                )
                 
                 if backup_path:
                     self.logger.info(f"Резервная копия создана: {backup_path}")
@@ -392,16 +620,104 @@ class MainWindow(QMainWindow):
         about_dialog = AboutDialog(self)
         about_dialog.exec()
     
+    def _start_timers(self):
+        """Запуск таймеров обновления (если они еще не запущены)"""
+        if not self.status_timer.isActive():
+            self.status_timer.start()
+            # Не ждем первого срабатывания редкого таймера
+            self._poll_requested.emit()
+        if not self.tab_update_timer.isActive():
+            self.tab_update_timer.start()
+    
+    def _stop_timers(self):
+        """Остановка таймеров обновления"""
+        self.status_timer.stop()
+        self.tab_update_timer.stop()
+    
+    def showEvent(self, event):
+        """
+        Обработчик показа окна
+        
+        Args:
+            event: Событие показа
+        """
+        super().showEvent(event)
+        self._start_timers()
+    
+    def hideEvent(self, event):
+        """
+        Обработчик скрытия окна
+        
+        Args:
+            event: Событие скрытия
+        """
+        super().hideEvent(event)
+        self._stop_timers()
+    
+    def changeEvent(self, event):
+        """
+        Обработчик изменения состояния окна: пока окно свернуто,
+        таймеры обновления остановлены
+        
+        Args:
+            event: Событие изменения
+        """
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange:
+            if self.isMinimized():
+                self._stop_timers()
+            elif self.isVisible():
+                self._start_timers()
+    
+    def _build_tab(self, index) -> bool:
+        """
+        Создание виджета вкладки вместо заглушки
+        
+        Args:
+            index: Индекс вкладки
+            
+        Returns:
+            bool: True, если виджет был создан при этом вызове
+        """
+        placeholder = self.tab_widget.widget(index)
+        factory = getattr(placeholder, "factory", None)
+        if factory is None:
+            return False
+        
+        widget = factory()
+        title = self.tab_widget.tabText(index)
+        is_current = self.tab_widget.currentIndex() == index
+        
+        # Замена вкладки не должна вызывать _on_tab_changed повторно
+        was_blocked = self.tab_widget.blockSignals(True)
+        try:
+            self.tab_widget.removeTab(index)
+            self.tab_widget.insertTab(index, widget, title)
+            if is_current:
+                self.tab_widget.setCurrentIndex(index)
+        finally:
+            self.tab_widget.blockSignals(was_blocked)
+        placeholder.deleteLater()
+        
+        setattr(self, placeholder.attr_name, widget)
+        if isinstance(widget, Updatable):
+            self._updatable_tabs[index] = widget
+        
+        self.logger.debug(f"Создана вкладка: {title}")
+        return True
+    
     def _on_tab_changed(self, index):
         """Обработчик изменения активной вкладки"""
-        # Получаем текущий виджет
-        current_widget = self.tab_widget.widget(index)
-        
-        # Обновляем данные в виджете, если есть соответствующий метод
-        if hasattr(current_widget, "update_data"):
-            current_widget.update_data()
+        # Только что созданный виджет уже загрузил свои данные
+        if self._build_tab(index):
+            return
+        
+        # Обновляем данные в виджете, если он это поддерживает;
+        # самообновляемые виджеты загружают данные сами при показе
+        widget = self._updatable_tabs.get(index)
+        if widget is not None and not widget.self_refreshing:
+            widget.update_data()
     
-    @handle_errors(error_msg="Ошибка при отображении сообщения")
     def show_message(self, title, message, icon=QMessageBox.Icon.Information):
         """
         Отображение сообщения пользователю
@@ -411,59 +727,144 @@ class MainWindow(QMainWindow):
             message: Текст сообщения
             icon: Иконка сообщения
         """
-        if icon == QMessageBox.Icon.Critical:
-            QMessageBox.critical(self, title, message)
-        elif icon == QMessageBox.Icon.Warning:
-            QMessageBox.warning(self, title, message)
-        else:
-            QMessageBox.information(self, title, message)
-    
-    @handle_errors(error_msg="Ошибка при центрировании окна")
+        # Немодальный для цикла событий диалог: open() не блокирует обработчики
+        message_box = QMessageBox(icon, title, message, QMessageBox.StandardButton.Ok, self)
+        message_box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        message_box.open()
+    
+    async def _ask_question(self, title, message):
+        """
+        Запрос подтверждения у пользователя без блокировки цикла событий
+        
+        Args:
+            title: Заголовок сообщения
+            message: Текст вопроса
+            
+        Returns:
+            QMessageBox.StandardButton: Нажатая кнопка
+        """
+        message_box = QMessageBox(
+            QMessageBox.Icon.Question,
+            title,
+            message,
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            self
+        )
+        message_box.setDefaultButton(QMessageBox.StandardButton.No)
+        message_box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        
+        reply = asyncio.get_running_loop().create_future()
+        
+        def on_finished(_result):
+            if not reply.done():
+                clicked = message_box.clickedButton()
+                reply.set_result(
+                    message_box.standardButton(clicked) if clicked
+                    else QMessageBox.StandardButton.No
+                )
+        
+        message_box.finished.connect(on_finished)
+        message_box.open()
+        return await reply
+    
     def center_window(self):
         """Центрирование окна на экране"""
+        screen = QApplication.primaryScreen()
+        if screen is None:
+            return
         frame_geometry = self.frameGeometry()
-        center_point = QApplication.primaryScreen().availableGeometry().center()
-        frame_geometry.moveCenter(center_point)
+        frame_geometry.moveCenter(screen.availableGeometry().center())
         self.move(frame_geometry.topLeft())
     
-    @handle_errors(error_msg="Ошибка при сохранении состояния окна")
     def save_window_state(self):
         """Сохранение состояния окна"""
-        settings = QSettings('WDM', 'WDM_V12')
-        settings.setValue('window_geometry', self.saveGeometry())
-        settings.setValue('window_state', self.saveState())
+        try:
+            self.settings.setValue('window_geometry', self.saveGeometry())
+            self.settings.setValue('window_state', self.saveState())
+        except Exception as e:
+            self.logger.error(f"Ошибка при сохранении состояния окна: {e}")
+            log_exception(self.logger, "Ошибка сохранения состояния окна")
     
-    @handle_errors(error_msg="Ошибка при восстановлении состояния окна")
     def restore_window_state(self):
-        """Восстановление состояния окна"""
-        settings = QSettings('WDM', 'WDM_V12')
-        geometry = settings.value('window_geometry')
-        state = settings.value('window_state')
+        """
+        Восстановление состояния окна
         
-        if geometry:
-            self.restoreGeometry(geometry)
-        if state:
-            self.restoreState(state)
+        Returns:
+            bool: True, если сохраненная геометрия окна восстановлена
+        """
+        try:
+            geometry = self.settings.value('window_geometry')
+            state = self.settings.value('window_state')
+            
+            restored = bool(geometry) and self.restoreGeometry(geometry)
+            if state:
+                self.restoreState(state)
+            
+            return restored
+        except Exception as e:
+            self.logger.error(f"Ошибка при восстановлении состояния окна: {e}")
+            log_exception(self.logger, "Ошибка восстановления состояния окна")
+            return False
+    
+    def _apply_geometry(self):
+        """Применение геометрии окна: сохраненной либо размера по умолчанию"""
+        if not self.restore_window_state():
+            self.resize(1200, 800)
+            self.center_window()
     
     @handle_errors(error_msg="Ошибка при закрытии приложения")
     def closeEvent(self, event):
         """
-        Обработчик события закрытия окна
+        Обработчик события закрытия окна.
+        Окно скрывается сразу, а остановка мониторинга и освобождение
+        ресурсов выполняются в фоновом потоке, после чего приложение
+        завершается.
         
         Args:
             event: Событие закрытия
         """
+        if self._shutting_down:
+            event.accept()
+            return
+        self._shutting_down = True
+        
         # Сохраняем состояние окна
         self.save_window_state()
         
-        # Останавливаем мониторинг
-        self.app_context.stop_monitoring()
+        # Останавливаем опрос статуса
+        self._stop_timers()
+        self.status_thread.quit()
+        self.status_thread.wait()
         
-        # Завершаем работу приложения
-        self.app_context.shutdown()
+        # Приложение завершится само по окончании фоновой остановки
+        QApplication.instance().setQuitOnLastWindowClosed(False)
+        self.hide()
         
         # Принимаем событие закрытия
         event.accept()
+        
+        threading.Thread(target=self._shutdown_bg, name="wdm-shutdown", daemon=True).start()
+    
+    def _shutdown_bg(self):
+        """Завершение работы приложения в фоновом потоке"""
+        try:
+            # Дожидаемся завершения операций ввода-вывода
+            self._io_pool.shutdown(wait=True)
+            
+            # Останавливаем мониторинг
+            self.app_context.stop_monitoring()
+            
+            # Завершаем работу приложения
+            self.app_context.shutdown()
+        
+        except Exception as e:
+            self.logger.error(f"Ошибка при завершении работы приложения: {e}")
+            log_exception(self.logger, "Ошибка завершения работы приложения")
+        
+        finally:
+            QMetaObject.invokeMethod(
+                QApplication.instance(), "quit", Qt.ConnectionType.QueuedConnection
+            )
 
 
 # Для тестирования виджета в отдельном режиме
@@ -475,4 +876,7 @@ if __name__ == "__main__":
     window = MainWindow()
     window.show()
     
-    sys.exit(app.exec()) 
\ No newline at end of file
+    loop = qasync.QEventLoop(app)
+    asyncio.set_event_loop(loop)
+    with loop:
+        loop.run_forever() 
\ No newline at end of file
@@ -7,18 +7,118 @@
 отображения статистики и текущих задач мониторинга.
 """
 
+import contextlib
+import functools
+import time
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QProgressBar,
     QTableWidget, QTableWidgetItem, QHeaderView, QGridLayout, QGroupBox,
-    QSplitter, QMenu, QStatusBar, QFrame, QSpacerItem, QSizePolicy, QMessageBox
+    QSplitter, QMenu, QStatusBar, QFrame, QSpacerItem, QSizePolicy, QMessageBox,
+    QApplication
 )
-from PyQt6.QtCore import Qt, QSize, QTimer, pyqtSignal
+from PyQt6.QtCore import Qt, QSize, QTimer, QObject, QThread, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QIcon, QFont, QAction, QColor, QBrush
 
 # Внутренние импорты
 from utils.logger import get_module_logger, log_exception
-from core.settings import Settings
-from utils.common import format_timestamp, get_diff_color, get_status_color, handle_errors
+from utils.common import get_diff_color, get_status_color, handle_errors
+
+
+@functools.lru_cache(maxsize=None)
+def _icon(name):
+    """
+    Загрузка иконки из ресурсов с кэшированием
+    
+    Args:
+        name: Имя файла иконки без расширения
+        
+    Returns:
+        QIcon: Иконка
+    """
+    return QIcon(f"resources/icons/{name}.png")
+
+
+def _stop_thread(thread):
+    """
+    Завершение потока и ожидание его остановки
+    
+    Args:
+        thread: Поток QThread
+    """
+    thread.quit()
+    thread.wait()
+
+
+@contextlib.contextmanager
+def _batched(widget):
+    """
+    Контекстный менеджер для пакетного изменения виджета.
+    Отключает перерисовку, сигналы и сортировку (для таблиц) на время
+    изменений и выполняет одну перерисовку при выходе. Вложенные вызовы
+    для уже отключенного виджета ничего не делают.
+    
+    Args:
+        widget: Изменяемый виджет
+    """
+    if not widget.updatesEnabled():
+        yield widget
+        return
+    
+    is_table = isinstance(widget, QTableWidget)
+    was_blocked = widget.blockSignals(True)
+    sorting = is_table and widget.isSortingEnabled()
+    widget.setUpdatesEnabled(False)
+    if sorting:
+        widget.setSortingEnabled(False)
+    try:
+        yield widget
+    finally:
+        if sorting:
+            widget.setSortingEnabled(True)
+        widget.blockSignals(was_blocked)
+        widget.setUpdatesEnabled(True)
+        if is_table:
+            widget.viewport().update()
+
+
+class StatsWorker(QObject):
+    """Получение статистики и задач мониторинга в отдельном потоке"""
+    
+    # Сигнал с полученными статистикой и задачами (обрабатывается в GUI-потоке)
+    statsReady = pyqtSignal(dict, list)
+    
+    # Сигнал с текстом ошибки получения данных
+    error = pyqtSignal(str)
+    
+    def __init__(self, app_context):
+        """
+        Инициализация обработчика статистики
+        
+        Args:
+            app_context: Контекст приложения
+        """
+        super().__init__()
+        self.app_context = app_context
+        self.logger = get_module_logger('ui.monitoring.stats_worker')
+    
+    @pyqtSlot()
+    def pull(self):
+        """Запрашивает статистику и активные задачи и передает их в GUI-поток"""
+        try:
+            # До первого запуска мониторинга менеджер еще не создан
+            monitor_manager = self.app_context.monitor_manager
+            if monitor_manager is None:
+                self.statsReady.emit({}, [])
+                return
+            
+            stats = monitor_manager.get_statistics() or {}
+            tasks = self.app_context.get_active_monitoring_tasks() or []
+            self.statsReady.emit(stats, list(tasks))
+        except Exception as e:
+            self.logger.error(f"Ошибка при получении статистики мониторинга: {e}")
+            log_exception(self.logger, "Ошибка получения статистики мониторинга")
+            self.error.emit(str(e))
 
 
 class MonitoringWidget(QWidget):
@@ -28,6 +128,24 @@ class MonitoringWidget(QWidget):
     отображения текущего состояния и задач мониторинга.
     """
     
+    # Интервалы обновления статистики (мс)
+    UPDATE_INTERVAL_ACTIVE = 5000
+    UPDATE_INTERVAL_IDLE = 15000
+    
+    # Стили метки статуса мониторинга
+    _STYLE_RUNNING = "font-weight: bold; color: green;"
+    _STYLE_STOPPED = "font-weight: bold; color: red;"
+    
+    # Запрос данных у StatsWorker (доставляется в его поток)
+    _pull_requested = pyqtSignal()
+    
+    # Цвета статусов задач
+    _STATUS_BRUSH = {
+        'В процессе': QBrush(QColor('blue')),
+        'Завершено': QBrush(QColor('green')),
+        'Ошибка': QBrush(QColor('red'))
+    }
+    
     def __init__(self, app_context, parent=None):
         """
         Инициализация виджета мониторинга
@@ -42,7 +160,7 @@ class MonitoringWidget(QWidget):
         self.logger.debug("Инициализация виджета мониторинга")
         
         self.app_context = app_context
-        self.settings = Settings()
+        self._parent_window = parent
         
         # Статистика мониторинга
         self.monitoring_stats = {
@@ -55,13 +173,46 @@ class MonitoringWidget(QWidget):
             'active_time': 0
         }
         
+        # Сигнатуры последних отображенных данных
+        self._last_stats_sig = None
+        self._last_tasks_sig = None
+        self._last_monitoring_status = None
+        self._refresh_pending = False
+        self._last_status_msg = None
+        self._last_progress_int = 0
+        self._label_cache = {}
+        self._last_uptime_seconds = 0
+        
+        # Момент запуска мониторинга по монотонным часам (None - остановлен)
+        self._mono_start = None
+        
         # Создание UI
         self._init_ui()
         
+        # Статистика и задачи запрашиваются в отдельном потоке,
+        # а в GUI-потоке выполняется только их отображение (_apply_stats).
+        # Поток не принадлежит виджету: при уничтожении виджета он
+        # останавливается и ожидается до удаления объекта QThread
+        self.stats_thread = QThread()
+        self.stats_worker = StatsWorker(self.app_context)
+        self.stats_worker.moveToThread(self.stats_thread)
+        self.stats_worker.statsReady.connect(self._apply_stats)
+        self.stats_worker.error.connect(self._on_stats_error)
+        self._pull_requested.connect(self.stats_worker.pull)
+        self.stats_thread.start()
+        QApplication.instance().aboutToQuit.connect(self._stop_stats_thread)
+        self.destroyed.connect(functools.partial(_stop_thread, self.stats_thread))
+        
         # Таймер обновления статистики
         self.update_timer = QTimer(self)
-        self.update_timer.timeout.connect(self._update_statistics)
-        self.update_timer.start(2000)  # Обновление каждые 2 секунды
+        self.update_timer.timeout.connect(self.stats_worker.pull)
+        self.update_timer.start(self.UPDATE_INTERVAL_ACTIVE)
+        
+        # Время работы считается локально и обновляется раз в секунду,
+        # независимо от более редкого опроса статистики
+        self.uptime_timer = QTimer(self)
+        self.uptime_timer.setInterval(1000)
+        self.uptime_timer.timeout.connect(self._tick_uptime)
         
         # Обновляем интерфейс
         self.refresh()
@@ -82,20 +233,20 @@ class MonitoringWidget(QWidget):
         
         # Кнопки управления
         self.start_button = QPushButton("Запустить мониторинг")
-        self.start_button.setIcon(QIcon("resources/icons/start.png"))
+        self.start_button.setIcon(_icon("start"))
         self.start_button.setMinimumWidth(180)
         self.start_button.clicked.connect(self._on_start_monitoring)
         control_layout.addWidget(self.start_button, 0, 0)
         
         self.stop_button = QPushButton("Остановить мониторинг")
-        self.stop_button.setIcon(QIcon("resources/icons/stop.png"))
+        self.stop_button.setIcon(_icon("stop"))
         self.stop_button.setMinimumWidth(180)
         self.stop_button.clicked.connect(self._on_stop_monitoring)
         self.stop_button.setEnabled(False)  # По умолчанию мониторинг не запущен
         control_layout.addWidget(self.stop_button, 0, 1)
         
         self.check_selected_button = QPushButton("Проверить выбранные сайты")
-        self.check_selected_button.setIcon(QIcon("resources/icons/check.png"))
+        self.check_selected_button.setIcon(_icon("check"))
         self.check_selected_button.clicked.connect(self._on_check_selected)
         control_layout.addWidget(self.check_selected_button, 1, 0, 1, 2)
         
@@ -108,7 +259,7 @@ class MonitoringWidget(QWidget):
         # Статус мониторинга
         stats_layout.addWidget(QLabel("Статус:"), 0, 0)
         self.status_label = QLabel("Остановлен")
-        self.status_label.setStyleSheet("font-weight: bold; color: red;")
+        self.status_label.setStyleSheet(self._STYLE_STOPPED)
         stats_layout.addWidget(self.status_label, 0, 1)
         
         # Время работы
@@ -154,12 +305,24 @@ class MonitoringWidget(QWidget):
         self.tasks_table.setHorizontalHeaderLabels([
             "ID", "Сайт", "URL", "Статус", "Время"
         ])
-        self.tasks_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
-        self.tasks_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-        self.tasks_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
+        # Фиксированная ширина служебных колонок, чтобы Qt не пересчитывал
+        # ширину по содержимому при каждом изменении таблицы
+        header = self.tasks_table.horizontalHeader()
+        for column, width in ((0, 80), (3, 110), (4, 120)):
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.Fixed)
+            self.tasks_table.setColumnWidth(column, width)
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
         self.tasks_table.verticalHeader().setVisible(False)
         self.tasks_table.setAlternatingRowColors(True)
         
+        # Строки таблицы задач: ключ задачи (id или позиция) -> индекс строки и последние значения
+        self._task_rows = {}
+        self._task_cache = {}
+        
+        # Пул ячеек удаленных строк для повторного использования
+        self._item_pool = []
+        
         tasks_layout.addWidget(self.tasks_table)
         
         # Добавляем группу задач в основной макет
@@ -167,158 +330,318 @@ class MonitoringWidget(QWidget):
         
         # Строка состояния
         self.status_bar = QStatusBar()
-        self.status_bar.showMessage("Мониторинг остановлен")
+        self._set_status("Мониторинг остановлен")
         main_layout.addWidget(self.status_bar)
     
-    @handle_errors(error_msg="Ошибка при обновлении данных мониторинга")
     def refresh(self):
-        """Обновление данных мониторинга"""
+        """
+        Обновление данных мониторинга.
+        Несколько вызовов в пределах одной итерации цикла событий
+        объединяются в одно обновление.
+        """
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        QTimer.singleShot(0, self._do_refresh)
+    
+    @handle_errors(error_msg="Ошибка при обновлении данных мониторинга")
+    def _do_refresh(self):
+        """Выполнение отложенного обновления данных мониторинга"""
+        self._refresh_pending = False
+        
         # Получаем статус мониторинга
         status = self.app_context.get_status()
         
-        # Обновляем статус мониторинга
-        monitoring_status = status.get('monitoring_status', 'stopped')
-        if monitoring_status == 'running':
+        with _batched(self):
+            # Обновляем статус мониторинга только при его изменении
+            running = status.get('monitoring_status', 'stopped') == 'running'
+            if running != self._last_monitoring_status:
+                self._apply_monitoring_state(running)
+        
+        # Запрашиваем статистику и таблицу задач (вне _batched: сигналы
+        # виджета там заблокированы и запрос был бы потерян)
+        self._pull_requested.emit()
+    
+    def _set_status(self, msg):
+        """
+        Вывод сообщения в строку состояния (если оно изменилось)
+        
+        Args:
+            msg: Текст сообщения
+        """
+        if msg != self._last_status_msg:
+            self.status_bar.showMessage(msg)
+            self._last_status_msg = msg
+    
+    def _apply_monitoring_state(self, running):
+        """
+        Отображение состояния мониторинга
+        
+        Args:
+            running: Запущен ли мониторинг
+        """
+        self._last_monitoring_status = running
+        if running:
             self.status_label.setText("Статус: Запущен")
-            self.status_label.setStyleSheet("color: green;")
-            self.start_button.setEnabled(False)
-            self.stop_button.setEnabled(True)
-            self.status_bar.showMessage("Мониторинг запущен и активен")
+            self.status_label.setStyleSheet(self._STYLE_RUNNING)
+            self._set_status("Мониторинг запущен и активен")
         else:
             self.status_label.setText("Статус: Остановлен")
-            self.status_label.setStyleSheet("color: red;")
-            self.start_button.setEnabled(True)
-            self.stop_button.setEnabled(False)
-            self.status_bar.showMessage("Мониторинг остановлен")
+            self.status_label.setStyleSheet(self._STYLE_STOPPED)
+            self._set_status("Мониторинг остановлен")
+        self.start_button.setEnabled(not running)
+        self.stop_button.setEnabled(running)
+        
+        if running:
+            if self._mono_start is None:
+                active_time = self.monitoring_stats['active_time'] if self.monitoring_stats['start_time'] else 0
+                self._mono_start = time.monotonic() - active_time
+            self.uptime_timer.start()
+        else:
+            self._mono_start = None
+            self.uptime_timer.stop()
         
-        # Получаем и обновляем статистику
-        self._update_statistics()
+        # При остановленном мониторинге опрашиваем реже
+        self.update_timer.setInterval(
+            self.UPDATE_INTERVAL_ACTIVE if running else self.UPDATE_INTERVAL_IDLE
+        )
+    
+    @pyqtSlot(dict, list)
+    def _apply_stats(self, stats, tasks):
+        """
+        Отображение данных, полученных от StatsWorker
         
-        # Обновляем таблицу задач
-        self._update_tasks_table()
+        Args:
+            stats: Статистика мониторинга
+            tasks: Список активных задач мониторинга
+        """
+        self._update_statistics(stats)
+        self._update_tasks_table(tasks)
+    
+    @pyqtSlot(str)
+    def _on_stats_error(self, message):
+        """
+        Обработка ошибки получения статистики
+        
+        Args:
+            message: Текст ошибки
+        """
+        self._set_status(f"Ошибка обновления статистики: {message}")
+    
+    def _stop_stats_thread(self):
+        """Остановка потока получения статистики"""
+        self.update_timer.stop()
+        self.uptime_timer.stop()
+        _stop_thread(self.stats_thread)
     
     @handle_errors(error_msg="Ошибка при обновлении статистики")
-    def _update_statistics(self):
-        """Обновление статистики мониторинга"""
-        try:
-            # Получаем статистику от менеджера мониторинга
-            stats = self.app_context.monitor_manager.get_statistics()
-            if not stats:
-                return
-            
-            # Обновляем внутреннюю статистику
-            self.monitoring_stats.update({
-                'total_sites': stats.get('total_sites', 0),
-                'checked_sites': stats.get('checked_sites', 0),
-                'failed_sites': stats.get('failed_sites', 0),
-                'queued_sites': stats.get('queued_sites', 0),
-                'detected_changes': stats.get('detected_changes', 0),
-                'start_time': stats.get('start_time'),
-                'active_time': stats.get('active_time', 0)
-            })
-            
-            # Обновляем отображение статистики
-            self._update_statistics_display()
+    def _update_statistics(self, stats):
+        """
+        Обновление статистики мониторинга
         
-        except Exception as e:
-            self.logger.error(f"Ошибка при обновлении статистики мониторинга: {e}")
-            log_exception(self.logger, "Ошибка обновления статистики мониторинга")
-            if hasattr(self.parent, "show_message"):
-                self.parent.show_message("Ошибка", f"Не удалось обновить статистику мониторинга: {e}", QMessageBox.Icon.Critical)
+        Args:
+            stats: Статистика от менеджера мониторинга
+        """
+        if not stats:
+            return
+        
+        # Пропускаем обновление, если значения не изменились
+        stats_sig = (
+            stats.get('total_sites', 0),
+            stats.get('checked_sites', 0),
+            stats.get('failed_sites', 0),
+            stats.get('queued_sites', 0),
+            stats.get('detected_changes', 0),
+            stats.get('active_time', 0)
+        )
+        if stats_sig == self._last_stats_sig:
+            return
+        self._last_stats_sig = stats_sig
+        
+        # Обновляем внутреннюю статистику
+        self.monitoring_stats.update({
+            'total_sites': stats.get('total_sites', 0),
+            'checked_sites': stats.get('checked_sites', 0),
+            'failed_sites': stats.get('failed_sites', 0),
+            'queued_sites': stats.get('queued_sites', 0),
+            'detected_changes': stats.get('detected_changes', 0),
+            'start_time': stats.get('start_time'),
+            'active_time': stats.get('active_time', 0)
+        })
+        
+        # Обновляем отображение статистики
+        self._update_statistics_display()
     
-    @handle_errors(error_msg="Ошибка при обновлении отображения статистики")
     def _update_statistics_display(self):
         """Обновление отображения статистики на виджете"""
         try:
-            # Обновляем индикаторы
-            total = self.monitoring_stats['total_sites']
-            checked = self.monitoring_stats['checked_sites']
-            
-            # Проверено сайтов
-            self.checked_sites_label.setText(f"{checked} / {total}")
-            
-            # Обнаруженные изменения
-            self.changes_detected_label.setText(str(self.monitoring_stats['detected_changes']))
-            
-            # Ошибки
-            self.failed_sites_label.setText(str(self.monitoring_stats['failed_sites']))
-            
-            # В очереди
-            self.queued_sites_label.setText(str(self.monitoring_stats['queued_sites']))
-            
-            # Обновляем прогресс-бар
-            if total > 0:
-                progress = (checked / total) * 100
-                self.progress_bar.setValue(int(progress))
-            else:
-                self.progress_bar.setValue(0)
-            
-            # Обновляем время активности
-            if self.monitoring_stats['start_time']:
-                start_time = format_timestamp(self.monitoring_stats['start_time'])
-                active_time = self.monitoring_stats['active_time']
-                hours = active_time // 3600
-                minutes = (active_time % 3600) // 60
-                seconds = active_time % 60
+            with _batched(self):
+                # Обновляем индикаторы
+                total = self.monitoring_stats['total_sites']
+                checked = self.monitoring_stats['checked_sites']
                 
-                self.uptime_label.setText(f"{hours:02d}:{minutes:02d}:{seconds:02d}")
-            else:
-                self.uptime_label.setText("00:00:00")
+                # Проверено сайтов
+                self._set_label(self.checked_sites_label, f"{checked} / {total}")
+                
+                # Обнаруженные изменения
+                self._set_label(self.changes_detected_label, str(self.monitoring_stats['detected_changes']))
+                
+                # Ошибки
+                self._set_label(self.failed_sites_label, str(self.monitoring_stats['failed_sites']))
+                
+                # В очереди
+                self._set_label(self.queued_sites_label, str(self.monitoring_stats['queued_sites']))
+                
+                # Обновляем прогресс-бар
+                progress = int((checked / total) * 100) if total > 0 else 0
+                if progress != self._last_progress_int:
+                    self.progress_bar.setValue(progress)
+                    self._last_progress_int = progress
+                
+                # Обновляем время активности. Пока мониторинг запущен, метку
+                # обновляет uptime_timer, а статистика лишь синхронизирует
+                # точку отсчета с менеджером мониторинга
+                active_time = self.monitoring_stats['active_time'] if self.monitoring_stats['start_time'] else 0
+                if self._mono_start is not None:
+                    if active_time:
+                        self._mono_start = time.monotonic() - active_time
+                    self._tick_uptime()
+                else:
+                    self._update_uptime(active_time)
         
         except Exception as e:
             self.logger.error(f"Ошибка при обновлении отображения статистики: {e}")
             log_exception(self.logger, "Ошибка обновления отображения статистики")
-            if hasattr(self.parent, "show_message"):
-                self.parent.show_message("Ошибка", f"Не удалось обновить отображение статистики: {e}", QMessageBox.Icon.Critical)
+            if hasattr(self._parent_window, "show_message"):
+                self._parent_window.show_message("Ошибка", f"Не удалось обновить отображение статистики: {e}", QMessageBox.Icon.Critical)
+    
+    def _set_label(self, label, text):
+        """
+        Установка текста метки (если он изменился)
+        
+        Args:
+            label: Метка
+            text: Новый текст
+        """
+        if self._label_cache.get(label) != text:
+            label.setText(text)
+            self._label_cache[label] = text
+    
+    def _tick_uptime(self):
+        """Обновление времени работы по монотонным часам"""
+        if self._mono_start is not None:
+            self._update_uptime(time.monotonic() - self._mono_start)
+    
+    def _update_uptime(self, active_time):
+        """
+        Обновление метки времени работы (только при смене секунды)
+        
+        Args:
+            active_time: Время работы мониторинга в секундах
+        """
+        active_time = int(active_time or 0)
+        if active_time == self._last_uptime_seconds:
+            return
+        self._last_uptime_seconds = active_time
+        
+        minutes, seconds = divmod(active_time, 60)
+        hours, minutes = divmod(minutes, 60)
+        self.uptime_label.setText("%02d:%02d:%02d" % (hours, minutes, seconds))
     
-    def _update_tasks_table(self):
-        """Обновление таблицы задач мониторинга"""
+    def _update_tasks_table(self, active_tasks):
+        """
+        Обновление таблицы задач мониторинга
+        
+        Args:
+            active_tasks: Список активных задач мониторинга
+        """
         try:
-            # Получаем список активных задач от менеджера мониторинга
-            active_tasks = self.app_context.get_active_monitoring_tasks()
+            # Ключ строки - id задачи; задачи без id различаются по позиции в списке
+            entries = []
+            for index, task in enumerate(active_tasks):
+                task_id = task.get('id')
+                key = task_id if task_id is not None else ('#', index)
+                values = (
+                    task.get('site_name', ''),
+                    task.get('url', ''),
+                    task.get('status', ''),
+                    task.get('time', '')
+                )
+                entries.append((key, task_id, values))
             
-            # Очищаем таблицу
-            self.tasks_table.setRowCount(0)
+            # Пропускаем перерисовку, если отображаемые данные задач не изменились
+            tasks_sig = tuple(entries)
+            if tasks_sig == self._last_tasks_sig:
+                return
+            self._last_tasks_sig = tasks_sig
             
-            # Заполняем таблицу
-            for task in active_tasks:
-                row_position = self.tasks_table.rowCount()
-                self.tasks_table.insertRow(row_position)
-                
-                # ID задачи
-                task_id_item = QTableWidgetItem(str(task.get('id', '')))
-                self.tasks_table.setItem(row_position, 0, task_id_item)
-                
-                # Название сайта
-                site_name_item = QTableWidgetItem(task.get('site_name', ''))
-                self.tasks_table.setItem(row_position, 1, site_name_item)
-                
-                # URL сайта
-                url_item = QTableWidgetItem(task.get('url', ''))
-                self.tasks_table.setItem(row_position, 2, url_item)
+            with _batched(self.tasks_table):
+                new_tasks = {key: (task_id, values) for key, task_id, values in entries}
                 
-                # Статус задачи
-                status = task.get('status', '')
-                status_item = QTableWidgetItem(status)
+                # Удаляем строки завершившихся задач (с конца, чтобы не сбить индексы)
+                removed_keys = self._task_rows.keys() - new_tasks.keys()
+                for row in sorted((self._task_rows[key] for key in removed_keys), reverse=True):
+                    # Забираем ячейки строки в пул для повторного использования
+                    self._item_pool.append([
+                        self.tasks_table.takeItem(row, column)
+                        for column in range(self.tasks_table.columnCount())
+                    ])
+                    self.tasks_table.removeRow(row)
+                for key in removed_keys:
+                    del self._task_rows[key]
+                    del self._task_cache[key]
                 
-                # Устанавливаем цвет статуса
-                if status == 'В процессе':
-                    status_item.setForeground(QBrush(QColor('blue')))
-                elif status == 'Завершено':
-                    status_item.setForeground(QBrush(QColor('green')))
-                elif status == 'Ошибка':
-                    status_item.setForeground(QBrush(QColor('red')))
+                # Пересчитываем индексы оставшихся строк (их порядок сохраняется)
+                if removed_keys:
+                    ordered_keys = sorted(self._task_rows, key=self._task_rows.get)
+                    self._task_rows = {key: row for row, key in enumerate(ordered_keys)}
                 
-                self.tasks_table.setItem(row_position, 3, status_item)
-                
-                # Время выполнения
-                time_item = QTableWidgetItem(task.get('time', ''))
-                self.tasks_table.setItem(row_position, 4, time_item)
+                for key, (task_id, values) in new_tasks.items():
+                    row = self._task_rows.get(key)
+                    if row is None:
+                        # Новая задача - создаем строку
+                        row = self.tasks_table.rowCount()
+                        self.tasks_table.insertRow(row)
+                        
+                        texts = (str(task_id if task_id is not None else ''),) + values
+                        if self._item_pool:
+                            # Используем ячейки ранее удаленной строки
+                            items = self._item_pool.pop()
+                            for item, text in zip(items, texts):
+                                item.setText(text)
+                        else:
+                            items = [QTableWidgetItem(text) for text in texts]
+                        for column, item in enumerate(items):
+                            self.tasks_table.setItem(row, column, item)
+                        
+                        self._set_status_color(self.tasks_table.item(row, 3), values[2])
+                        self._task_rows[key] = row
+                        self._task_cache[key] = values
+                        continue
+                    
+                    # Существующая задача - обновляем только измененные ячейки
+                    cached = self._task_cache[key]
+                    if cached == values:
+                        continue
+                    for column, (old, value) in enumerate(zip(cached, values), start=1):
+                        if old != value:
+                            self.tasks_table.item(row, column).setText(value)
+                    if cached[2] != values[2]:
+                        self._set_status_color(self.tasks_table.item(row, 3), values[2])
+                    self._task_cache[key] = values
         
         except Exception as e:
             self.logger.error(f"Ошибка при обновлении таблицы задач мониторинга: {e}")
             log_exception(self.logger, "Ошибка обновления таблицы задач мониторинга")
     
+    def _set_status_color(self, item, status):
+        """Установка цвета ячейки статуса задачи"""
+        brush = self._STATUS_BRUSH.get(status)
+        if brush is not None:
+            item.setForeground(brush)
+        else:
+            item.setData(Qt.ItemDataRole.ForegroundRole, None)
+    
     def _on_start_monitoring(self):
         """Обработчик запуска мониторинга"""
         self.logger.debug("Вызван метод запуска мониторинга из виджета мониторинга")
@@ -329,19 +652,12 @@ class MonitoringWidget(QWidget):
             
             if success:
                 self.logger.info("Мониторинг успешно запущен")
-                self.status_label.setText("Статус: Запущен")
-                self.status_label.setStyleSheet("color: green;")
-                self.start_button.setEnabled(False)
-                self.stop_button.setEnabled(True)
-                self.status_bar.showMessage("Мониторинг запущен и активен")
+                self._mono_start = time.monotonic()
+                self._apply_monitoring_state(True)
                 self.app_context.update_status(monitoring_active=True)
             else:
                 self.logger.warning("Не удалось запустить мониторинг")
-                self.status_label.setText("Статус: Остановлен")
-                self.status_label.setStyleSheet("color: red;")
-                self.start_button.setEnabled(True)
-                self.stop_button.setEnabled(False)
-                self.status_bar.showMessage("Мониторинг остановлен")
+                self._apply_monitoring_state(False)
         
         except Exception as e:
             self.logger.error(f"Ошибка при запуске мониторинга: {e}")
@@ -357,11 +673,7 @@ class MonitoringWidget(QWidget):
             
             if success:
                 self.logger.info("Мониторинг успешно остановлен")
-                self.status_label.setText("Статус: Остановлен")
-                self.status_label.setStyleSheet("color: red;")
-                self.start_button.setEnabled(True)
-                self.stop_button.setEnabled(False)
-                self.status_bar.showMessage("Мониторинг остановлен")
+                self._apply_monitoring_state(False)
                 self.app_context.update_status(monitoring_active=False)
             else:
                 self.logger.warning("Не удалось остановить мониторинг")
@@ -380,7 +692,7 @@ class MonitoringWidget(QWidget):
             
             if not selected_sites:
                 self.logger.warning("Нет выбранных сайтов для проверки")
-                self.status_bar.showMessage("Нет выбранных сайтов для проверки")
+                self._set_status("Нет выбранных сайтов для проверки")
                 return
             
             # Запускаем проверку выбранных сайтов
@@ -388,12 +700,12 @@ class MonitoringWidget(QWidget):
             
             if success:
                 self.logger.info(f"Запущена проверка {len(selected_sites)} выбранных сайтов")
-                self.status_bar.showMessage(f"Запущена проверка {len(selected_sites)} выбранных сайтов")
+                self._set_status(f"Запущена проверка {len(selected_sites)} выбранных сайтов")
             else:
                 self.logger.warning("Не удалось запустить проверку выбранных сайтов")
-                self.status_bar.showMessage("Не удалось запустить проверку выбранных сайтов")
+                self._set_status("Не удалось запустить проверку выбранных сайтов")
         
         except Exception as e:
             self.logger.error(f"Ошибка при проверке выбранных сайтов: {e}")
             log_exception(self.logger, "Ошибка проверки выбранных сайтов")
-            self.status_bar.showMessage(f"Ошибка: {str(e)}") 
\ No newline at end of file
+            self._set_status(f"Ошибка: {str(e)}") 
\ No newline at end of file
@@ -6,26 +6,80 @@
 Содержит класс ProfileWidget, который позволяет пользователю редактировать свои данные.
 """
 
-import os
+import time
+import functools
 import datetime
 import re
-from typing import Dict, List, Any, Optional
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
-    QFrame, QGridLayout, QLineEdit, QMessageBox, QFormLayout, 
-    QGroupBox, QCheckBox, QDialog, QDialogButtonBox
+    QFrame, QLineEdit, QMessageBox, QFormLayout, 
+    QGroupBox, QDialog, QDialogButtonBox, QApplication
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QObject, QThread, QTimer, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QIcon, QPixmap, QFont
 
 from utils.logger import get_module_logger, log_exception
-from utils.common import format_timestamp, get_diff_color, get_status_color, handle_errors
+
+
+# Формат отображения даты последнего входа
+_DATE_FMT = "%d.%m.%Y %H:%M:%S"
+
+# Проверка формата email
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+def _stop_thread(thread):
+    """
+    Завершение потока и ожидание его остановки
+    
+    Args:
+        thread: Поток QThread
+    """
+    thread.quit()
+    thread.wait()
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_pixmap(path, width, height):
+    """
+    Загрузка и масштабирование изображения с кэшированием
+    
+    Args:
+        path: Путь к файлу изображения
+        width: Ширина
+        height: Высота
+        
+    Returns:
+        QPixmap: Масштабированное изображение
+    """
+    return QPixmap(path).scaled(width, height, Qt.AspectRatioMode.KeepAspectRatio)
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_icon(path):
+    """
+    Загрузка иконки с кэшированием
+    
+    Args:
+        path: Путь к файлу иконки
+        
+    Returns:
+        QIcon: Иконка
+    """
+    return QIcon(path)
 
 
 class ChangePasswordDialog(QDialog):
     """Диалог для изменения пароля"""
     
+    # Поля формы: (подпись, имя атрибута)
+    _FIELDS = (
+        ("Текущий пароль:", "current_password_edit"),
+        ("Новый пароль:", "new_password_edit"),
+        ("Подтверждение пароля:", "confirm_password_edit"),
+    )
+    
     def __init__(self, app_context, parent=None):
         """
         Инициализация диалога
@@ -56,20 +110,12 @@ class ChangePasswordDialog(QDialog):
         # Форма для ввода данных
         form_layout = QFormLayout()
         
-        # Текущий пароль
-        self.current_password_edit = QLineEdit()
-        self.current_password_edit.setEchoMode(QLineEdit.EchoMode.Password)
-        form_layout.addRow("Текущий пароль:", self.current_password_edit)
-        
-        # Новый пароль
-        self.new_password_edit = QLineEdit()
-        self.new_password_edit.setEchoMode(QLineEdit.EchoMode.Password)
-        form_layout.addRow("Новый пароль:", self.new_password_edit)
-        
-        # Подтверждение нового пароля
-        self.confirm_password_edit = QLineEdit()
-        self.confirm_password_edit.setEchoMode(QLineEdit.EchoMode.Password)
-        form_layout.addRow("Подтверждение пароля:", self.confirm_password_edit)
+        # Поля ввода паролей
+        for label, attr in self._FIELDS:
+            edit = QLineEdit()
+            edit.setEchoMode(QLineEdit.EchoMode.Password)
+            setattr(self, attr, edit)
+            form_layout.addRow(label, edit)
         
         layout.addLayout(form_layout)
         
@@ -79,7 +125,12 @@ class ChangePasswordDialog(QDialog):
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
     
-    @handle_errors(error_msg="Ошибка при изменении пароля")
+    def clear(self):
+        """Очистка полей ввода перед повторным открытием диалога"""
+        for _, attr in self._FIELDS:
+            getattr(self, attr).clear()
+        self.current_password_edit.setFocus()
+    
     def accept(self):
         """Обработка подтверждения диалога"""
         try:
@@ -130,12 +181,86 @@ class ChangePasswordDialog(QDialog):
             QMessageBox.critical(self, "Ошибка", f"Не удалось изменить пароль: {e}")
 
 
+class ProfileWorker(QObject):
+    """Загрузка и сохранение данных профиля в отдельном потоке"""
+    
+    # Сигнал с загруженными пользователем и его ролью (обрабатывается в GUI-потоке)
+    user_loaded = pyqtSignal(dict, dict)
+    
+    # Сигнал с результатом сохранения профиля: (успех, сообщение)
+    profile_saved = pyqtSignal(bool, str)
+    
+    # Сигнал с текстом ошибки загрузки профиля
+    load_failed = pyqtSignal(str)
+    
+    def __init__(self, app_context):
+        """
+        Инициализация обработчика профиля
+        
+        Args:
+            app_context: Контекст приложения
+        """
+        super().__init__()
+        self.app_context = app_context
+        self.logger = get_module_logger('ui.profile_widget.worker')
+    
+    @pyqtSlot()
+    def load(self):
+        """Загружает текущего пользователя и его роль"""
+        try:
+            user, role = self.app_context.auth_manager.get_current_user_with_role(self.app_context)
+            self.user_loaded.emit(dict(user or {}), dict(role or {}))
+        except Exception as e:
+            self.logger.error(f"Ошибка при загрузке данных профиля: {e}")
+            log_exception(self.logger, "Ошибка загрузки данных профиля")
+            self.load_failed.emit(str(e))
+    
+    @pyqtSlot(object, str, str)
+    def save(self, user_id, full_name, email):
+        """
+        Сохраняет данные профиля
+        
+        Args:
+            user_id: ID пользователя
+            full_name: Полное имя
+            email: Email
+        """
+        try:
+            success, message = self.app_context.auth_manager.update_user(
+                self.app_context,
+                user_id=user_id,
+                full_name=full_name,
+                email=email
+            )
+            self.profile_saved.emit(bool(success), message or "")
+        except Exception as e:
+            self.logger.error(f"Ошибка при сохранении профиля: {e}")
+            log_exception(self.logger, "Ошибка сохранения профиля")
+            self.profile_saved.emit(False, f"Не удалось сохранить профиль: {e}")
+
+
 class ProfileWidget(QWidget):
     """Виджет для отображения и редактирования профиля пользователя"""
     
     # Сигнал об изменении профиля
     profile_changed = pyqtSignal()
     
+    # Время жизни кэша пользователя и роли (секунды)
+    CACHE_TTL = 5.0
+    
+    # Поля формы профиля: (подпись, имя атрибута, класс виджета)
+    _FIELDS = (
+        ("Имя пользователя:", "username_label", QLabel),
+        ("Полное имя:", "full_name_edit", QLineEdit),
+        ("Email:", "email_edit", QLineEdit),
+        ("Роль:", "role_label", QLabel),
+        ("Последний вход:", "last_login_label", QLabel),
+    )
+    
+    # Запросы к ProfileWorker (доставляются в его поток)
+    _load_requested = pyqtSignal()
+    _save_requested = pyqtSignal(object, str, str)
+    
     def __init__(self, app_context, parent=None):
         """
         Инициализация виджета профиля
@@ -149,12 +274,41 @@ class ProfileWidget(QWidget):
         self.logger = get_module_logger('ui.profile_widget')
         self.app_context = app_context
         self.parent = parent
+        self._show_message = getattr(parent, "show_message", None)
+        
+        # Кэш текущего пользователя и его роли: (время получения, данные)
+        self._user_cache = None
+        self._role_cache = None
+        
+        # Номер сеанса авторизации, к которому относится кэш
+        self._cache_session = None
+        
+        # Последняя отформатированная дата входа: (исходное значение, строка)
+        self._last_login_cache = None
+        
+        # Диалог изменения пароля (создается при первом использовании)
+        self._password_dialog = None
         
         # Инициализация UI
         self._init_ui()
         
-        # Обновление данных
-        self.update_data()
+        # Обращения к базе данных выполняются в отдельном потоке,
+        # а в GUI-потоке только обновляется форма
+        # Поток не принадлежит виджету: при уничтожении виджета он
+        # останавливается и ожидается до удаления объекта QThread
+        self.worker_thread = QThread()
+        self.worker = ProfileWorker(self.app_context)
+        self.worker.moveToThread(self.worker_thread)
+        self.worker.user_loaded.connect(self._on_user_loaded)
+        self.worker.profile_saved.connect(self._on_profile_saved)
+        self.worker.load_failed.connect(self._show_load_error)
+        self._load_requested.connect(self.worker.load)
+        self._save_requested.connect(self.worker.save)
+        self.worker_thread.start()
+        QApplication.instance().aboutToQuit.connect(self._stop_worker_thread)
+        self.destroyed.connect(functools.partial(_stop_thread, self.worker_thread))
+        
+        # Данные загружаются при показе виджета (showEvent)
         
         self.logger.debug("Виджет профиля пользователя инициализирован")
     
@@ -168,8 +322,7 @@ class ProfileWidget(QWidget):
         
         # Иконка
         icon_label = QLabel()
-        icon_pixmap = QPixmap("resources/icons/user.png").scaled(64, 64, Qt.AspectRatioMode.KeepAspectRatio)
-        icon_label.setPixmap(icon_pixmap)
+        icon_label.setPixmap(_cached_pixmap("resources/icons/user.png", 64, 64))
         header_layout.addWidget(icon_label)
         
         # Заголовок
@@ -194,40 +347,37 @@ class ProfileWidget(QWidget):
         form_group = QGroupBox("Данные пользователя")
         form_layout = QFormLayout(form_group)
         
-        # Имя пользователя
-        self.username_label = QLabel()
-        form_layout.addRow("Имя пользователя:", self.username_label)
+        # Поля профиля
+        for label, attr, widget_class in self._FIELDS:
+            widget = widget_class()
+            setattr(self, attr, widget)
+            form_layout.addRow(label, widget)
         
-        # Полное имя
-        self.full_name_edit = QLineEdit()
-        form_layout.addRow("Полное имя:", self.full_name_edit)
-        
-        # Email
-        self.email_edit = QLineEdit()
-        form_layout.addRow("Email:", self.email_edit)
-        
-        # Роль
-        self.role_label = QLabel()
-        form_layout.addRow("Роль:", self.role_label)
+        layout.addWidget(form_group)
         
-        # Последний вход
-        self.last_login_label = QLabel()
-        form_layout.addRow("Последний вход:", self.last_login_label)
+        # Метка ошибок обновления данных (не блокирует работу, как модальный диалог)
+        self.status_label = QLabel()
+        self.status_label.setStyleSheet("color: red;")
+        self.status_label.hide()
+        layout.addWidget(self.status_label)
         
-        layout.addWidget(form_group)
+        # Проверка полей по мере ввода
+        self._form_valid = True
+        self.full_name_edit.textChanged.connect(self._validate_form)
+        self.email_edit.textChanged.connect(self._validate_form)
         
         # Кнопки
         buttons_layout = QHBoxLayout()
         
         # Кнопка "Изменить пароль"
         self.btn_change_password = QPushButton("Изменить пароль")
-        self.btn_change_password.setIcon(QIcon("resources/icons/password.png"))
+        self.btn_change_password.setIcon(_cached_icon("resources/icons/password.png"))
         self.btn_change_password.clicked.connect(self._change_password)
         buttons_layout.addWidget(self.btn_change_password)
         
         # Кнопка "Сохранить изменения"
         self.btn_save = QPushButton("Сохранить изменения")
-        self.btn_save.setIcon(QIcon("resources/icons/save.png"))
+        self.btn_save.setIcon(_cached_icon("resources/icons/save.png"))
         self.btn_save.clicked.connect(self._save_profile)
         buttons_layout.addWidget(self.btn_save)
         
@@ -237,107 +387,257 @@ class ProfileWidget(QWidget):
         
         layout.addStretch()
     
-    @handle_errors(error_msg="Ошибка при обновлении данных профиля")
+    def _get_user(self):
+        """
+        Получение текущего пользователя с кэшированием на CACHE_TTL секунд
+        (кэш сбрасывается при входе или выходе пользователя)
+        
+        Returns:
+            Optional[Dict[str, Any]]: Информация о текущем пользователе или None
+        """
+        now = time.monotonic()
+        if (self._user_cache is None or now - self._user_cache[0] >= self.CACHE_TTL
+                or self._cache_session != self._session_version()):
+            self.invalidate_cache()
+            self._cache_session = self._session_version()
+            self._user_cache = (now, self.app_context.auth_manager.get_current_user())
+        return self._user_cache[1]
+    
+    def _session_version(self):
+        """Текущий номер сеанса авторизации"""
+        return self.app_context.auth_manager.session_version
+    
+    def _is_cache_fresh(self):
+        """Проверка, что кэш пользователя и роли не устарел"""
+        if self._user_cache is None or self._role_cache is None:
+            return False
+        if self._cache_session != self._session_version():
+            return False
+        now = time.monotonic()
+        return (now - self._user_cache[0] < self.CACHE_TTL
+                and now - self._role_cache[0] < self.CACHE_TTL)
+    
+    def invalidate_cache(self):
+        """Сброс кэша пользователя и роли (после изменения профиля, входа или выхода)"""
+        self._user_cache = None
+        self._role_cache = None
+        self._cache_session = None
+    
+    def showEvent(self, event):
+        """
+        Обработка показа виджета: запрашивает данные профиля,
+        если кэш устарел (иначе форма заполняется из кэша)
+        
+        Args:
+            event: Событие показа
+        """
+        super().showEvent(event)
+        self.update_data()
+    
+    def _stop_worker_thread(self):
+        """Остановка потока загрузки данных профиля"""
+        _stop_thread(self.worker_thread)
+    
     def update_data(self):
-        """Обновление данных профиля"""
+        """
+        Обновление данных профиля.
+        Если кэш устарел, данные запрашиваются в фоновом потоке
+        и отображаются по сигналу user_loaded.
+        """
+        if self._is_cache_fresh():
+            self._populate(self._user_cache[1], self._role_cache[1])
+        else:
+            self._load_requested.emit()
+    
+    @pyqtSlot(dict, dict)
+    def _on_user_loaded(self, user, role):
+        """
+        Обработка загруженных данных профиля
+        
+        Args:
+            user: Информация о текущем пользователе
+            role: Информация о роли пользователя
+        """
+        now = time.monotonic()
+        self._cache_session = self._session_version()
+        self._user_cache = (now, user or None)
+        self._role_cache = (now, role or None)
+        self._populate(user, role)
+    
+    def _populate(self, user, role):
+        """
+        Заполнение формы данными профиля
+        
+        Args:
+            user: Информация о текущем пользователе
+            role: Информация о роли пользователя
+        """
         try:
-            # Получаем текущего пользователя
-            user = self.app_context.auth_manager.get_current_user()
-            
             if not user:
                 self.logger.warning("Не удалось получить информацию о текущем пользователе")
                 return
             
             # Обновляем данные в форме
-            self.username_label.setText(user.get('username', ''))
-            self.full_name_edit.setText(user.get('full_name', ''))
-            self.email_edit.setText(user.get('email', ''))
+            self._set_if_changed(self.username_label, user.get('username', ''))
+            self._set_if_changed(self.full_name_edit, user.get('full_name', ''))
+            self._set_if_changed(self.email_edit, user.get('email', ''))
             
-            # Получаем информацию о роли
-            role = self.app_context.auth_manager.get_user_role(self.app_context)
-            self.role_label.setText(role.get('name', '') if role else '')
+            # Информация о роли
+            self._set_if_changed(self.role_label, role.get('name', '') if role else '')
             
             # Форматируем дату последнего входа
-            last_login = user.get('last_login')
-            if last_login:
-                if isinstance(last_login, str):
-                    try:
-                        dt = datetime.datetime.fromisoformat(last_login.replace('Z', '+00:00'))
-                        date_str = dt.strftime("%d.%m.%Y %H:%M:%S")
-                    except (ValueError, TypeError):
-                        date_str = last_login
-                elif isinstance(last_login, datetime.datetime):
-                    date_str = last_login.strftime("%d.%m.%Y %H:%M:%S")
-                else:
-                    date_str = str(last_login)
-            else:
-                date_str = "Никогда"
+            self._set_if_changed(self.last_login_label, self._format_last_login(user.get('last_login')))
             
-            self.last_login_label.setText(date_str)
+            # Сигналы полей ввода заблокированы при заполнении, проверяем форму явно
+            self._validate_form()
         
         except Exception as e:
             self.logger.error(f"Ошибка при обновлении данных профиля: {e}")
             log_exception(self.logger, "Ошибка обновления данных профиля")
-            if hasattr(self.parent, "show_message"):
-                self.parent.show_message("Ошибка", f"Не удалось обновить данные профиля: {e}", QMessageBox.Icon.Critical)
+            self._show_load_error(str(e))
+    
+    @staticmethod
+    def _set_if_changed(widget, new_text):
+        """
+        Установка текста виджета, только если он изменился.
+        Для полей ввода сигналы на время изменения блокируются.
+        
+        Args:
+            widget: QLabel или QLineEdit
+            new_text: Новый текст
+        """
+        new_text = new_text or ''
+        if widget.text() == new_text:
+            return
+        
+        if isinstance(widget, QLineEdit):
+            was_blocked = widget.blockSignals(True)
+            widget.setText(new_text)
+            widget.blockSignals(was_blocked)
+        else:
+            widget.setText(new_text)
+    
+    @pyqtSlot(str)
+    def _show_load_error(self, message):
+        """
+        Отображение ошибки обновления данных профиля (скрывается через 5 секунд)
+        
+        Args:
+            message: Текст ошибки
+        """
+        self.status_label.setText(f"Не удалось обновить данные профиля: {message}")
+        self.status_label.show()
+        QTimer.singleShot(5000, self.status_label.hide)
+    
+    def _format_last_login(self, last_login):
+        """
+        Форматирование даты последнего входа (с кэшированием последнего результата)
+        
+        Args:
+            last_login: Дата последнего входа (строка ISO или datetime)
+            
+        Returns:
+            str: Отформатированная дата
+        """
+        if not last_login:
+            return "Никогда"
+        
+        if self._last_login_cache is not None and self._last_login_cache[0] == last_login:
+            return self._last_login_cache[1]
+        
+        if isinstance(last_login, str):
+            value = last_login[:-1] + '+00:00' if last_login.endswith('Z') else last_login
+            try:
+                date_str = datetime.datetime.fromisoformat(value).strftime(_DATE_FMT)
+            except (ValueError, TypeError):
+                date_str = last_login
+        elif isinstance(last_login, datetime.datetime):
+            date_str = last_login.strftime(_DATE_FMT)
+        else:
+            date_str = str(last_login)
+        
+        self._last_login_cache = (last_login, date_str)
+        return date_str
+    
+    def _validate_form(self):
+        """Проверка введенных данных и включение кнопки сохранения"""
+        email = self.email_edit.text().strip()
+        valid = not email or _EMAIL_RE.match(email) is not None
+        if valid == self._form_valid:
+            return
+        
+        self._form_valid = valid
+        self.email_edit.setStyleSheet("" if valid else "color: red;")
+        self.btn_save.setEnabled(valid)
     
-    @handle_errors(error_msg="Ошибка при сохранении профиля")
     def _save_profile(self):
         """Сохранение изменений профиля"""
         try:
             # Получаем текущего пользователя
-            user = self.app_context.auth_manager.get_current_user()
+            user = self._get_user()
             
             if not user:
-                if hasattr(self.parent, "show_message"):
-                    self.parent.show_message("Ошибка", "Не удалось получить информацию о текущем пользователе", QMessageBox.Icon.Critical)
+                if self._show_message:
+                    self._show_message("Ошибка", "Не удалось получить информацию о текущем пользователе", QMessageBox.Icon.Critical)
                 return
             
             # Получаем введенные данные
             full_name = self.full_name_edit.text().strip()
             email = self.email_edit.text().strip()
             
-            # Обновляем данные пользователя
-            success, message = self.app_context.auth_manager.update_user(
-                self.app_context,
-                user_id=user['id'],
-                full_name=full_name,
-                email=email
-            )
-            
-            if not success:
-                if hasattr(self.parent, "show_message"):
-                    self.parent.show_message("Ошибка", message, QMessageBox.Icon.Critical)
-                return
-            
-            # Обновляем данные
-            self.update_data()
-            
-            # Отправляем сигнал об изменении профиля
-            self.profile_changed.emit()
-            
-            if hasattr(self.parent, "show_message"):
-                self.parent.show_message("Информация", "Профиль успешно обновлен")
-            
-            self.logger.info("Профиль пользователя обновлен")
+            # Обновляем данные пользователя в фоновом потоке
+            # (результат обрабатывается в _on_profile_saved)
+            self.btn_save.setEnabled(False)
+            self._save_requested.emit(user['id'], full_name, email)
         
         except Exception as e:
             self.logger.error(f"Ошибка при сохранении профиля: {e}")
             log_exception(self.logger, "Ошибка сохранения профиля")
-            if hasattr(self.parent, "show_message"):
-                self.parent.show_message("Ошибка", f"Не удалось сохранить профиль: {e}", QMessageBox.Icon.Critical)
+            if self._show_message:
+                self._show_message("Ошибка", f"Не удалось сохранить профиль: {e}", QMessageBox.Icon.Critical)
+    
+    @pyqtSlot(bool, str)
+    def _on_profile_saved(self, success, message):
+        """
+        Обработка результата сохранения профиля
+        
+        Args:
+            success: Успешно ли сохранен профиль
+            message: Сообщение о результате
+        """
+        self.btn_save.setEnabled(self._form_valid)
+        
+        if not success:
+            if self._show_message:
+                self._show_message("Ошибка", message, QMessageBox.Icon.Critical)
+            return
+        
+        # Сбрасываем кэш и обновляем данные
+        self.invalidate_cache()
+        self.update_data()
+        
+        # Отправляем сигнал об изменении профиля
+        self.profile_changed.emit()
+        
+        if self._show_message:
+            self._show_message("Информация", "Профиль успешно обновлен")
+        
+        self.logger.info("Профиль пользователя обновлен")
     
     def _change_password(self):
         """Изменение пароля"""
         try:
-            # Создаем и открываем диалог изменения пароля
-            dialog = ChangePasswordDialog(self.app_context, self)
+            # Диалог создается при первом вызове и затем переиспользуется
+            if self._password_dialog is None:
+                self._password_dialog = ChangePasswordDialog(self.app_context, self)
+            else:
+                self._password_dialog.clear()
             
-            if dialog.exec() == QDialog.DialogCode.Accepted:
+            if self._password_dialog.exec() == QDialog.DialogCode.Accepted:
                 self.logger.info("Пароль пользователя изменен")
         
         except Exception as e:
             self.logger.error(f"Ошибка при изменении пароля: {e}")
             log_exception(self.logger, "Ошибка изменения пароля")
-            if hasattr(self.parent, "show_message"):
-                self.parent.show_message("Ошибка", f"Не удалось изменить пароль: {e}", QMessageBox.Icon.Critical) 
\ No newline at end of file
+            if self._show_message:
+                self._show_message("Ошибка", f"Не удалось изменить пароль: {e}", QMessageBox.Icon.Critical) 
\ No newline at end of file
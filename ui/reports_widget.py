@@ -8,26 +8,539 @@
 """
 
 import os
-import csv
-import json
+import contextlib
+import functools
+import itertools
+import re
 from datetime import datetime, timedelta
 from pathlib import Path
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QPushButton, QComboBox, QHBoxLayout,
     QGroupBox, QGridLayout, QDateEdit, QCheckBox, QFileDialog, QMessageBox,
-    QTableWidget, QTableWidgetItem, QHeaderView, QTextEdit, QSplitter,
+    QTableView, QHeaderView, QTextBrowser, QSplitter,
     QTabWidget, QScrollArea, QFrame, QStackedWidget, QRadioButton, QSpinBox,
-    QPrintDialog
+    QApplication
 )
-from PyQt6.QtCore import Qt, QDate, QDateTime, QSize
-from PyQt6.QtGui import QIcon, QFont, QTextDocument
-from PyQt6.QtPrintSupport import QPrinter
+from PyQt6.QtCore import (
+    Qt, QDate, QDateTime, QSize, QAbstractTableModel, QModelIndex,
+    QSortFilterProxyModel, QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
+)
+from PyQt6.QtGui import QIcon, QFont, QTextCursor
 
 from utils.logger import get_module_logger, log_exception
 from core.settings import Settings
-from reports.report_generator import ReportGenerator
-from utils.decorators import handle_errors
+from utils.common import format_timestamp, get_status_color, handle_errors
+from reports.html_chunks import HTML_CHUNK_SIZE, split_html_chunks
+
+
+# Отображаемые названия типов и статусов отчетов
+_TYPE_MAP = {
+    'sites': "Сайты",
+    'changes': "Изменения",
+    'errors': "Ошибки",
+    'stats': "Статистика"
+}
+_STATUS_MAP = {
+    'completed': "Завершен",
+    'failed': "Ошибка",
+    'pending': "В процессе"
+}
+
+# Цвета статусов отчетов (заполняется при первом обращении)
+_STATUS_COLOR_CACHE = {}
+
+# HTML-предпросмотр для неизвестного типа отчета
+_UNKNOWN_REPORT_HTML = "<h1>Неизвестный тип отчета</h1>"
+
+# Стили HTML-предпросмотра (переносятся в документ при загрузке фрагментами)
+_STYLE_RE = re.compile(r"<style[^>]*>(.*?)</style>", re.S | re.I)
+
+# Каталог шаблонов HTML-отчетов
+_TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "resources" / "templates" / "reports"
+
+# Оценка ширины столбцов при экспорте в Excel
+_XLSX_WIDTH_SAMPLE_ROWS = 200
+_XLSX_MAX_COLUMN_WIDTH = 60
+
+# Число строк, начиная с которого XLSX формируется потоковой записью XML
+# (без форматирования openpyxl; рассчитано на выгрузки больше лимита
+# запросов ReportGenerator.DEFAULT_QUERY_LIMIT)
+_XLSX_STREAM_THRESHOLD = 50000
+
+# Формат даты и времени в экспортируемых отчетах
+_DT_FMT = '%d.%m.%Y %H:%M'
+
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_dt_cached(dt):
+    """
+    Форматирование даты, округленной до минуты (с кэшированием)
+    
+    Args:
+        dt: Дата и время без секунд
+        
+    Returns:
+        str: Отформатированная дата
+    """
+    return dt.strftime(_DT_FMT)
+
+
+def _fmt_dt(dt):
+    """
+    Форматирование даты для экспорта.
+    Формат не содержит секунд, поэтому значение округляется до минуты
+    перед обращением к кэшу: отметки времени одной минуты дают одно
+    попадание в кэш.
+    
+    Args:
+        dt: Дата и время или None
+        
+    Returns:
+        str: Отформатированная дата или '-'
+    """
+    if not dt:
+        return '-'
+    return _fmt_dt_cached(dt.replace(second=0, microsecond=0))
+
+
+@contextlib.contextmanager
+def _frozen_view(view):
+    """
+    Контекстный менеджер для пакетного обновления таблицы.
+    Отключает перерисовку, сигналы и сортировку представления на время
+    замены данных модели и настройки столбцов, а при выходе выполняет
+    одну перерисовку.
+    
+    Args:
+        view: Табличное представление
+    """
+    sorting = view.isSortingEnabled()
+    was_blocked = view.blockSignals(True)
+    view.setUpdatesEnabled(False)
+    if sorting:
+        view.setSortingEnabled(False)
+    try:
+        yield view
+    finally:
+        if sorting:
+            view.setSortingEnabled(True)
+        view.blockSignals(was_blocked)
+        view.setUpdatesEnabled(True)
+        view.viewport().update()
+
+
+def _row_sites(site):
+    """Строка экспорта отчета по сайтам"""
+    return (
+        site['name'],
+        site['url'],
+        site['group_name'] or 'Без группы',
+        site['status'],
+        _fmt_dt(site['last_check']),
+        _fmt_dt(site['last_change']),
+        site['changes_count'],
+        site['errors_count']
+    )
+
+
+def _row_changes(change):
+    """Строка экспорта отчета по изменениям"""
+    return (
+        change['site_name'],
+        _fmt_dt(change['timestamp']),
+        f"{change['diff_percent']:.2f}%",
+        change['status'],
+        change['reviewed_by'] or '-',
+        change['notes'] or '-'
+    )
+
+
+def _row_errors(error):
+    """Строка экспорта отчета по ошибкам"""
+    return (
+        error['name'],
+        _fmt_dt(error['error_time']),
+        error['error_message'],
+        error['group_name'] or '-'
+    )
+
+
+# Построители строк экспорта по типам отчетов
+_ROW_BUILDERS = {
+    'sites': _row_sites,
+    'changes': _row_changes,
+    'errors': _row_errors
+}
+
+
+def _to_date(value):
+    """
+    Приведение временной метки к дате
+    
+    Args:
+        value: Временная метка (строка ISO, datetime или None)
+        
+    Returns:
+        date: Дата или None, если значение не распознано
+    """
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value.replace('Z', '+00:00')).date()
+        except ValueError:
+            return None
+    return None
+
+
+def _status_color(status):
+    """
+    Цвет статуса отчета с кэшированием
+    
+    Args:
+        status: Статус отчета
+        
+    Returns:
+        QColor: Цвет для отображения
+    """
+    color = _STATUS_COLOR_CACHE.get(status)
+    if color is None:
+        color = _STATUS_COLOR_CACHE[status] = get_status_color(status)
+    return color
+
+
+def _scan_file_sizes(file_paths):
+    """
+    Получение размеров файлов отчетов обходом их каталогов
+    
+    Каждый каталог читается одним os.scandir(), stat выполняется
+    только для нужных файлов.
+    
+    Args:
+        file_paths: Пути к файлам
+        
+    Returns:
+        dict: Размеры файлов по путям (отсутствующие файлы не включаются)
+    """
+    wanted = {}
+    for file_path in file_paths:
+        if file_path:
+            parent, name = os.path.split(file_path)
+            wanted.setdefault(parent, set()).add(name)
+    
+    sizes = {}
+    for parent, names in wanted.items():
+        try:
+            with os.scandir(parent or os.curdir) as entries:
+                for entry in entries:
+                    if entry.name in names and entry.is_file():
+                        sizes[os.path.join(parent, entry.name)] = entry.stat().st_size
+        except OSError:
+            continue
+    
+    return sizes
+
+
+def _format_file_size(size):
+    """
+    Форматирование размера файла отчета
+    
+    Args:
+        size: Размер файла в байтах или None, если файл не найден
+        
+    Returns:
+        str: Размер файла в читаемом виде
+    """
+    if size is None:
+        return "Файл не найден"
+    
+    if size < 1024:
+        return f"{size} B"
+    elif size < 1024 * 1024:
+        return f"{size/1024:.1f} KB"
+    return f"{size/(1024*1024):.1f} MB"
+
+
+@functools.lru_cache(maxsize=None)
+def _report_template(name):
+    """
+    Получение скомпилированного шаблона HTML-отчета
+    
+    Окружение Jinja2 создается при первом обращении, а каждый шаблон
+    компилируется один раз и далее берется из кэша.
+    
+    Args:
+        name: Имя файла шаблона
+        
+    Returns:
+        jinja2.Template: Шаблон отчета
+    """
+    return _jinja_env().get_template(name)
+
+
+@functools.lru_cache(maxsize=1)
+def _jinja_env():
+    """Окружение Jinja2 для шаблонов отчетов"""
+    import jinja2
+    
+    return jinja2.Environment(
+        loader=jinja2.FileSystemLoader(str(_TEMPLATES_DIR)),
+        autoescape=True,
+        auto_reload=False,
+        cache_size=-1,
+        trim_blocks=True
+    )
+
+
+def _field(key):
+    """
+    Столбец таблицы предпросмотра, отображающий поле записи
+    
+    Args:
+        key: Имя поля
+        
+    Returns:
+        callable: Функция получения текста ячейки из записи
+    """
+    return lambda record: str(record.get(key, ''))
+
+
+# Столбцы табличного предпросмотра: заголовок и получение текста ячейки из записи
+_SITES_COLUMNS = (
+    ("ID", _field('id')),
+    ("Название", _field('name')),
+    ("URL", _field('url')),
+    ("Группа", _field('group')),
+    ("Последняя проверка", _field('last_check')),
+    ("Последнее изменение", _field('last_change')),
+    ("Статус", _field('status'))
+)
+_CHANGES_COLUMNS = (
+    ("ID", _field('id')),
+    ("Сайт", _field('site_name')),
+    ("URL", _field('url')),
+    ("Дата", _field('date')),
+    ("Изменения (%)", lambda change: f"{change.get('diff_percent', 0):.2f}%"),
+    ("Статус", _field('status'))
+)
+_ERRORS_COLUMNS = (
+    ("ID", _field('id')),
+    ("Сайт", _field('site_name')),
+    ("URL", _field('url')),
+    ("Дата", _field('date')),
+    ("Ошибка", _field('message'))
+)
+
+
+class ReportsTableModel(QAbstractTableModel):
+    """
+    Модель таблицы предпросмотра отчетов.
+    Хранит либо строки в виде кортежей уже отформатированных значений,
+    либо исходные записи отчета со столбцами, формирующими текст ячейки
+    при отрисовке (только для видимых строк).
+    """
+    
+    def __init__(self, parent=None):
+        """
+        Инициализация модели
+        
+        Args:
+            parent: Родительский объект
+        """
+        super().__init__(parent)
+        self._headers = ()
+        self._rows = []
+        self._foreground = None
+        self._foreground_column = -1
+        self._keys = None
+        self._columns = None
+    
+    def reset(self, headers, rows, foreground=None, foreground_column=-1, keys=None):
+        """
+        Замена содержимого модели
+        
+        Args:
+            headers: Заголовки столбцов
+            rows: Список кортежей с отображаемыми значениями
+            foreground: Список цветов текста по строкам (опционально)
+            foreground_column: Столбец, к которому применяется цвет
+            keys: Список ключей фильтрации (тип, дата) по строкам (опционально)
+        """
+        self.beginResetModel()
+        self._headers = tuple(headers)
+        self._rows = rows
+        self._foreground = foreground
+        self._foreground_column = foreground_column
+        self._keys = keys
+        self._columns = None
+        self.endResetModel()
+    
+    def set_records(self, columns, records):
+        """
+        Отображение исходных записей отчета без предварительного форматирования
+        
+        Args:
+            columns: Кортеж пар (заголовок, функция получения текста ячейки)
+            records: Список записей (словарей)
+        """
+        self.beginResetModel()
+        self._headers = tuple(header for header, _ in columns)
+        self._columns = tuple(getter for _, getter in columns)
+        self._rows = records if isinstance(records, list) else list(records)
+        self._foreground = None
+        self._foreground_column = -1
+        self._keys = None
+        self.endResetModel()
+    
+    def row_key(self, row):
+        """
+        Ключ фильтрации строки
+        
+        Args:
+            row: Номер строки
+            
+        Returns:
+            tuple: (тип отчета, дата создания) или None, если строка не фильтруется
+        """
+        return self._keys[row] if self._keys is not None else None
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Количество строк"""
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        """Количество столбцов"""
+        return 0 if parent.isValid() else len(self._headers)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        """Заголовки столбцов"""
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self._headers[section]
+        return None
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Данные ячейки"""
+        if role == Qt.ItemDataRole.DisplayRole:
+            if self._columns is not None:
+                return self._columns[index.column()](self._rows[index.row()])
+            return self._rows[index.row()][index.column()]
+        if (role == Qt.ItemDataRole.ForegroundRole and self._foreground is not None
+                and index.column() == self._foreground_column):
+            return self._foreground[index.row()]
+        return None
+
+
+class ReportsFilterProxyModel(QSortFilterProxyModel):
+    """
+    Фильтр списка отчетов по типу и дате создания.
+    Исходная модель заполняется один раз, а смена фильтра только
+    пересчитывает видимые строки.
+    """
+    
+    def __init__(self, parent=None):
+        """
+        Инициализация фильтра
+        
+        Args:
+            parent: Родительский объект
+        """
+        super().__init__(parent)
+        self._report_type = None
+        self._date_from = None
+        self._date_to = None
+    
+    def set_filter(self, report_type, date_from, date_to):
+        """
+        Установка условий фильтрации
+        
+        Args:
+            report_type: Тип отчета или None для всех типов
+            date_from: Начальная дата (date) или None
+            date_to: Конечная дата (date) или None
+        """
+        self._report_type = report_type
+        self._date_from = date_from
+        self._date_to = date_to
+        self.invalidateFilter()
+    
+    def filterAcceptsRow(self, source_row, source_parent):
+        """Проверка строки на соответствие фильтру"""
+        key = self.sourceModel().row_key(source_row)
+        if key is None:
+            return True
+        
+        report_type, created = key
+        if self._report_type is not None and report_type != self._report_type:
+            return False
+        if created is None:
+            return True
+        if self._date_from is not None and created < self._date_from:
+            return False
+        if self._date_to is not None and created > self._date_to:
+            return False
+        return True
+
+
+class ReportWorker(QRunnable):
+    """Генерация отчета в пуле потоков"""
+    
+    class Signals(QObject):
+        """Сигналы обработчика (QRunnable не может иметь собственных сигналов)"""
+        
+        # Данные отчета и его HTML-представление
+        finished = pyqtSignal(dict, str)
+        
+        # Исключение, возникшее при генерации
+        error = pyqtSignal(object)
+    
+    def __init__(self, app_context, report_type, date_from, date_to):
+        """
+        Инициализация обработчика
+        
+        Args:
+            app_context: Контекст приложения
+            report_type: Тип отчета
+            date_from: Начало периода
+            date_to: Конец периода
+        """
+        super().__init__()
+        self.app_context = app_context
+        self.report_type = report_type
+        self.date_from = date_from
+        self.date_to = date_to
+        self.signals = ReportWorker.Signals()
+        self.logger = get_module_logger('ui.reports.worker')
+    
+    @pyqtSlot()
+    def run(self):
+        """Генерирует отчет и передает результат в GUI-поток"""
+        try:
+            from reports.report_generator import ReportGenerator
+            
+            report_generator = ReportGenerator(self.app_context)
+            
+            generators = {
+                'sites': report_generator.generate_sites_report,
+                'changes': report_generator.generate_changes_report,
+                'errors': report_generator.generate_errors_report,
+                'stats': report_generator.generate_stats_report
+            }
+            
+            # Генерируем отчет в зависимости от типа
+            generate = generators.get(self.report_type)
+            if generate is None:
+                raise ValueError(f"Неизвестный тип отчета: {self.report_type}")
+            report_data = generate(self.date_from, self.date_to)
+            
+            # Форматируем отчет в HTML
+            content = report_generator.format_report_html(report_data)
+            self.signals.finished.emit(report_data, content)
+        
+        except Exception as e:
+            self.logger.error(f"Ошибка при генерации отчета: {e}")
+            log_exception(self.logger, "Ошибка генерации отчета")
+            self.signals.error.emit(e)
 
 
 class ReportsWidget(QWidget):
@@ -59,9 +572,36 @@ class ReportsWidget(QWidget):
             'date_from': QDate.currentDate().addDays(-7),
             'date_to': QDate.currentDate(),
             'content': None,
-            'data': None
+            'data': None,
+            'content_key': None,
+            'qdoc': None
         }
         
+        # Обработчик генерации текущего отчета
+        self._report_worker = None
+        
+        # Построение HTML и заполнение таблицы предпросмотра по типам отчетов
+        self._report_specs = {
+            'sites': {'html': self._generate_sites_html, 'fill': self._fill_sites_table},
+            'changes': {'html': self._generate_changes_html, 'fill': self._fill_changes_table},
+            'errors': {'html': self._generate_errors_html, 'fill': self._fill_errors_table},
+            'stats': {'html': self._generate_stats_html, 'fill': self._fill_stats_table}
+        }
+        
+        # Функции экспорта по форматам
+        self._exporters = {
+            'html': self._export_html,
+            'csv': self._export_csv,
+            'xlsx': self._export_xlsx,
+            'pdf': self._export_pdf
+        }
+        
+        # Идентификатор текущей загрузки HTML-предпросмотра
+        self._html_load_id = 0
+        
+        # HTML-предпросмотры текущего отчета по (тип, данные, период)
+        self._html_cache = {}
+        
         # Создание UI
         self._init_ui()
         
@@ -180,18 +720,27 @@ class ReportsWidget(QWidget):
         self.preview_area = QStackedWidget()
         
         # Страница для HTML-предпросмотра
-        self.html_preview = QTextEdit()
-        self.html_preview.setReadOnly(True)
+        self.html_preview = QTextBrowser()
         self.preview_area.addWidget(self.html_preview)
         
         # Страница для табличного предпросмотра
-        self.table_preview = QTableWidget()
+        self.table_model = ReportsTableModel(self)
+        self.table_proxy = ReportsFilterProxyModel(self)
+        self.table_proxy.setSourceModel(self.table_model)
+        self.table_preview = QTableView()
+        self.table_preview.setModel(self.table_proxy)
         self.table_preview.setAlternatingRowColors(True)
         self.preview_area.addWidget(self.table_preview)
         
         # Добавляем область предпросмотра в правую панель
         preview_layout.addWidget(self.preview_area)
         
+        # Фильтрация списка отчетов по типу и периоду
+        self.report_type_combo.currentIndexChanged.connect(self._apply_reports_filter)
+        self.date_from.dateChanged.connect(self._apply_reports_filter)
+        self.date_to.dateChanged.connect(self._apply_reports_filter)
+        self._apply_reports_filter()
+        
         # Добавляем правую панель в разделитель
         splitter.addWidget(preview_widget)
         
@@ -208,72 +757,47 @@ class ReportsWidget(QWidget):
             # Получаем список отчетов
             reports = self.app_context.get_reports()
             
-            # Очищаем таблицу
-            self.table_preview.setRowCount(0)
-            
-            # Заполняем таблицу
-            for row, report in enumerate(reports):
-                self.table_preview.insertRow(row)
-                
-                # Тип отчета
-                report_type = report.get('type', '')
-                type_map = {
-                    'sites': "Сайты",
-                    'changes': "Изменения",
-                    'errors': "Ошибки",
-                    'stats': "Статистика"
-                }
-                type_text = type_map.get(report_type, report_type)
-                type_item = QTableWidgetItem(type_text)
-                self.table_preview.setItem(row, 0, type_item)
-                
-                # Дата создания
-                timestamp = report.get('created_at')
-                date_item = QTableWidgetItem(format_timestamp(timestamp))
-                self.table_preview.setItem(row, 1, date_item)
-                
-                # Период
-                date_from = report.get('date_from')
-                date_to = report.get('date_to')
-                period_text = f"{format_timestamp(date_from)} - {format_timestamp(date_to)}"
-                period_item = QTableWidgetItem(period_text)
-                self.table_preview.setItem(row, 2, period_item)
-                
-                # Размер файла
-                file_path = report.get('file_path', '')
-                if os.path.exists(file_path):
-                    size = os.path.getsize(file_path)
-                    if size < 1024:
-                        size_text = f"{size} B"
-                    elif size < 1024 * 1024:
-                        size_text = f"{size/1024:.1f} KB"
-                    else:
-                        size_text = f"{size/(1024*1024):.1f} MB"
-                else:
-                    size_text = "Файл не найден"
-                
-                size_item = QTableWidgetItem(size_text)
-                self.table_preview.setItem(row, 3, size_item)
-                
-                # Статус
-                status = report.get('status', '')
-                status_map = {
-                    'completed': "Завершен",
-                    'failed': "Ошибка",
-                    'pending': "В процессе"
-                }
-                status_text = status_map.get(status, status)
-                status_item = QTableWidgetItem(status_text)
-                
-                # Устанавливаем цвет статуса
-                status_item.setForeground(get_status_color(status))
-                self.table_preview.setItem(row, 4, status_item)
+            # Размеры файлов читаем заранее, по одному обходу на каталог
+            file_paths = [report.get('file_path') or '' for report in reports]
+            file_sizes = _scan_file_sizes(file_paths)
+            
+            rows = [
+                (
+                    _TYPE_MAP.get(report.get('type', ''), report.get('type', '')),
+                    format_timestamp(report.get('created_at')),
+                    f"{format_timestamp(report.get('date_from'))} - {format_timestamp(report.get('date_to'))}",
+                    _format_file_size(file_sizes.get(file_path)),
+                    _STATUS_MAP.get(report.get('status', ''), report.get('status', ''))
+                )
+                for report, file_path in zip(reports, file_paths)
+            ]
+            colors = [_status_color(report.get('status', '')) for report in reports]
+            keys = [(report.get('type', ''), _to_date(report.get('created_at'))) for report in reports]
+            
+            # Заменяем содержимое модели одним сбросом
+            with _frozen_view(self.table_preview):
+                self.table_model.reset(
+                    ("Тип", "Дата создания", "Период", "Размер", "Статус"),
+                    rows, colors, 4, keys
+                )
         except Exception as e:
             self.logger.error(f"Ошибка при обновлении списка отчетов: {e}")
             log_exception(self.logger, "Ошибка обновления списка отчетов")
             if hasattr(self.parent, "show_message"):
                 self.parent.show_message("Ошибка", f"Не удалось обновить список отчетов: {e}", QMessageBox.Icon.Critical)
     
+    def _apply_reports_filter(self):
+        """Применение выбранных типа и периода к списку отчетов"""
+        report_types = tuple(_TYPE_MAP)
+        index = self.report_type_combo.currentIndex()
+        report_type = report_types[index] if 0 <= index < len(report_types) else None
+        
+        self.table_proxy.set_filter(
+            report_type,
+            self.date_from.date().toPyDate(),
+            self.date_to.date().toPyDate()
+        )
+    
     def _on_report_type_changed(self, index):
         """
         Обработчик изменения типа отчета
@@ -291,6 +815,9 @@ class ReportsWidget(QWidget):
         # Сбрасываем текущий отчет
         self.current_report['content'] = None
         self.current_report['data'] = None
+        self.current_report['content_key'] = None
+        self.current_report['qdoc'] = None
+        self._html_cache.clear()
         
         # Отключаем кнопки экспорта и печати
         self.export_button.setEnabled(False)
@@ -337,41 +864,70 @@ class ReportsWidget(QWidget):
             self.current_report['date_from'] = self.date_from.date()
             self.current_report['date_to'] = self.date_to.date()
             
-            # Создаем генератор отчетов
-            report_generator = ReportGenerator(self.app_context)
-            
-            # Генерируем отчет в зависимости от типа
-            if report_type == 'sites':
-                report_data = report_generator.generate_sites_report(date_from, date_to)
-            elif report_type == 'changes':
-                report_data = report_generator.generate_changes_report(date_from, date_to)
-            elif report_type == 'errors':
-                report_data = report_generator.generate_errors_report(date_from, date_to)
-            elif report_type == 'stats':
-                report_data = report_generator.generate_stats_report(date_from, date_to)
-            else:
-                raise ValueError(f"Неизвестный тип отчета: {report_type}")
+            # Генерируем отчет в пуле потоков, чтобы не блокировать интерфейс
+            worker = ReportWorker(self.app_context, report_type, date_from, date_to)
+            worker.signals.finished.connect(self._on_report_ready)
+            worker.signals.error.connect(self._on_report_error)
+            self._report_worker = worker
             
-            # Сохраняем данные отчета
-            self.current_report['data'] = report_data
-            
-            # Форматируем отчет в HTML
-            self.current_report['content'] = report_generator.format_report_html(report_data)
-            
-            # Обновляем предпросмотр
-            self._update_preview()
-            
-            # Включаем кнопки экспорта и печати
-            self.export_button.setEnabled(True)
-            self.print_button.setEnabled(True)
-            
-            self.logger.info(f"Отчет {report_type} успешно сгенерирован")
+            self.generate_button.setEnabled(False)
+            QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+            QThreadPool.globalInstance().start(worker)
         
         except Exception as e:
             self.logger.error(f"Ошибка при генерации отчета: {e}")
             log_exception(self.logger, "Ошибка генерации отчета")
             QMessageBox.critical(self, "Ошибка", f"Не удалось сгенерировать отчет: {e}")
     
+    def _finish_generation(self):
+        """Восстановление интерфейса по окончании генерации отчета"""
+        self._report_worker = None
+        QApplication.restoreOverrideCursor()
+        self.generate_button.setEnabled(True)
+    
+    @pyqtSlot(dict, str)
+    def _on_report_ready(self, report_data, content):
+        """
+        Обработка сгенерированного отчета
+        
+        Args:
+            report_data: Данные отчета
+            content: HTML-представление отчета
+        """
+        self._finish_generation()
+        
+        # Пока отчет генерировался, пользователь мог выбрать другой тип
+        report_type = report_data.get('type', self.current_report['type'])
+        if report_type != self.current_report['type']:
+            return
+        
+        # Сохраняем данные и HTML-представление отчета
+        self.current_report['data'] = report_data
+        self.current_report['content'] = content
+        self.current_report['content_key'] = self._content_key()
+        self.current_report['qdoc'] = None
+        self._html_cache.clear()
+        
+        # Обновляем предпросмотр
+        self._update_preview()
+        
+        # Включаем кнопки экспорта и печати
+        self.export_button.setEnabled(True)
+        self.print_button.setEnabled(True)
+        
+        self.logger.info(f"Отчет {report_type} успешно сгенерирован")
+    
+    @pyqtSlot(object)
+    def _on_report_error(self, error):
+        """
+        Обработка ошибки генерации отчета
+        
+        Args:
+            error: Исключение, возникшее при генерации
+        """
+        self._finish_generation()
+        QMessageBox.critical(self, "Ошибка", f"Не удалось сгенерировать отчет: {error}")
+    
     def _on_export_report(self):
         """Обработчик экспорта отчета"""
         self.logger.debug(f"Вызван метод экспорта отчета в формате {self.format_combo.currentText()}")
@@ -392,11 +948,15 @@ class ReportsWidget(QWidget):
             file_filter = format_filters.get(report_format, "Все файлы (*.*)")
             extension = f".{report_format}"
             
+            # Имя файла по умолчанию
+            today_str = datetime.now().strftime('%Y%m%d')
+            default_name = f"report_{self.current_report['type']}_{today_str}{extension}"
+            
             # Открываем диалог сохранения файла
             file_path, _ = QFileDialog.getSaveFileName(
                 self,
                 "Сохранить отчет",
-                f"report_{self.current_report['type']}_{datetime.date.today().strftime('%Y%m%d')}{extension}",
+                default_name,
                 file_filter
             )
             
@@ -408,30 +968,27 @@ class ReportsWidget(QWidget):
                 file_path += extension
             
             # Экспортируем отчет в зависимости от формата
-            if report_format == 'html':
-                self._export_html(file_path)
-            elif report_format == 'csv':
-                self._export_csv(file_path)
-            elif report_format == 'xlsx':
-                try:
-                    # Пробуем импортировать openpyxl
-                    import openpyxl
-                    self._export_xlsx(file_path)
-                except ImportError:
-                    self.logger.error("Библиотека openpyxl не установлена")
-                    QMessageBox.warning(
-                        self,
-                        "Отсутствует библиотека",
-                        "Для экспорта в Excel требуется библиотека openpyxl.\n"
-                        "Установите ее командой: pip install openpyxl"
-                    )
-            elif report_format == 'pdf':
-                self._export_pdf(file_path)
-            else:
+            exporter = self._exporters.get(report_format)
+            if exporter is None:
                 raise ValueError(f"Неизвестный формат отчета: {report_format}")
             
+            try:
+                exporter(file_path)
+            except ImportError:
+                # Для экспорта в Excel нужна библиотека openpyxl
+                if report_format != 'xlsx':
+                    raise
+                self.logger.error("Библиотека openpyxl не установлена")
+                QMessageBox.warning(
+                    self,
+                    "Отсутствует библиотека",
+                    "Для экспорта в Excel требуется библиотека openpyxl.\n"
+                    "Установите ее командой: pip install openpyxl"
+                )
+                return
+            
             # Сообщение об успешном экспорте
-            if report_format in ['html', 'csv', 'xlsx', 'pdf'] and os.path.exists(file_path):
+            if os.path.exists(file_path):
                 self.logger.info(f"Отчет успешно экспортирован в {file_path}")
                 QMessageBox.information(self, "Успех", f"Отчет успешно экспортирован в {file_path}")
         
@@ -449,15 +1006,10 @@ class ReportsWidget(QWidget):
         """
         self.logger.debug(f"Экспорт отчета в HTML-формат: {file_path}")
         
-        # Проверяем наличие HTML-контента
-        if not self.current_report['content']:
-            # Обновляем HTML-контент
-            self._update_html_preview()
-        
         # Сохраняем HTML-контент в файл
         try:
             with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(self.current_report['content'])
+                f.write(self._ensure_content())
         except Exception as e:
             self.logger.error(f"Ошибка при сохранении HTML-файла: {e}")
             raise
@@ -472,64 +1024,30 @@ class ReportsWidget(QWidget):
         self.logger.debug(f"Экспорт отчета в CSV-формат: {file_path}")
         
         try:
+            import csv
+            
             # Получаем данные отчета
             report_data = self.current_report['data']
             report_type = report_data['type']
             
-            with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
+            with open(file_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
                 writer = csv.writer(csvfile)
                 
                 if report_type == 'sites':
-                    # Заголовки для отчета по сайтам
-                    headers = ['Название', 'URL', 'Группа', 'Статус', 'Последняя проверка', 
-                             'Последнее изменение', 'Изменений', 'Ошибок']
-                    writer.writerow(headers)
-                    
-                    # Записываем данные о сайтах
-                    for site in report_data['sites']:
-                        row = [
-                            site['name'],
-                            site['url'],
-                            site['group_name'] or 'Без группы',
-                            site['status'],
-                            site['last_check'].strftime('%d.%m.%Y %H:%M') if site['last_check'] else '-',
-                            site['last_change'].strftime('%d.%m.%Y %H:%M') if site['last_change'] else '-',
-                            site['changes_count'],
-                            site['errors_count']
-                        ]
-                        writer.writerow(row)
+                    # Заголовки и данные отчета по сайтам
+                    writer.writerow(['Название', 'URL', 'Группа', 'Статус', 'Последняя проверка', 
+                                     'Последнее изменение', 'Изменений', 'Ошибок'])
+                    writer.writerows(map(_ROW_BUILDERS['sites'], report_data['sites']))
                 
                 elif report_type == 'changes':
-                    # Заголовки для отчета по изменениям
-                    headers = ['Сайт', 'Дата', 'Процент изменений', 'Статус', 'Проверил', 'Комментарий']
-                    writer.writerow(headers)
-                    
-                    # Записываем данные об изменениях
-                    for change in report_data['changes']:
-                        row = [
-                            change['site_name'],
-                            change['timestamp'].strftime('%d.%m.%Y %H:%M'),
-                            f"{change['diff_percent']:.2f}%",
-                            change['status'],
-                            change['reviewed_by'] or '-',
-                            change['notes'] or '-'
-                        ]
-                        writer.writerow(row)
+                    # Заголовки и данные отчета по изменениям
+                    writer.writerow(['Сайт', 'Дата', 'Процент изменений', 'Статус', 'Проверил', 'Комментарий'])
+                    writer.writerows(map(_ROW_BUILDERS['changes'], report_data['changes']))
                 
                 elif report_type == 'errors':
-                    # Заголовки для отчета по ошибкам
-                    headers = ['Сайт', 'Дата', 'Сообщение об ошибке', 'Группа']
-                    writer.writerow(headers)
-                    
-                    # Записываем данные об ошибках
-                    for error in report_data['errors']:
-                        row = [
-                            error['name'],
-                            error['error_time'].strftime('%d.%m.%Y %H:%M'),
-                            error['error_message'],
-                            error['group_name'] or '-'
-                        ]
-                        writer.writerow(row)
+                    # Заголовки и данные отчета по ошибкам
+                    writer.writerow(['Сайт', 'Дата', 'Сообщение об ошибке', 'Группа'])
+                    writer.writerows(map(_ROW_BUILDERS['errors'], report_data['errors']))
                 
                 elif report_type == 'stats':
                     # Записываем общую статистику
@@ -573,10 +1091,7 @@ class ReportsWidget(QWidget):
             import openpyxl
             from openpyxl.styles import Font, PatternFill, Alignment
             from openpyxl.utils import get_column_letter
-            
-            # Создаем новую книгу
-            wb = openpyxl.Workbook()
-            ws = wb.active
+            from openpyxl.cell import WriteOnlyCell
             
             # Получаем данные отчета
             report_data = self.current_report['data']
@@ -586,68 +1101,62 @@ class ReportsWidget(QWidget):
             header_font = Font(bold=True)
             header_fill = PatternFill(start_color='F0F0F0', end_color='F0F0F0', fill_type='solid')
             
-            if report_type == 'sites':
-                ws.title = 'Сайты'
+            # Табличные отчеты записываются в потоковом режиме (write_only):
+            # строки добавляются через append() без хранения ячеек в памяти
+            tabular = {
+                'sites': ('Сайты', ['Название', 'URL', 'Группа', 'Статус', 'Последняя проверка', 
+                                    'Последнее изменение', 'Изменений', 'Ошибок']),
+                'changes': ('Изменения', ['Сайт', 'Дата', 'Процент изменений', 'Статус', 'Проверил', 'Комментарий']),
+                'errors': ('Ошибки', ['Сайт', 'Дата', 'Сообщение об ошибке', 'Группа'])
+            }
+            
+            if report_type in tabular:
+                title, headers = tabular[report_type]
+                records = report_data[report_type]
+                rows = map(_ROW_BUILDERS[report_type], records)
                 
-                # Заголовки
-                headers = ['Название', 'URL', 'Группа', 'Статус', 'Последняя проверка', 
-                         'Последнее изменение', 'Изменений', 'Ошибок']
+                # Ширину столбцов в потоковом режиме нужно задать до записи строк,
+                # поэтому оцениваем ее по заголовкам и первым строкам данных
+                sample = list(itertools.islice(rows, _XLSX_WIDTH_SAMPLE_ROWS))
+                widths = [len(header) for header in headers]
+                for row in sample:
+                    for col, value in enumerate(row):
+                        widths[col] = max(widths[col], len(str(value)))
+                widths = [min(width + 2, _XLSX_MAX_COLUMN_WIDTH) for width in widths]
                 
-                for col, header in enumerate(headers, 1):
-                    cell = ws.cell(row=1, column=col, value=header)
-                    cell.font = header_font
-                    cell.fill = header_fill
+                # Очень большие отчеты пишем прямо в XML, минуя openpyxl
+                if len(records) > _XLSX_STREAM_THRESHOLD:
+                    from reports.xlsx_stream import write_xlsx_stream
+                    
+                    write_xlsx_stream(file_path, title, headers, itertools.chain(sample, rows), widths)
+                    return
                 
-                # Данные
-                for row, site in enumerate(report_data['sites'], 2):
-                    ws.cell(row=row, column=1, value=site['name'])
-                    ws.cell(row=row, column=2, value=site['url'])
-                    ws.cell(row=row, column=3, value=site['group_name'] or 'Без группы')
-                    ws.cell(row=row, column=4, value=site['status'])
-                    ws.cell(row=row, column=5, value=site['last_check'].strftime('%d.%m.%Y %H:%M') if site['last_check'] else '-')
-                    ws.cell(row=row, column=6, value=site['last_change'].strftime('%d.%m.%Y %H:%M') if site['last_change'] else '-')
-                    ws.cell(row=row, column=7, value=site['changes_count'])
-                    ws.cell(row=row, column=8, value=site['errors_count'])
-            
-            elif report_type == 'changes':
-                ws.title = 'Изменения'
+                wb = openpyxl.Workbook(write_only=True)
+                ws = wb.create_sheet(title)
+                for col, width in enumerate(widths, 1):
+                    ws.column_dimensions[get_column_letter(col)].width = width
                 
                 # Заголовки
-                headers = ['Сайт', 'Дата', 'Процент изменений', 'Статус', 'Проверил', 'Комментарий']
-            
-                for col, header in enumerate(headers, 1):
-                    cell = ws.cell(row=1, column=col, value=header)
+                header_cells = []
+                for header in headers:
+                    cell = WriteOnlyCell(ws, value=header)
                     cell.font = header_font
                     cell.fill = header_fill
-            
-            # Данные
-                for row, change in enumerate(report_data['changes'], 2):
-                    ws.cell(row=row, column=1, value=change['site_name'])
-                    ws.cell(row=row, column=2, value=change['timestamp'].strftime('%d.%m.%Y %H:%M'))
-                    ws.cell(row=row, column=3, value=f"{change['diff_percent']:.2f}%")
-                    ws.cell(row=row, column=4, value=change['status'])
-                    ws.cell(row=row, column=5, value=change['reviewed_by'] or '-')
-                    ws.cell(row=row, column=6, value=change['notes'] or '-')
-            
-            elif report_type == 'errors':
-                ws.title = 'Ошибки'
+                    header_cells.append(cell)
+                ws.append(header_cells)
                 
-                # Заголовки
-                headers = ['Сайт', 'Дата', 'Сообщение об ошибке', 'Группа']
-            
-                for col, header in enumerate(headers, 1):
-                    cell = ws.cell(row=1, column=col, value=header)
-                    cell.font = header_font
-                    cell.fill = header_fill
+                # Данные
+                for row in itertools.chain(sample, rows):
+                    ws.append(row)
+                
+                wb.save(file_path)
+                return
             
-            # Данные
-                for row, error in enumerate(report_data['errors'], 2):
-                    ws.cell(row=row, column=1, value=error['name'])
-                    ws.cell(row=row, column=2, value=error['error_time'].strftime('%d.%m.%Y %H:%M'))
-                    ws.cell(row=row, column=3, value=error['error_message'])
-                    ws.cell(row=row, column=4, value=error['group_name'] or '-')
+            # Создаем новую книгу
+            wb = openpyxl.Workbook()
+            ws = wb.active
             
-            elif report_type == 'stats':
+            if report_type == 'stats':
                 ws.title = 'Статистика'
                 
                 current_row = 1
@@ -701,18 +1210,14 @@ class ReportsWidget(QWidget):
                     ws.cell(row=current_row, column=2, value=stat[1])
                     current_row += 1
             
-            # Автоматическая ширина столбцов
-            for column in ws.columns:
-                max_length = 0
-                column = [cell for cell in column]
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = (max_length + 2)
-                ws.column_dimensions[get_column_letter(column[0].column)].width = adjusted_width
+            # Ширина столбцов по первым строкам (обход всех ячеек слишком дорог)
+            sample_rows = min(ws.max_row, _XLSX_WIDTH_SAMPLE_ROWS)
+            for col in range(1, ws.max_column + 1):
+                max_length = max(
+                    (len(str(ws.cell(row=row, column=col).value or '')) for row in range(1, sample_rows + 1)),
+                    default=10
+                )
+                ws.column_dimensions[get_column_letter(col)].width = min(max_length + 2, _XLSX_MAX_COLUMN_WIDTH)
             
             # Сохраняем файл
             wb.save(file_path)
@@ -732,24 +1237,47 @@ class ReportsWidget(QWidget):
         self.logger.debug(f"Экспорт отчета в PDF-формат: {file_path}")
         
         try:
-            # Создаем принтер для PDF
+            from PyQt6.QtGui import QPageSize
+            from PyQt6.QtPrintSupport import QPrinter
+            
+            # Печать напрямую в PDF-файл, без диалога и системного спулера
             printer = QPrinter(QPrinter.PrinterMode.HighResolution)
             printer.setOutputFormat(QPrinter.OutputFormat.PdfFormat)
             printer.setOutputFileName(file_path)
-            printer.setPageSize(QPrinter.PageSize.A4)
-            
-            # Создаем документ
-            document = QTextDocument()
-            document.setHtml(self.current_report['content'])
+            printer.setPageSize(QPageSize(QPageSize.PageSizeId.A4))
             
             # Печатаем в PDF
-            document.print(printer)
+            self._get_qdoc().print(printer)
         
         except Exception as e:
             self.logger.error(f"Ошибка при экспорте в PDF: {e}")
             log_exception(self.logger, "Ошибка экспорта в PDF")
             raise
     
+    def _get_qdoc(self):
+        """
+        Получение документа для печати и экспорта в PDF
+        
+        Документ создается из HTML-контента отчета один раз и
+        сбрасывается при замене контента.
+        
+        Returns:
+            QTextDocument: Документ с содержимым отчета
+        """
+        content = self._ensure_content()
+        document = self.current_report['qdoc']
+        if document is None:
+            from PyQt6.QtGui import QTextDocument
+            
+            # Без родителя: документ освобождается, как только сброшена ссылка в current_report
+            document = QTextDocument()
+            # Метрики шрифтов без хинтинга экрана: раскладка не пересчитывается под принтер
+            document.setUseDesignMetrics(True)
+            document.setHtml(content)
+            self.current_report['qdoc'] = document
+        
+        return document
+    
     def _update_preview(self):
         """Обновление предпросмотра отчета"""
         self.logger.debug("Обновление предпросмотра отчета")
@@ -768,31 +1296,116 @@ class ReportsWidget(QWidget):
             self._update_table_preview()
             self.preview_area.setCurrentIndex(1)  # Показываем табличное превью
     
+    def _content_key(self):
+        """
+        Ключ актуальности HTML-контента отчета
+        
+        Returns:
+            tuple: (тип отчета, данные, начало и конец периода)
+        """
+        return (
+            self.current_report['type'],
+            id(self.current_report['data']),
+            self.date_from.date(),
+            self.date_to.date()
+        )
+    
+    def _ensure_content(self):
+        """
+        Получение актуального HTML-контента отчета
+        
+        HTML строится только если его еще нет или он построен для других
+        данных или периода; предпросмотр при этом не обновляется.
+        
+        Returns:
+            str: HTML-контент отчета
+        """
+        if (not self.current_report['content']
+                or self.current_report['content_key'] != self._content_key()):
+            self._render_html()
+        return self.current_report['content']
+    
     def _update_html_preview(self):
         """Обновление HTML-предпросмотра"""
         self.logger.debug("Обновление HTML-предпросмотра")
         
+        # Устанавливаем HTML-контент в предпросмотр
+        self._load_html_chunked(self._render_html())
+    
+    def _render_html(self):
+        """
+        Построение HTML-контента текущего отчета
+        
+        Returns:
+            str: HTML-контент отчета
+        """
         # Получаем тип отчета и данные
         report_type = self.current_report['type']
         data = self.current_report['data']
         
-        # Генерируем HTML-контент в зависимости от типа отчета
-        if report_type == 'sites':
-            html_content = self._generate_sites_html(data)
-        elif report_type == 'changes':
-            html_content = self._generate_changes_html(data)
-        elif report_type == 'errors':
-            html_content = self._generate_errors_html(data)
-        elif report_type == 'stats':
-            html_content = self._generate_stats_html(data)
-        else:
-            html_content = "<h1>Неизвестный тип отчета</h1>"
+        # Период и время создания вычисляются один раз для всего отчета
+        ctx = {
+            'date_from': self.date_from.date().toString("dd.MM.yyyy"),
+            'date_to': self.date_to.date().toString("dd.MM.yyyy"),
+            'generated': datetime.now().strftime("%d.%m.%Y %H:%M:%S")
+        }
         
-        # Устанавливаем HTML-контент в предпросмотр
-        self.html_preview.setHtml(html_content)
+        # Повторно используем HTML, уже построенный для тех же данных и периода
+        cache_key = (report_type, id(data), len(data), ctx['date_from'], ctx['date_to'])
+        html_content = self._html_cache.get(cache_key)
+        
+        if html_content is None:
+            # Генерируем HTML-контент в зависимости от типа отчета
+            spec = self._report_specs.get(report_type)
+            html_content = spec['html'](data, ctx) if spec else _UNKNOWN_REPORT_HTML
+            
+            self._html_cache[cache_key] = html_content
+        
+        # Сохраняем сгенерированный контент (документ для печати - только если контент изменился)
+        if html_content is not self.current_report['content']:
+            self.current_report['content'] = html_content
+            self.current_report['qdoc'] = None
+        self.current_report['content_key'] = self._content_key()
         
-        # Сохраняем сгенерированный контент
-        self.current_report['content'] = html_content
+        return html_content
+    
+    def _load_html_chunked(self, html):
+        """
+        Загрузка HTML в предпросмотр фрагментами
+        
+        Небольшие документы устанавливаются целиком. Крупные вставляются
+        по частям с обработкой событий между ними, чтобы интерфейс
+        не замирал на время разбора и компоновки документа.
+        
+        Args:
+            html: HTML-контент
+        """
+        self._html_load_id += 1
+        load_id = self._html_load_id
+        
+        document = self.html_preview.document()
+        
+        if len(html) <= HTML_CHUNK_SIZE:
+            document.setDefaultStyleSheet("")
+            self.html_preview.setHtml(html)
+            return
+        
+        # Стили переносим в документ, чтобы они применялись ко всем фрагментам
+        style = _STYLE_RE.search(html)
+        document.clear()
+        document.setDefaultStyleSheet(style.group(1) if style else "")
+        
+        cursor = QTextCursor(document)
+        for chunk in split_html_chunks(_STYLE_RE.sub("", html)):
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            cursor.insertHtml(chunk)
+            QApplication.processEvents()
+            
+            # Загрузка прервана новым отчетом
+            if load_id != self._html_load_id:
+                return
+        
+        self.html_preview.moveCursor(QTextCursor.MoveOperation.Start)
     
     def _update_table_preview(self):
         """Обновление табличного предпросмотра"""
@@ -802,18 +1415,31 @@ class ReportsWidget(QWidget):
         report_type = self.current_report['type']
         data = self.current_report['data']
         
-        # Очищаем таблицу
-        self.table_preview.setRowCount(0)
-        
         # Заполняем таблицу в зависимости от типа отчета
-        if report_type == 'sites':
-            self._fill_sites_table(data)
-        elif report_type == 'changes':
-            self._fill_changes_table(data)
-        elif report_type == 'errors':
-            self._fill_errors_table(data)
-        elif report_type == 'stats':
-            self._fill_stats_table(data)
+        spec = self._report_specs.get(report_type)
+        if spec is None:
+            return
+        
+        with _frozen_view(self.table_preview):
+            spec['fill'](data)
+    
+    def _setup_columns(self, widths, stretch):
+        """
+        Настройка столбцов таблицы предпросмотра
+        
+        Ширина задается заранее, а не по содержимому: режим ResizeToContents
+        измеряет текст каждой ячейки при любом изменении модели.
+        
+        Args:
+            widths: Ширина столбцов в пикселях по номерам столбцов
+            stretch: Номера растягиваемых столбцов
+        """
+        header = self.table_preview.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        for column, width in widths.items():
+            header.resizeSection(column, width)
+        for column in stretch:
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.Stretch)
     
     def _fill_sites_table(self, data):
         """
@@ -824,47 +1450,10 @@ class ReportsWidget(QWidget):
         """
         self.logger.debug("Заполнение таблицы данными о сайтах")
         
-        # Устанавливаем заголовки столбцов
-        self.table_preview.setColumnCount(7)
-        self.table_preview.setHorizontalHeaderLabels([
-            "ID", "Название", "URL", "Группа", "Последняя проверка", 
-            "Последнее изменение", "Статус"
-        ])
+        self.table_model.set_records(_SITES_COLUMNS, data)
         
-        # Настраиваем растяжение столбцов
-        self.table_preview.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
-        self.table_preview.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-        self.table_preview.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
-        
-        # Заполняем таблицу данными
-        for site in data:
-            row_position = self.table_preview.rowCount()
-            self.table_preview.insertRow(row_position)
-            
-            # ID сайта
-            self.table_preview.setItem(row_position, 0, QTableWidgetItem(str(site.get('id', ''))))
-            
-            # Название сайта
-            self.table_preview.setItem(row_position, 1, QTableWidgetItem(site.get('name', '')))
-            
-            # URL сайта
-            self.table_preview.setItem(row_position, 2, QTableWidgetItem(site.get('url', '')))
-            
-            # Группа
-            self.table_preview.setItem(row_position, 3, QTableWidgetItem(site.get('group', '')))
-            
-            # Последняя проверка
-            last_check = site.get('last_check', '')
-            self.table_preview.setItem(row_position, 4, QTableWidgetItem(str(last_check)))
-            
-            # Последнее изменение
-            last_change = site.get('last_change', '')
-            self.table_preview.setItem(row_position, 5, QTableWidgetItem(str(last_change)))
-            
-            # Статус
-            status = site.get('status', '')
-            status_item = QTableWidgetItem(status)
-            self.table_preview.setItem(row_position, 6, status_item)
+        # Настраиваем ширину и растяжение столбцов
+        self._setup_columns({0: 60, 3: 120, 4: 130, 5: 130, 6: 100}, (1, 2))
     
     def _fill_changes_table(self, data):
         """
@@ -875,42 +1464,10 @@ class ReportsWidget(QWidget):
         """
         self.logger.debug("Заполнение таблицы данными об изменениях")
         
-        # Устанавливаем заголовки столбцов
-        self.table_preview.setColumnCount(6)
-        self.table_preview.setHorizontalHeaderLabels([
-            "ID", "Сайт", "URL", "Дата", "Изменения (%)", "Статус"
-        ])
+        self.table_model.set_records(_CHANGES_COLUMNS, data)
         
-        # Настраиваем растяжение столбцов
-        self.table_preview.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
-        self.table_preview.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-        self.table_preview.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
-        
-        # Заполняем таблицу данными
-        for change in data:
-            row_position = self.table_preview.rowCount()
-            self.table_preview.insertRow(row_position)
-            
-            # ID изменения
-            self.table_preview.setItem(row_position, 0, QTableWidgetItem(str(change.get('id', ''))))
-            
-            # Название сайта
-            self.table_preview.setItem(row_position, 1, QTableWidgetItem(change.get('site_name', '')))
-            
-            # URL сайта
-            self.table_preview.setItem(row_position, 2, QTableWidgetItem(change.get('url', '')))
-            
-            # Дата
-            change_date = change.get('date', '')
-            self.table_preview.setItem(row_position, 3, QTableWidgetItem(str(change_date)))
-            
-            # Изменения (%)
-            changes_percent = change.get('diff_percent', 0)
-            self.table_preview.setItem(row_position, 4, QTableWidgetItem(f"{changes_percent:.2f}%"))
-            
-            # Статус
-            status = change.get('status', '')
-            self.table_preview.setItem(row_position, 5, QTableWidgetItem(status))
+        # Настраиваем ширину и растяжение столбцов
+        self._setup_columns({0: 60, 3: 130, 4: 110, 5: 100}, (1, 2))
     
     def _fill_errors_table(self, data):
         """
@@ -921,39 +1478,10 @@ class ReportsWidget(QWidget):
         """
         self.logger.debug("Заполнение таблицы данными об ошибках")
         
-        # Устанавливаем заголовки столбцов
-        self.table_preview.setColumnCount(5)
-        self.table_preview.setHorizontalHeaderLabels([
-            "ID", "Сайт", "URL", "Дата", "Ошибка"
-        ])
+        self.table_model.set_records(_ERRORS_COLUMNS, data)
         
-        # Настраиваем растяжение столбцов
-        self.table_preview.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
-        self.table_preview.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-        self.table_preview.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
-        self.table_preview.horizontalHeader().setSectionResizeMode(4, QHeaderView.ResizeMode.Stretch)
-        
-        # Заполняем таблицу данными
-        for error in data:
-            row_position = self.table_preview.rowCount()
-            self.table_preview.insertRow(row_position)
-            
-            # ID ошибки
-            self.table_preview.setItem(row_position, 0, QTableWidgetItem(str(error.get('id', ''))))
-            
-            # Название сайта
-            self.table_preview.setItem(row_position, 1, QTableWidgetItem(error.get('site_name', '')))
-            
-            # URL сайта
-            self.table_preview.setItem(row_position, 2, QTableWidgetItem(error.get('url', '')))
-            
-            # Дата
-            error_date = error.get('date', '')
-            self.table_preview.setItem(row_position, 3, QTableWidgetItem(str(error_date)))
-            
-            # Ошибка
-            error_message = error.get('message', '')
-            self.table_preview.setItem(row_position, 4, QTableWidgetItem(error_message))
+        # Настраиваем ширину и растяжение столбцов
+        self._setup_columns({0: 60, 3: 130}, (1, 2, 4))
     
     def _fill_stats_table(self, data):
         """
@@ -964,351 +1492,88 @@ class ReportsWidget(QWidget):
         """
         self.logger.debug("Заполнение таблицы статистическими данными")
         
-        # Устанавливаем заголовки столбцов
-        self.table_preview.setColumnCount(2)
-        self.table_preview.setHorizontalHeaderLabels([
-            "Показатель", "Значение"
-        ])
+        rows = [(key, str(value)) for key, value in data.items()]
+        self.table_model.reset(["Показатель", "Значение"], rows)
         
         # Настраиваем растяжение столбцов
         self.table_preview.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+    
+    @staticmethod
+    def _render_report_html(template_name, title, data, ctx, **context):
+        """
+        Формирование HTML отчета по шаблону
         
-        # Заполняем таблицу данными
-        for key, value in data.items():
-            row_position = self.table_preview.rowCount()
-            self.table_preview.insertRow(row_position)
-            
-            # Показатель
-            self.table_preview.setItem(row_position, 0, QTableWidgetItem(key))
+        Args:
+            template_name: Имя файла шаблона
+            title: Заголовок отчета
+            data: Данные отчета
+            ctx: Период отчета и время создания (date_from, date_to, generated)
+            **context: Дополнительные переменные шаблона
             
-            # Значение
-            self.table_preview.setItem(row_position, 1, QTableWidgetItem(str(value)))
+        Returns:
+            HTML-код отчета
+        """
+        return _report_template(template_name).render(title=title, data=data, **ctx, **context)
     
-    def _generate_sites_html(self, data):
+    def _generate_sites_html(self, data, ctx):
         """
         Генерация HTML-таблицы с данными о сайтах
         
         Args:
             data: Данные о сайтах
+            ctx: Период отчета и время создания
             
         Returns:
             HTML-код таблицы
         """
-        # Получаем период отчета
-        date_from = self.date_from.date().toString("dd.MM.yyyy")
-        date_to = self.date_to.date().toString("dd.MM.yyyy")
-        
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <title>Отчет по сайтам</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 20px; }}
-                h1 {{ color: #333366; }}
-                table {{ border-collapse: collapse; width: 100%; margin-top: 20px; }}
-                th, td {{ text-align: left; padding: 8px; border: 1px solid #ddd; }}
-                th {{ background-color: #f2f2f2; color: #333; }}
-                tr:nth-child(even) {{ background-color: #f9f9f9; }}
-                .header {{ margin-bottom: 20px; }}
-                .footer {{ margin-top: 20px; color: #666; font-size: 0.8em; }}
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>Отчет по сайтам</h1>
-                <p>Период: {date_from} - {date_to}</p>
-                <p>Дата создания: {datetime.datetime.now().strftime("%d.%m.%Y %H:%M:%S")}</p>
-            </div>
-            
-            <table>
-                <tr>
-                    <th>ID</th>
-                    <th>Название</th>
-                    <th>URL</th>
-                    <th>Группа</th>
-                    <th>Последняя проверка</th>
-                    <th>Последнее изменение</th>
-                    <th>Статус</th>
-                </tr>
-        """
-        
-        for site in data:
-            html += f"""
-                <tr>
-                    <td>{site.get('id', '')}</td>
-                    <td>{site.get('name', '')}</td>
-                    <td>{site.get('url', '')}</td>
-                    <td>{site.get('group', '')}</td>
-                    <td>{site.get('last_check', '')}</td>
-                    <td>{site.get('last_change', '')}</td>
-                    <td>{site.get('status', '')}</td>
-                </tr>
-            """
-        
-        html += """
-            </table>
-        """
-        
-        # Добавляем сводную информацию
-        total_sites = len(data)
-        active_sites = sum(1 for site in data if site.get('status', '') == 'Активен')
-        
-        html += f"""
-            <div class="summary">
-                <h3>Сводная информация</h3>
-                <p>Всего сайтов: {total_sites}</p>
-                <p>Активных сайтов: {active_sites}</p>
-                <p>Неактивных сайтов: {total_sites - active_sites}</p>
-            </div>
-            
-            <div class="footer">
-                <p>Отчет создан с помощью Web Data Monitor V12</p>
-            </div>
-        </body>
-        </html>
-        """
-        
-        return html
+        return self._render_report_html('sites.html', "Отчет по сайтам", data, ctx)
     
-    def _generate_changes_html(self, data):
+    def _generate_changes_html(self, data, ctx):
         """
         Генерация HTML-таблицы с данными об изменениях
         
         Args:
             data: Данные об изменениях
+            ctx: Период отчета и время создания
             
         Returns:
             HTML-код таблицы
         """
-        # Получаем период отчета
-        date_from = self.date_from.date().toString("dd.MM.yyyy")
-        date_to = self.date_to.date().toString("dd.MM.yyyy")
-        
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <title>Отчет по изменениям</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 20px; }}
-                h1 {{ color: #333366; }}
-                table {{ border-collapse: collapse; width: 100%; margin-top: 20px; }}
-                th, td {{ text-align: left; padding: 8px; border: 1px solid #ddd; }}
-                th {{ background-color: #f2f2f2; color: #333; }}
-                tr:nth-child(even) {{ background-color: #f9f9f9; }}
-                .header {{ margin-bottom: 20px; }}
-                .footer {{ margin-top: 20px; color: #666; font-size: 0.8em; }}
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>Отчет по изменениям</h1>
-                <p>Период: {date_from} - {date_to}</p>
-                <p>Дата создания: {datetime.datetime.now().strftime("%d.%m.%Y %H:%M:%S")}</p>
-            </div>
-            
-            <table>
-                <tr>
-                    <th>ID</th>
-                    <th>Сайт</th>
-                    <th>URL</th>
-                    <th>Дата</th>
-                    <th>Изменения (%)</th>
-                    <th>Статус</th>
-                </tr>
-        """
-        
-        for change in data:
-            diff_percent = change.get('diff_percent', 0)
-            html += f"""
-                <tr>
-                    <td>{change.get('id', '')}</td>
-                    <td>{change.get('site_name', '')}</td>
-                    <td>{change.get('url', '')}</td>
-                    <td>{change.get('date', '')}</td>
-                    <td>{diff_percent:.2f}%</td>
-                    <td>{change.get('status', '')}</td>
-                </tr>
-            """
-        
-        html += """
-            </table>
-        """
-        
-        # Добавляем сводную информацию
-        total_changes = len(data)
-        avg_diff = sum(change.get('diff_percent', 0) for change in data) / max(total_changes, 1)
-        
-        html += f"""
-            <div class="summary">
-                <h3>Сводная информация</h3>
-                <p>Всего изменений: {total_changes}</p>
-                <p>Среднее изменение: {avg_diff:.2f}%</p>
-            </div>
-            
-            <div class="footer">
-                <p>Отчет создан с помощью Web Data Monitor V12</p>
-            </div>
-        </body>
-        </html>
-        """
-        
-        return html
+        return self._render_report_html('changes.html', "Отчет по изменениям", data, ctx)
     
-    def _generate_errors_html(self, data):
+    def _generate_errors_html(self, data, ctx):
         """
         Генерация HTML-таблицы с данными об ошибках
         
         Args:
             data: Данные об ошибках
+            ctx: Период отчета и время создания
             
         Returns:
             HTML-код таблицы
         """
-        # Получаем период отчета
-        date_from = self.date_from.date().toString("dd.MM.yyyy")
-        date_to = self.date_to.date().toString("dd.MM.yyyy")
-        
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <title>Отчет по ошибкам</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 20px; }}
-                h1 {{ color: #333366; }}
-                table {{ border-collapse: collapse; width: 100%; margin-top: 20px; }}
-                th, td {{ text-align: left; padding: 8px; border: 1px solid #ddd; }}
-                th {{ background-color: #f2f2f2; color: #333; }}
-                tr:nth-child(even) {{ background-color: #f9f9f9; }}
-                .header {{ margin-bottom: 20px; }}
-                .footer {{ margin-top: 20px; color: #666; font-size: 0.8em; }}
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>Отчет по ошибкам</h1>
-                <p>Период: {date_from} - {date_to}</p>
-                <p>Дата создания: {datetime.datetime.now().strftime("%d.%m.%Y %H:%M:%S")}</p>
-            </div>
-            
-            <table>
-                <tr>
-                    <th>ID</th>
-                    <th>Сайт</th>
-                    <th>URL</th>
-                    <th>Дата</th>
-                    <th>Ошибка</th>
-                </tr>
-        """
-        
-        for error in data:
-            html += f"""
-                <tr>
-                    <td>{error.get('id', '')}</td>
-                    <td>{error.get('site_name', '')}</td>
-                    <td>{error.get('url', '')}</td>
-                    <td>{error.get('date', '')}</td>
-                    <td>{error.get('message', '')}</td>
-                </tr>
-            """
-        
-        html += """
-            </table>
-        """
-        
-        # Добавляем сводную информацию
-        total_errors = len(data)
-        
-        html += f"""
-            <div class="summary">
-                <h3>Сводная информация</h3>
-                <p>Всего ошибок: {total_errors}</p>
-            </div>
-            
-            <div class="footer">
-                <p>Отчет создан с помощью Web Data Monitor V12</p>
-            </div>
-        </body>
-        </html>
-        """
-        
-        return html
+        return self._render_report_html('errors.html', "Отчет по ошибкам", data, ctx)
     
-    def _generate_stats_html(self, data):
+    def _generate_stats_html(self, data, ctx):
         """
         Генерация HTML-таблицы со статистическими данными
         
         Args:
             data: Статистические данные
+            ctx: Период отчета и время создания
             
         Returns:
             HTML-код таблицы
         """
-        # Получаем период отчета
-        date_from = self.date_from.date().toString("dd.MM.yyyy")
-        date_to = self.date_to.date().toString("dd.MM.yyyy")
-        
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <title>Статистический отчет</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 20px; }}
-                h1 {{ color: #333366; }}
-                table {{ border-collapse: collapse; width: 100%; margin-top: 20px; }}
-                th, td {{ text-align: left; padding: 8px; border: 1px solid #ddd; }}
-                th {{ background-color: #f2f2f2; color: #333; }}
-                tr:nth-child(even) {{ background-color: #f9f9f9; }}
-                .header {{ margin-bottom: 20px; }}
-                .footer {{ margin-top: 20px; color: #666; font-size: 0.8em; }}
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>Статистический отчет</h1>
-                <p>Период: {date_from} - {date_to}</p>
-                <p>Дата создания: {datetime.datetime.now().strftime("%d.%m.%Y %H:%M:%S")}</p>
-            </div>
-            
-            <table>
-                <tr>
-                    <th>Показатель</th>
-                    <th>Значение</th>
-                </tr>
-        """
-        
-        for key, value in data.items():
-            html += f"""
-                <tr>
-                    <td>{key}</td>
-                    <td>{value}</td>
-                </tr>
-            """
-        
-        html += """
-            </table>
-            
-            <div class="footer">
-                <p>Отчет создан с помощью Web Data Monitor V12</p>
-            </div>
-        </body>
-        </html>
-        """
-        
-        return html
+        return self._render_report_html('stats.html', "Статистический отчет", data, ctx)
     
     def _on_print_report(self):
         """Обработчик печати отчета"""
         self.logger.debug("Вызван метод печати отчета")
         
         try:
+            from PyQt6.QtPrintSupport import QPrinter, QPrintDialog
+            
             # Создаем принтер
             printer = QPrinter(QPrinter.PrinterMode.HighResolution)
             
@@ -1317,12 +1582,8 @@ class ReportsWidget(QWidget):
             if dialog.exec() != QPrintDialog.DialogCode.Accepted:
                 return
             
-            # Создаем документ
-            document = QTextDocument()
-            document.setHtml(self.current_report['content'])
-            
             # Печатаем документ
-            document.print(printer)
+            self._get_qdoc().print(printer)
             
             self.logger.info("Отчет успешно отправлен на печать")
             QMessageBox.information(self, "Успех", "Отчет успешно отправлен на печать")
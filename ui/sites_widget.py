@@ -26,6 +26,7 @@ from utils.logger import get_module_logger, log_exception
 from utils.common import format_timestamp, get_diff_color, get_status_color, handle_errors
 from ui.table_utils import OptimizedTable, BatchDataLoader, get_ui_updater
 from ui.table_converter import TableStyler, CommonTableSetup
+from ui.updatable import Updatable
 
 
 class SiteDialog(QDialog):
@@ -391,7 +392,7 @@ class SiteDialog(QDialog):
             QMessageBox.critical(self, "Ошибка", f"Не удалось сохранить сайт: {e}")
 
 
-class SitesWidget(QWidget):
+class SitesWidget(QWidget, Updatable):
     """Виджет для управления сайтами"""
     
     def __init__(self, app_context, parent=None):
@@ -0,0 +1,23 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Модуль базового класса обновляемых виджетов для WDM_V12.
+Содержит примесь Updatable, по которой главное окно определяет вкладки,
+поддерживающие обновление данных.
+"""
+
+
+class Updatable:
+    """
+    Примесь для виджетов, которые умеют обновлять свои данные.
+    Проверка isinstance выполняется один раз при добавлении вкладки,
+    а не при каждом срабатывании таймера.
+    """
+    
+    # True, если виджет сам обновляет данные по собственному таймеру
+    self_refreshing = False
+    
+    def update_data(self):
+        """Обновляет данные виджета"""
+        pass